@@ -23,8 +23,11 @@ Quy tắc sống còn:
 
 import sys
 import os
+import asyncio
+import operator
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple, NamedTuple
 from contextlib import asynccontextmanager
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -35,12 +38,15 @@ load_dotenv()
 
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import Response, ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+import orjson
+import structlog
 import uvicorn
 
-from btc_collector.core.data_provider import create_data_provider
+from btc_collector.core.data_provider import get_data_provider
 from btc_collector.models.data_source_config import DataSourceConfig
-from btc_collector.core.whale_analyzer import QuickWhaleDetector
+from btc_collector.core.whale_analyzer import get_quick_whale_detector
 from btc_collector.database.persistence import OnChainDatabase, get_database
 from btc_collector.core.data_quality import (
     DataQualityChecker, DataState, verify_data,
@@ -49,19 +55,39 @@ from btc_collector.core.data_quality import (
 from btc_collector.utils.telegram import (
     TelegramAlerter, get_telegram_alerter, AlertLevel
 )
+from btc_collector.utils.circuit_breaker import CircuitBreaker
+
+logger = structlog.get_logger(__name__)
+
+# Pending background DB writes before new ones are dropped
+DB_QUEUE_SIZE = 1000
+
+# Seconds between chain-tip checks that invalidate the metrics snapshot
+TIP_CHECK_INTERVAL = 5
+
+# Timeframes whose /context responses are cached; others are served uncached
+CACHED_TIMEFRAMES = frozenset({"1h", "4h", "1d"})
 
 
 # ============================================================
 # Pydantic Models
 # ============================================================
 
+# Response models are built once per snapshot and never mutated
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+
 class DecisionContext(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     onchain_score: Optional[float]
     bias: str  # positive, neutral, negative
     confidence: float
 
 
 class Signals(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     smart_money_accumulation: bool
     whale_flow_dominant: bool
     network_growth: bool
@@ -69,12 +95,16 @@ class Signals(BaseModel):
 
 
 class RiskFlags(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     data_lag: bool
     signal_conflict: bool
     anomaly_detected: bool
 
 
 class Verification(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     invariants_passed: bool
     deterministic: bool
     stability_score: float
@@ -85,12 +115,16 @@ class Verification(BaseModel):
 
 
 class UsagePolicy(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     allowed: bool
     recommended_weight: float
     notes: str
 
 
 class OnChainResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     product: str = "onchain_intelligence"
     version: str = "1.0.0"
     asset: str
@@ -104,13 +138,53 @@ class OnChainResponse(BaseModel):
     usage_policy: UsagePolicy
 
 
+# Constant OnChainResponse fields, resolved once at import
+CONTEXT_STATIC_FIELDS = {
+    "product": OnChainResponse.model_fields["product"].default,
+    "version": OnChainResponse.model_fields["version"].default,
+}
+
+
 class HealthResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+    
     status: str
     timestamp: str
     data_source: str
     block_height: int
 
 
+# Signal order and score weights (distribution_risk has STRONG negative impact)
+SIGNAL_ORDER = (
+    "smart_money_accumulation",   # Strong positive
+    "whale_flow_dominant",        # Mild positive
+    "network_growth",             # Moderate positive
+    "distribution_risk",          # Strong negative
+)
+SIGNAL_WEIGHTS = (35, 10, 15, -40)
+
+# smart_money_accumulation (bit 3) + distribution_risk (bit 0) both active
+CONFLICT_MASK = 0b1001
+
+
+class QualityVerification(NamedTuple):
+    """Flattened data quality verification for one metrics snapshot."""
+    state: str  # ACTIVE, DEGRADED, BLOCKED
+    block_reason: Optional[str]
+    invariants_passed: bool
+    failed_checks: List[str]
+    confidence_multiplier: float
+    completeness: float
+    missing_fields: List[str]
+    data_age: float
+    is_stale: bool
+    source_agreement: float
+    conflicting_sources: List[str]
+    validity_score: float
+    anomalies: List[str]
+    overall_quality: float
+
+
 # ============================================================
 # Data Collector
 # ============================================================
@@ -126,64 +200,119 @@ class OnChainDataCollector:
     4. BLOCK state
     """
     
+    __slots__ = (
+        "config", "provider", "whale_detector", "quality_checker",
+        "db", "_db_queue", "_db_writer_task", "_db_breaker",
+        "_cache", "_cache_time", "_cache_iso_ts", "_cache_ttl", "_refresh_lock", "_tip_checked_at",
+        "_signals", "_score", "_response_cache", "_last_collection",
+    )
+    
     def __init__(self, db: Optional[OnChainDatabase] = None):
         self.config = DataSourceConfig()
-        self.provider = create_data_provider(self.config)
+        self.provider = get_data_provider(self.config)
         
         # Initialize whale detector with real data
-        self.whale_detector = QuickWhaleDetector(self.provider.provider)
+        self.whale_detector = get_quick_whale_detector(self.provider.provider)
         
         # Data quality checker
         self.quality_checker = DataQualityChecker()
         
-        # Database persistence
+        # Database persistence (writes are drained by a background task)
         self.db = db
+        self._db_queue: asyncio.Queue = asyncio.Queue(maxsize=DB_QUEUE_SIZE)
+        self._db_writer_task: Optional[asyncio.Task] = None
+        # Skip DB writes entirely while the database is failing
+        self._db_breaker = CircuitBreaker("database", fail_max=5, reset_timeout=30)
         
         self._cache = {}
-        self._cache_time = None
+        self._cache_time: Optional[float] = None  # time.monotonic()
+        self._cache_iso_ts: Optional[str] = None  # Snapshot timestamp for responses
         self._cache_ttl = 60  # 60 seconds cache
+        self._refresh_lock = asyncio.Lock()
+        self._tip_checked_at = 0.0  # time.monotonic() of the last chain-tip check
+        
+        # Signals and (score, bias, confidence) for the cached snapshot
+        self._signals: dict = {}
+        self._score: tuple = ()
+        
+        # Serialized /context responses, keyed by (asset, timeframe).
+        # Cleared whenever the metrics snapshot is refreshed or a new block
+        # is seen; only CACHED_TIMEFRAMES are stored.
+        self._response_cache: Dict[Tuple[str, str], bytes] = {}
         
         # Track last successful collection
         self._last_collection: Optional[datetime] = None
     
     def _is_cache_valid(self) -> bool:
-        if self._cache_time is None:
-            return False
-        return (datetime.utcnow() - self._cache_time).seconds < self._cache_ttl
+        return self._cache_time is not None and (time.monotonic() - self._cache_time) < self._cache_ttl
+    
+    @property
+    def snapshot_timestamp(self) -> Optional[str]:
+        """ISO timestamp of the current metrics snapshot."""
+        return self._cache_iso_ts
+    
+    async def _invalidate_on_new_block(self):
+        """
+        Drop the metrics snapshot once the chain tip moves past it.
+        
+        The tip is polled at most every TIP_CHECK_INTERVAL seconds, so cache
+        hits in between cost nothing.
+        """
+        now = time.monotonic()
+        if not self._is_cache_valid() or now - self._tip_checked_at < TIP_CHECK_INTERVAL:
+            return
+        self._tip_checked_at = now
+        
+        try:
+            height = await asyncio.to_thread(self.provider.get_block_height)
+        except Exception:
+            return  # Keep serving the snapshot until the TTL expires
+        
+        if height != self._cache["blockchain"]["block_height"]:
+            self._cache_time = None
+            self._response_cache.clear()
     
-    def collect_all_metrics(self, persist: bool = True) -> dict:
-        """Thu thập tất cả metrics."""
+    async def collect_all_metrics(self, persist: bool = True) -> dict:
+        """
+        Thu thập tất cả metrics.
+        
+        Independent provider calls run concurrently in worker threads, so
+        collection latency is bounded by the slowest call, not their sum.
+        """
         
         # Use cache if valid
         if self._is_cache_valid():
             return self._cache
         
-        # Collect blockchain metrics
-        height = self.provider.get_block_height()
+        # Single-flight: concurrent callers on a cache miss wait for one refresh
+        async with self._refresh_lock:
+            if not self._is_cache_valid():
+                await self._refresh_cache(persist)
         
-        blocks_data = []
-        total_txs = 0
-        total_size = 0
+        return self._cache
+    
+    async def _refresh_cache(self, persist: bool):
+        """Collect fresh metrics from the providers into the cache."""
+        # Collect blockchain, mempool and whale metrics concurrently
+        height, mempool, fees, whale_metrics = await asyncio.gather(
+            asyncio.to_thread(self.provider.get_block_height),
+            asyncio.to_thread(self.provider.provider.get_mempool_info),
+            asyncio.to_thread(self.provider.provider.get_recommended_fees),
+            # *** REAL WHALE METRICS from Mempool.space API ***
+            asyncio.to_thread(self.whale_detector.get_quick_metrics),
+        )
         
-        for h in range(height, max(height - 6, 0), -1):
-            try:
-                block = self.provider.get_block(h)
-                blocks_data.append(block)
-                total_txs += block.get('nTx', 0)
-                total_size += block.get('size', 0)
-            except Exception:
-                pass
+        blocks_data = await asyncio.to_thread(
+            self.provider.get_blocks_batch,
+            list(range(height, max(height - 6, 0), -1))
+        )
+        total_txs = sum(block.get('nTx') or 0 for block in blocks_data)
+        total_size = sum(block.get('size') or 0 for block in blocks_data)
         
         avg_block_size = total_size / len(blocks_data) if blocks_data else 0
         avg_txs_per_block = total_txs / len(blocks_data) if blocks_data else 0
         
-        # Collect mempool metrics
-        mempool = self.provider.provider.get_mempool_info()
-        fees = self.provider.provider.get_recommended_fees()
-        
-        # *** REAL WHALE METRICS from Mempool.space API ***
-        whale_metrics = self.whale_detector.get_quick_metrics()
-        
+        self._cache_iso_ts = datetime.utcnow().isoformat() + "Z"
         self._cache = {
             "blockchain": {
                 "block_height": height,
@@ -201,36 +330,107 @@ class OnChainDataCollector:
             },
             "whale": whale_metrics,
             # Add timestamp for lag detection
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": self._cache_iso_ts
         }
-        self._cache_time = datetime.utcnow()
+        # Signals and score are pure functions of the snapshot; evaluate once
+        self._signals = self.calculate_signals(self._cache)
+        self._score = self.calculate_score(self._signals)
+        
+        self._cache_time = time.monotonic()
         self._last_collection = datetime.utcnow()
+        self._response_cache.clear()
         
-        # Persist to database
+        # Persist to database off the request path
         if persist and self.db:
+            self.enqueue_db_write(self.db.save_metrics, self._cache)
+    
+    def enqueue_db_write(self, func, *args):
+        """Queue a blocking DB write for the background writer."""
+        if self._db_writer_task is None or not self._db_breaker.allow():
+            return
+        try:
+            self._db_queue.put_nowait((func, args))
+        except asyncio.QueueFull:
+            pass  # Drop the write rather than block the request
+    
+    def start_db_writer(self):
+        """Start the background DB writer task."""
+        if self.db and self._db_writer_task is None:
+            self._db_writer_task = asyncio.create_task(self._db_writer())
+    
+    async def stop_db_writer(self):
+        """Drain pending writes and stop the background DB writer."""
+        if self._db_writer_task is None:
+            return
+        await self._db_queue.join()
+        self._db_writer_task.cancel()
+        self._db_writer_task = None
+    
+    async def _db_writer(self):
+        """Drain the DB write queue, running sync DB calls in a worker thread."""
+        while True:
+            func, args = await self._db_queue.get()
             try:
-                self.db.save_metrics(self._cache)
+                if self._db_breaker.allow():
+                    # Persistence methods report DB errors by returning False
+                    if await asyncio.to_thread(func, *args) is False:
+                        self._db_breaker.record_failure()
+                    else:
+                        self._db_breaker.record_success()
             except Exception as e:
-                pass  # Don't fail if DB is unavailable
+                # Driver, SQLAlchemy and pool errors all mean the write failed
+                self._db_breaker.record_failure(e)
+                logger.warning("DB write failed", write=func.__name__, error=str(e))
+            finally:
+                self._db_queue.task_done()
+    
+    async def collect_signals(self) -> Tuple[dict, dict, tuple]:
+        """
+        Thu thập metrics kèm signals và score của snapshot hiện tại.
         
-        return self._cache
+        Returns:
+            (metrics, signals, (score, bias, confidence))
+        """
+        metrics = await self.collect_all_metrics()
+        return metrics, self._signals, self._score
     
-    def verify_data_quality(self, metrics: dict, signals: dict) -> dict:
+    async def get_cached_response(self, asset: str, timeframe: str) -> Optional[bytes]:
+        """Get serialized context response if the metrics snapshot is still fresh."""
+        await self._invalidate_on_new_block()
+        if not self._is_cache_valid():
+            return None
+        return self._response_cache.get((asset, timeframe))
+    
+    def cache_response(self, asset: str, timeframe: str, body: bytes):
+        """Store serialized context response for the current metrics snapshot."""
+        if timeframe in CACHED_TIMEFRAMES:
+            self._response_cache[(asset, timeframe)] = body
+    
+    def verify_data_quality(self, metrics: dict, signals: dict) -> "QualityVerification":
         """
         Verify data quality with completeness, lag detection, anomalies.
         
         Returns verification result with state (ACTIVE/DEGRADED/BLOCKED)
         """
         verification = verify_data(metrics, signals)
-        
-        return {
-            "state": verification.state.value,
-            "block_reason": verification.block_reason,
-            "invariants_passed": verification.invariants_passed,
-            "failed_checks": verification.failed_invariants,
-            "quality": verification.quality.to_dict(),
-            "confidence_multiplier": verification.confidence_multiplier
-        }
+        quality = verification.quality
+        
+        return QualityVerification(
+            state=verification.state.value,
+            block_reason=verification.block_reason,
+            invariants_passed=verification.invariants_passed,
+            failed_checks=verification.failed_invariants,
+            confidence_multiplier=verification.confidence_multiplier,
+            completeness=round(quality.completeness_score, 4),
+            missing_fields=quality.missing_fields,
+            data_age=round(quality.data_age_seconds, 1),
+            is_stale=quality.is_stale,
+            source_agreement=round(quality.source_agreement, 4),
+            conflicting_sources=quality.conflicting_sources,
+            validity_score=round(quality.validity_score, 4),
+            anomalies=quality.anomalies_detected,
+            overall_quality=round(quality.overall_quality, 4)
+        )
     
     def calculate_signals(self, metrics: dict) -> dict:
         """Tính toán signals."""
@@ -262,19 +462,10 @@ class OnChainDataCollector:
     
     def calculate_score(self, signals: dict) -> tuple:
         """Tính OnChain Score."""
-        # Weights: distribution_risk has STRONG negative impact
-        weights = {
-            "smart_money_accumulation": 35,   # Strong positive
-            "whale_flow_dominant": 10,        # Mild positive
-            "network_growth": 15,             # Moderate positive
-            "distribution_risk": -40          # Strong negative
-        }
-        
-        score = 50
-        for signal, value in signals.items():
-            if value:
-                score += weights.get(signal, 0)
+        flags = [bool(signals.get(name)) for name in SIGNAL_ORDER]
         
+        # Dot product of signal flags with the fixed weight vector
+        score = 50 + sum(map(operator.mul, flags, SIGNAL_WEIGHTS))
         score = max(0, min(100, score))
         
         if score >= 65:
@@ -284,8 +475,10 @@ class OnChainDataCollector:
         else:
             bias = "neutral"
         
-        active_signals = sum(1 for v in signals.values() if v)
-        conflicting = signals.get('distribution_risk') and signals.get('smart_money_accumulation')
+        # Pack signals into bits: smart_money | whale_flow | network | distribution
+        bits = flags[0] << 3 | flags[1] << 2 | flags[2] << 1 | flags[3]
+        active_signals = bits.bit_count()
+        conflicting = (bits & CONFLICT_MASK) == CONFLICT_MASK
         
         if conflicting:
             confidence = 0.5
@@ -325,6 +518,7 @@ async def lifespan(app: FastAPI):
     
     # Initialize collector with database
     collector = OnChainDataCollector(db=db)
+    collector.start_db_writer()
     print(f"📡 Data Source: {collector.config.data_source}")
     
     # Initialize Telegram alerter
@@ -353,6 +547,7 @@ async def lifespan(app: FastAPI):
             "Server is stopping"
         )
         await telegram_alerter.close()
+    await collector.stop_db_writer()
     if db:
         db.close()
 
@@ -361,7 +556,8 @@ app = FastAPI(
     title="OnChain Intelligence API",
     description="On-chain signals for BotTrading system",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -374,6 +570,24 @@ app.add_middleware(
 )
 
 
+# ============================================================
+# Helpers
+# ============================================================
+
+async def fetch_statistics(hours: int) -> Tuple[dict, dict, dict]:
+    """
+    Run the independent statistics queries concurrently.
+    
+    Returns:
+        (score_statistics, bias_distribution, whale_activity)
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(db.get_score_statistics, hours),
+        asyncio.to_thread(db.get_bias_distribution, hours),
+        asyncio.to_thread(db.get_whale_activity_summary, hours),
+    )
+
+
 # ============================================================
 # Endpoints
 # ============================================================
@@ -412,27 +626,26 @@ async def get_onchain_context(
     if asset.upper() != "BTC":
         raise HTTPException(status_code=400, detail="Only BTC supported")
     
+    # Serve from cache while the metrics snapshot is unchanged
+    cached = await collector.get_cached_response(asset.upper(), timeframe)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
     try:
-        # Collect metrics
-        metrics = collector.collect_all_metrics()
-        
-        # Calculate signals
-        signals = collector.calculate_signals(metrics)
+        # Collect metrics with signals precomputed for this snapshot
+        metrics, signals, scored = await collector.collect_signals()
         
         # *** CRITICAL: Verify data quality ***
-        verification_result = collector.verify_data_quality(metrics, signals)
-        quality = verification_result.get('quality', {})
-        
-        # Get state from verification
-        state = verification_result.get('state', 'ACTIVE')
-        block_reason = verification_result.get('block_reason')
-        invariants_passed = verification_result.get('invariants_passed', True)
-        failed_checks = verification_result.get('failed_checks', [])
+        verification = collector.verify_data_quality(metrics, signals)
         
-        # Data quality metrics
-        completeness = quality.get('completeness_score', 0.95)
-        data_age = quality.get('data_age_seconds', 0)
-        is_stale = quality.get('is_stale', False)
+        # Get state and data quality metrics from verification
+        state = verification.state
+        block_reason = verification.block_reason
+        invariants_passed = verification.invariants_passed
+        failed_checks = verification.failed_checks
+        completeness = verification.completeness
+        data_age = verification.data_age
+        is_stale = verification.is_stale
         
         # Calculate score (set to None if BLOCKED)
         if state == "BLOCKED":
@@ -440,9 +653,9 @@ async def get_onchain_context(
             bias = "neutral"
             confidence = 0.0
         else:
-            score, bias, confidence = collector.calculate_score(signals)
+            score, bias, confidence = scored
             # Apply confidence multiplier from data quality
-            confidence *= verification_result.get('confidence_multiplier', 1.0)
+            confidence *= verification.confidence_multiplier
         
         # Lag detection
         data_lag = is_stale or data_age > (MAX_DATA_AGE_HOURS * 3600)
@@ -452,45 +665,50 @@ async def get_onchain_context(
             signals.get('distribution_risk') and signals.get('smart_money_accumulation')
         )
         
-        # Persist signals to database
+        # Persist signals to database (background)
         if db:
-            try:
-                db.save_signals(signals, score, bias, confidence, state, asset.upper(), timeframe)
-            except Exception:
-                pass  # Don't fail if DB unavailable
-        
-        # Build response
-        return OnChainResponse(
-            asset=asset.upper(),
-            timeframe=timeframe,
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            state=state,
-            decision_context=DecisionContext(
-                onchain_score=score,
-                bias=bias,
-                confidence=round(confidence, 2)
-            ),
-            signals=Signals(**signals),
-            risk_flags=RiskFlags(
-                data_lag=data_lag,
-                signal_conflict=signal_conflict,
-                anomaly_detected=len(quality.get('anomalies_detected', [])) > 0
-            ),
-            verification=Verification(
-                invariants_passed=invariants_passed,
-                deterministic=not is_stale,
-                stability_score=quality.get('overall_quality', 0.9),
-                data_completeness=completeness,
-                data_age_seconds=data_age,
-                is_stale=is_stale,
-                failed_checks=failed_checks
-            ),
-            usage_policy=UsagePolicy(
-                allowed=state != "BLOCKED",
-                recommended_weight=0.3 if state == "ACTIVE" else (0.15 if state == "DEGRADED" else 0.0),
-                notes=f"State: {state}. {block_reason if block_reason else 'Use as context only.' if state != 'BLOCKED' else 'Data blocked.'}"
+            collector.enqueue_db_write(
+                db.save_signals, signals, score, bias, confidence, state, asset.upper(), timeframe
             )
-        )
+        
+        # Build response. OnChainResponse documents the schema; the payload
+        # is filled directly so the hot path skips model validation.
+        payload = {
+            **CONTEXT_STATIC_FIELDS,
+            "asset": asset.upper(),
+            "timeframe": timeframe,
+            "timestamp": collector.snapshot_timestamp,
+            "state": state,
+            "decision_context": {
+                "onchain_score": float(score) if score is not None else None,
+                "bias": bias,
+                "confidence": round(confidence, 2)
+            },
+            "signals": signals,
+            "risk_flags": {
+                "data_lag": bool(data_lag),
+                "signal_conflict": bool(signal_conflict),
+                "anomaly_detected": len(verification.anomalies) > 0
+            },
+            "verification": {
+                "invariants_passed": invariants_passed,
+                "deterministic": not is_stale,
+                "stability_score": float(verification.overall_quality),
+                "data_completeness": float(completeness),
+                "data_age_seconds": float(data_age),
+                "is_stale": is_stale,
+                "failed_checks": failed_checks
+            },
+            "usage_policy": {
+                "allowed": state != "BLOCKED",
+                "recommended_weight": 0.3 if state == "ACTIVE" else (0.15 if state == "DEGRADED" else 0.0),
+                "notes": f"State: {state}. {block_reason if block_reason else 'Use as context only.' if state != 'BLOCKED' else 'Data blocked.'}"
+            }
+        }
+        
+        body = orjson.dumps(payload)
+        collector.cache_response(asset.upper(), timeframe, body)
+        return Response(content=body, media_type="application/json")
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -499,15 +717,13 @@ async def get_onchain_context(
 @app.get("/api/v1/onchain/metrics")
 async def get_detailed_metrics():
     """Get detailed on-chain metrics (for debugging)."""
-    return collector.collect_all_metrics()
+    return await collector.collect_all_metrics()
 
 
 @app.get("/api/v1/onchain/signals")
 async def get_signals():
     """Get current signals."""
-    metrics = collector.collect_all_metrics()
-    signals = collector.calculate_signals(metrics)
-    score, bias, confidence = collector.calculate_score(signals)
+    _, signals, (score, bias, confidence) = await collector.collect_signals()
     
     return {
         "signals": signals,
@@ -524,7 +740,7 @@ async def get_whale_metrics():
     
     Returns real-time whale transaction analysis from recent blocks.
     """
-    metrics = collector.collect_all_metrics()
+    metrics = await collector.collect_all_metrics()
     whale = metrics.get('whale', {})
     
     # Determine whale behavior
@@ -540,7 +756,7 @@ async def get_whale_metrics():
         description = "Balanced whale activity"
     
     return {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": collector.snapshot_timestamp,
         "behavior": behavior,
         "description": description,
         "metrics": {
@@ -581,45 +797,42 @@ async def get_data_quality():
     - is_stale: True if data is too old
     - anomalies: List of detected issues
     """
-    metrics = collector.collect_all_metrics()
-    signals = collector.calculate_signals(metrics)
+    metrics, signals, _ = await collector.collect_signals()
     verification = collector.verify_data_quality(metrics, signals)
     
-    quality = verification.get('quality', {})
-    
     return {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": collector.snapshot_timestamp,
         
         # State determination
-        "state": verification.get('state'),
-        "block_reason": verification.get('block_reason'),
+        "state": verification.state,
+        "block_reason": verification.block_reason,
         
         # Completeness score (Quy tắc #2)
-        "completeness_score": quality.get('completeness_score'),
-        "missing_fields": quality.get('missing_fields', []),
+        "completeness_score": verification.completeness,
+        "missing_fields": verification.missing_fields,
         
         # Lag detection (Quy tắc #3)
-        "data_age_seconds": quality.get('data_age_seconds'),
-        "is_stale": quality.get('is_stale'),
+        "data_age_seconds": verification.data_age,
+        "is_stale": verification.is_stale,
         "max_age_allowed_hours": MAX_DATA_AGE_HOURS,
         
         # Data consistency
-        "source_agreement": quality.get('source_agreement', 1.0),
-        "conflicting_sources": quality.get('conflicting_sources', []),
+        "source_agreement": verification.source_agreement,
+        "conflicting_sources": verification.conflicting_sources,
         
         # Anomaly detection
-        "validity_score": quality.get('validity_score'),
-        "anomalies_detected": quality.get('anomalies_detected', []),
+        "validity_score": verification.validity_score,
+        "anomalies_detected": verification.anomalies,
         
         # Overall quality
-        "overall_quality": quality.get('overall_quality'),
+        "overall_quality": verification.overall_quality,
         
         # Invariants check
-        "invariants_passed": verification.get('invariants_passed'),
-        "failed_checks": verification.get('failed_checks', []),
+        "invariants_passed": verification.invariants_passed,
+        "failed_checks": verification.failed_checks,
         
         # Confidence adjustment
-        "confidence_multiplier": verification.get('confidence_multiplier'),
+        "confidence_multiplier": verification.confidence_multiplier,
         
         # Thresholds
         "thresholds": {
@@ -645,12 +858,9 @@ async def send_telegram_report():
     
     try:
         # Collect current data
-        metrics = collector.collect_all_metrics()
-        signals = collector.calculate_signals(metrics)
-        verification_result = collector.verify_data_quality(metrics, signals)
-        
-        score, bias, confidence = collector.calculate_score(signals)
-        state = verification_result.get('state', 'ACTIVE')
+        metrics, signals, (score, bias, confidence) = await collector.collect_signals()
+        verification = collector.verify_data_quality(metrics, signals)
+        state = verification.state
         
         # Build context for report
         report_data = {
@@ -658,7 +868,7 @@ async def send_telegram_report():
             "decision_context": {
                 "onchain_score": score,
                 "bias": bias,
-                "confidence": confidence * verification_result.get('confidence_multiplier', 1.0)
+                "confidence": confidence * verification.confidence_multiplier
             },
             "signals": {
                 "active": [k for k, v in signals.items() if v]
@@ -667,9 +877,9 @@ async def send_telegram_report():
                 "whale": metrics.get('whale', {})
             },
             "verification": {
-                "data_completeness": verification_result.get('quality', {}).get('completeness_score', 1.0),
-                "data_age_seconds": verification_result.get('quality', {}).get('data_age_seconds', 0),
-                "invariants_passed": verification_result.get('invariants_passed', True)
+                "data_completeness": verification.completeness,
+                "data_age_seconds": verification.data_age,
+                "invariants_passed": verification.invariants_passed
             },
             "usage_policy": {
                 "allowed": state != "BLOCKED",
@@ -682,7 +892,7 @@ async def send_telegram_report():
         return {
             "success": success,
             "message": "Report sent to Telegram" if success else "Failed to send report",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": collector.snapshot_timestamp
         }
         
     except Exception as e:
@@ -698,7 +908,7 @@ async def send_whale_alert():
         raise HTTPException(status_code=503, detail="Telegram not configured")
     
     try:
-        metrics = collector.collect_all_metrics()
+        metrics = await collector.collect_all_metrics()
         whale = metrics.get('whale', {})
         
         net_flow = whale.get('net_whale_flow', 0)
@@ -749,9 +959,7 @@ async def send_daily_summary():
         raise HTTPException(status_code=503, detail="Database not configured")
     
     try:
-        score_stats = db.get_score_statistics(24)
-        bias_dist = db.get_bias_distribution(24)
-        whale_summary = db.get_whale_activity_summary(24)
+        score_stats, bias_dist, whale_summary = await fetch_statistics(24)
         
         stats = {
             "score_statistics": score_stats,
@@ -857,9 +1065,7 @@ async def get_statistics(hours: int = Query(24, ge=1, le=168)):
         raise HTTPException(status_code=503, detail="Database not configured")
     
     try:
-        score_stats = db.get_score_statistics(hours)
-        bias_dist = db.get_bias_distribution(hours)
-        whale_summary = db.get_whale_activity_summary(hours)
+        score_stats, bias_dist, whale_summary = await fetch_statistics(hours)
         
         return {
             "period_hours": hours,
@@ -938,5 +1144,41 @@ if __name__ == "__main__":
     # Load from environment
     host = os.getenv('ONCHAIN_API_HOST', '0.0.0.0')
     port = int(os.getenv('ONCHAIN_API_PORT', '8500'))
+    workers = int(os.getenv('ONCHAIN_API_WORKERS', '1'))
+    access_log = os.getenv('ONCHAIN_API_ACCESS_LOG', 'true').lower() == 'true'
+    server = os.getenv('ONCHAIN_API_SERVER', 'uvicorn').strip().lower()
+    
+    if server not in ("uvicorn", "granian"):
+        print(f"⚠️ Unknown ONCHAIN_API_SERVER '{server}', falling back to uvicorn")
+        server = "uvicorn"
     
-    uvicorn.run(app, host=host, port=port)
+    if server == "granian":
+        # Rust HTTP server (optional: pip install granian)
+        try:
+            from granian import Granian
+            from granian.constants import Interfaces
+        except ImportError:
+            print("⚠️ granian not installed, falling back to uvicorn")
+            server = "uvicorn"
+        else:
+            Granian(
+                "api_server:app",
+                address=host,
+                port=port,
+                interface=Interfaces.ASGI,
+                workers=workers,
+                log_access=access_log
+            ).serve()
+    
+    if server == "uvicorn":
+        # uvloop + httptools ship with uvicorn[standard]; multiple workers
+        # require the app to be passed as an import string
+        uvicorn.run(
+            "api_server:app" if workers > 1 else app,
+            host=host,
+            port=port,
+            workers=workers,
+            loop="uvloop",
+            http="httptools",
+            access_log=access_log
+        )
@@ -6,14 +6,21 @@ in a BotTrading system with proper safety checks and risk management.
 """
 
 import asyncio
+import itertools
 import logging
-from datetime import datetime, timedelta
+import operator
+import random
+import time
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional, Any, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
-import httpx
+import aiohttp
+import orjson
 import structlog
+from structlog.contextvars import bound_contextvars
 
 logger = structlog.get_logger(__name__)
 
@@ -25,6 +32,14 @@ class SignalStatus(str, Enum):
     BLOCKED = "BLOCKED"
 
 
+# Direct value -> member lookup for parsing API responses; unknown
+# statuses are treated as BLOCKED
+_STATUS_MAP: Dict[str, SignalStatus] = {status.value: status for status in SignalStatus}
+
+# Score adjustment applied to the normalized OnChain score per signal bias
+_BIAS_ADJ: Dict[str, float] = {"positive": 0.1, "negative": -0.1}
+
+
 class TradingDecision(str, Enum):
     """Trading decision outcomes."""
     BUY = "BUY"
@@ -33,7 +48,7 @@ class TradingDecision(str, Enum):
     NO_ACTION = "NO_ACTION"
 
 
-@dataclass
+@dataclass(slots=True)
 class OnChainSignalInput:
     """OnChain signal input for trading decision."""
     
@@ -67,7 +82,7 @@ class OnChainSignalInput:
             self.risk_flags = []
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignalWeights:
     """Weights for different signal sources."""
     
@@ -85,18 +100,89 @@ class TradingSignalWeights:
 class OnChainAPIClient:
     """Safe client for OnChain Intelligence API."""
     
-    def __init__(self, base_url: str, api_key: str, timeout: int = 30):
+    # Adaptive retry scheduling: per-endpoint EWMA of throttling pressure
+    CONGESTION_ALPHA = 0.2          # EWMA smoothing factor
+    RATE_LIMIT_LOW_WATERMARK = 5    # X-RateLimit-Remaining considered "almost throttled"
+    MAX_BACKOFF_SECONDS = 300       # Max 5 minute wait
+    
+    # Signal cache: signals are recalculated server-side far less often
+    # than a bot polls, so reuse them within a short validity window
+    SIGNAL_CACHE_TTL = 30.0         # seconds
+    NEGATIVE_CACHE_TTL = 1.0        # seconds, for failed requests
+    
+    # Safety rules: (attribute, bands). Bands are checked in order and the
+    # first match applies: (compare, threshold, weight_multiplier, risk_flag).
+    # A multiplier of None marks the signal as unusable.
+    _SAFETY_RULES = (
+        # 1. Status checks
+        ("status", (
+            (operator.eq, SignalStatus.BLOCKED, None, "signal_blocked"),
+            (operator.eq, SignalStatus.DEGRADED, 0.7, "signal_degraded"),  # 30% penalty
+        )),
+        # 2. Confidence checks
+        ("confidence", (
+            (operator.lt, 0.3, None, "confidence_too_low"),
+            (operator.lt, 0.6, 0.8, "confidence_low"),  # 20% penalty for low confidence
+            (operator.gt, 0.8, 1.1, None),              # 10% bonus for high confidence
+        )),
+        # 3. Data quality checks
+        ("data_completeness", (
+            (operator.lt, 0.5, None, "data_completeness_critical"),
+            (operator.lt, 0.8, 0.9, "data_completeness_low"),  # 10% penalty
+        )),
+        # 4. Verification checks
+        ("verification_passed", (
+            (operator.eq, False, None, "verification_failed"),
+        )),
+        # 5. Data freshness checks
+        ("data_age_seconds", (
+            (operator.gt, 7200, None, "data_too_stale"),  # 2 hours
+            (operator.gt, 3600, 0.8, "data_stale"),       # 1 hour, 20% penalty
+        )),
+        # 6. Fallback mode checks
+        ("fallback_mode", (
+            (operator.eq, True, 0.6, "fallback_mode"),  # 40% penalty
+        )),
+        # 7. Signal conflict checks
+        ("conflicting_signals", (
+            (operator.gt, 2, 0.7, "high_signal_conflicts"),  # 30% penalty
+        )),
+        # 8. Missing score check
+        ("onchain_score", (
+            (operator.is_, None, None, "missing_score"),
+        )),
+    )
+    
+    def __init__(self, base_url: str, api_key: str, timeout: int = 30,
+                 max_connections: int = 100, max_connections_per_host: int = 20,
+                 keepalive_expiry: float = 75.0, max_concurrent_requests: int = 8):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
         self.logger = logger.bind(component="onchain_api_client")
         
-        # Request session with retry logic
-        self.client = httpx.AsyncClient(
-            timeout=timeout,
-            headers={"X-API-Key": api_key},
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+        # Request session with retry logic (shared keep-alive connection pool).
+        # Idle connections are kept for `keepalive_expiry` seconds so that
+        # polling every decision cycle reuses the same TCP/TLS connection
+        # instead of renegotiating the handshake on each request. aiohttp
+        # sessions need a running event loop, so it is created on first use.
+        self._pool_limits = dict(
+            limit=max_connections,
+            limit_per_host=max_connections_per_host,
+            keepalive_timeout=keepalive_expiry,
+            ttl_dns_cache=300
         )
+        self._client: Optional[aiohttp.ClientSession] = None
+        
+        # Client-side admission control: bursts of callers queue here instead
+        # of saturating the connection pool and triggering rate limits
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
+        
+        # Congestion estimate (0 = idle, 1 = always throttled) per endpoint
+        self._congestion: Dict[str, float] = {}
+        
+        # (asset, timeframe, include_details, min_confidence) -> (expires_at, signal)
+        self._cache: Dict[Tuple, Tuple[float, Optional[OnChainSignalInput]]] = {}
     
     async def get_signal(self, asset: str = "BTC", timeframe: str = "1d",
                         include_details: bool = True,
@@ -114,17 +200,80 @@ class OnChainAPIClient:
             OnChainSignalInput or None if request fails
         """
         
-        self.logger.info("Requesting OnChain signal",
-                        asset=asset,
-                        timeframe=timeframe,
-                        min_confidence=min_confidence)
+        key = (asset, timeframe, include_details, min_confidence)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        self.logger.debug("Requesting OnChain signal",
+                         asset=asset,
+                         timeframe=timeframe,
+                         min_confidence=min_confidence)
+        
+        signal_input = await self._fetch_signal(asset, timeframe, include_details, min_confidence)
+        
+        if signal_input is None:
+            # Absorb bursts of callers while the API is failing
+            self._cache[key] = (time.monotonic() + self.NEGATIVE_CACHE_TTL, None)
+        elif signal_input.status == SignalStatus.BLOCKED:
+            # Never serve a blocked signal from cache
+            self._cache.pop(key, None)
+        else:
+            ttl = self._signal_cache_ttl(signal_input)
+            if ttl > 0:
+                self._cache[key] = (time.monotonic() + ttl, signal_input)
+            else:
+                self._cache.pop(key, None)
+        
+        return signal_input
+    
+    def _signal_cache_ttl(self, signal: OnChainSignalInput) -> float:
+        """
+        Cache lifetime for a signal: SIGNAL_CACHE_TTL, shortened so a cached
+        signal never ages past the next data-freshness band of the safety rules.
+        """
+        
+        freshness_bands = dict(self._SAFETY_RULES)["data_age_seconds"]
+        budget = min(
+            (threshold - signal.data_age_seconds
+             for _, threshold, _, _ in freshness_bands
+             if threshold >= signal.data_age_seconds),
+            default=0
+        )
+        return min(self.SIGNAL_CACHE_TTL, budget)
+    
+    async def get_signals_batch(self, assets: List[str], timeframe: str = "1d",
+                                include_details: bool = True,
+                                min_confidence: Optional[float] = None) -> List[Optional[OnChainSignalInput]]:
+        """
+        Get OnChain signals for several assets concurrently.
+        
+        Args:
+            assets: Asset symbols
+            timeframe: Signal timeframe
+            include_details: Include detailed signal breakdown
+            min_confidence: Minimum confidence threshold
+            
+        Returns:
+            One OnChainSignalInput (or None if its request failed) per asset,
+            in the order of `assets`
+        """
+        
+        return await asyncio.gather(*(
+            self.get_signal(asset, timeframe, include_details, min_confidence)
+            for asset in assets
+        ))
+    
+    async def _fetch_signal(self, asset: str, timeframe: str, include_details: bool,
+                            min_confidence: Optional[float]) -> Optional[OnChainSignalInput]:
+        """Request and validate a signal from the API."""
         
         try:
             # Build request parameters
             params = {
                 "asset": asset,
                 "timeframe": timeframe,
-                "include_details": include_details
+                "include_details": "true" if include_details else "false"
             }
             
             if min_confidence is not None:
@@ -146,11 +295,11 @@ class OnChainAPIClient:
             # Apply safety checks
             signal_input = self._apply_safety_checks(signal_input)
             
-            self.logger.info("OnChain signal received",
-                           status=signal_input.status.value,
-                           confidence=signal_input.confidence,
-                           usable=signal_input.usable,
-                           weight=signal_input.weight)
+            self.logger.debug("OnChain signal received",
+                            status=signal_input.status.value,
+                            confidence=signal_input.confidence,
+                            usable=signal_input.usable,
+                            weight=signal_input.weight)
             
             return signal_input
             
@@ -161,46 +310,87 @@ class OnChainAPIClient:
     async def _make_request_with_retry(self, method: str, url: str, 
                                      params: Optional[Dict] = None,
                                      max_retries: int = 3) -> Optional[Dict]:
-        """Make HTTP request with retry logic."""
+        """Make HTTP request with adaptive retry scheduling."""
         
         for attempt in range(max_retries):
+            rate_limit_delay = None
             try:
-                response = await self.client.request(method, url, params=params)
+                async with self._request_slots:
+                    async with self._session().request(method, url, params=params) as response:
+                        self._observe_congestion(url, response)
+                        
+                        if response.status == 200:
+                            return orjson.loads(await response.read())
+                        elif response.status == 202:
+                            # Degraded signal - still usable
+                            return orjson.loads(await response.read())
+                        elif response.status == 503:
+                            # Service unavailable - blocked signal
+                            data = orjson.loads(await response.read())
+                            self.logger.warning("Signal blocked by API", reason=data.get("error", {}).get("message"))
+                            return data
+                        elif response.status == 429:
+                            # Rate limited
+                            retry_after = int(response.headers.get("Retry-After", 60))
+                            rate_limit_delay = self._backoff_delay(url, attempt, retry_after)
+                            self.logger.warning("Rate limited", retry_after=retry_after, delay=round(rate_limit_delay, 3))
+                        else:
+                            self.logger.warning("API request failed", 
+                                              status_code=response.status,
+                                              response=await response.text())
                 
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 202:
-                    # Degraded signal - still usable
-                    return response.json()
-                elif response.status_code == 503:
-                    # Service unavailable - blocked signal
-                    data = response.json()
-                    self.logger.warning("Signal blocked by API", reason=data.get("error", {}).get("message"))
-                    return data
-                elif response.status_code == 429:
-                    # Rate limited
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    self.logger.warning("Rate limited", retry_after=retry_after)
-                    await asyncio.sleep(min(retry_after, 300))  # Max 5 minute wait
+                if rate_limit_delay is not None:
+                    # Wait after releasing the connection and request slot
+                    await asyncio.sleep(rate_limit_delay)
                     continue
-                else:
-                    self.logger.warning("API request failed", 
-                                      status_code=response.status_code,
-                                      response=response.text)
                     
-            except httpx.TimeoutException:
+            except asyncio.TimeoutError:
                 self.logger.warning("API request timeout", attempt=attempt + 1)
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    await asyncio.sleep(self._backoff_delay(url, attempt))
                     continue
             except Exception as e:
                 self.logger.error("API request error", error=str(e), attempt=attempt + 1)
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(self._backoff_delay(url, attempt))
                     continue
         
         return None
     
+    def _observe_congestion(self, url: str, response: aiohttp.ClientResponse):
+        """Update the endpoint congestion EWMA from a response."""
+        
+        if response.status == 429:
+            sample = 1.0
+        else:
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            if remaining is not None and remaining.isdigit():
+                # Approaching the limit counts as partial congestion
+                sample = 0.5 if int(remaining) <= self.RATE_LIMIT_LOW_WATERMARK else 0.0
+            else:
+                sample = 0.0
+        
+        previous = self._congestion.get(url, 0.0)
+        self._congestion[url] = previous + self.CONGESTION_ALPHA * (sample - previous)
+    
+    def _backoff_delay(self, url: str, attempt: int,
+                       retry_after: Optional[float] = None) -> float:
+        """
+        Compute retry delay scaled by observed congestion.
+        
+        The delay is randomized so that several bots throttled by the same
+        API do not retry in lockstep. A server-supplied Retry-After is
+        treated as a lower bound.
+        """
+        
+        congestion = self._congestion.get(url, 0.0)
+        delay = (2 ** attempt) * (1.0 + congestion) * random.uniform(0.5, 1.5)
+        
+        if retry_after is not None:
+            delay += retry_after
+        
+        return min(delay, self.MAX_BACKOFF_SECONDS)
+    
     def _parse_signal_response(self, response_data: Dict) -> OnChainSignalInput:
         """Parse API response into OnChainSignalInput."""
         
@@ -227,17 +417,30 @@ class OnChainAPIClient:
         verification = response_data.get("verification", {})
         metadata = response_data.get("metadata", {})
         
+        # Prefer the epoch timestamp when the API provides it; otherwise
+        # parse ISO 8601 (Python 3.11+ accepts the "Z" suffix directly)
+        timestamp_unix = response_data.get("timestamp_unix")
+        if timestamp_unix is not None:
+            timestamp = datetime.fromtimestamp(timestamp_unix, tz=timezone.utc)
+        else:
+            timestamp = datetime.fromisoformat(response_data["timestamp"])
+        
+        # Use the server-side count when provided
+        active_signals = response_data.get("active_signals_count")
+        if active_signals is None:
+            active_signals = sum(1 for s in response_data.get("signals", {}).values() if s)
+        
         return OnChainSignalInput(
             asset=response_data["asset"],
             timeframe=response_data["timeframe"],
-            timestamp=datetime.fromisoformat(response_data["timestamp"].replace("Z", "+00:00")),
+            timestamp=timestamp,
             onchain_score=response_data.get("onchain_score"),
             confidence=response_data["confidence"],
             bias=response_data["bias"],
-            status=SignalStatus(response_data["status"]),
+            status=_STATUS_MAP.get(response_data["status"], SignalStatus.BLOCKED),
             data_completeness=verification.get("data_completeness", 0.0),
             verification_passed=verification.get("invariants_passed", False),
-            active_signals=len([s for s in response_data.get("signals", {}).values() if s]),
+            active_signals=active_signals,
             conflicting_signals=0,  # Would be calculated from signal analysis
             data_age_seconds=metadata.get("data_age_seconds", 0),
             calculation_time_ms=metadata.get("calculation_time_ms", 0),
@@ -247,78 +450,58 @@ class OnChainAPIClient:
     def _apply_safety_checks(self, signal: OnChainSignalInput) -> OnChainSignalInput:
         """Apply comprehensive safety checks to signal."""
         
+        # Update signal with safety assessment
+        signal.usable, signal.weight, signal.risk_flags = self._assess_safety(signal)
+        
+        return signal
+    
+    @classmethod
+    def _assess_safety(cls, signal: OnChainSignalInput) -> Tuple[bool, float, List[str]]:
+        """Evaluate the safety rules for a signal without modifying it."""
+        
         risk_flags = []
         usable = True
         base_weight = 0.25  # 25% base weight for onchain signals
         
-        # 1. Status checks
-        if signal.status == SignalStatus.BLOCKED:
-            usable = False
-            risk_flags.append("signal_blocked")
-            base_weight = 0.0
-        elif signal.status == SignalStatus.DEGRADED:
-            risk_flags.append("signal_degraded")
-            base_weight *= 0.7  # 30% penalty for degraded signals
-        
-        # 2. Confidence checks
-        if signal.confidence < 0.3:
-            usable = False
-            risk_flags.append("confidence_too_low")
-        elif signal.confidence < 0.6:
-            risk_flags.append("confidence_low")
-            base_weight *= 0.8  # 20% penalty for low confidence
-        elif signal.confidence > 0.8:
-            base_weight *= 1.1  # 10% bonus for high confidence
-        
-        # 3. Data quality checks
-        if signal.data_completeness < 0.5:
-            usable = False
-            risk_flags.append("data_completeness_critical")
-        elif signal.data_completeness < 0.8:
-            risk_flags.append("data_completeness_low")
-            base_weight *= 0.9  # 10% penalty for low data completeness
-        
-        # 4. Verification checks
-        if not signal.verification_passed:
-            usable = False
-            risk_flags.append("verification_failed")
-        
-        # 5. Data freshness checks
-        if signal.data_age_seconds > 3600:  # 1 hour
-            risk_flags.append("data_stale")
-            base_weight *= 0.8  # 20% penalty for stale data
-        elif signal.data_age_seconds > 7200:  # 2 hours
-            usable = False
-            risk_flags.append("data_too_stale")
-        
-        # 6. Fallback mode checks
-        if signal.fallback_mode:
-            risk_flags.append("fallback_mode")
-            base_weight *= 0.6  # 40% penalty for fallback signals
-        
-        # 7. Signal conflict checks
-        if signal.conflicting_signals > 2:
-            risk_flags.append("high_signal_conflicts")
-            base_weight *= 0.7  # 30% penalty for conflicting signals
-        
-        # 8. Missing score check
-        if signal.onchain_score is None:
-            usable = False
-            risk_flags.append("missing_score")
+        for attr, bands in cls._SAFETY_RULES:
+            value = getattr(signal, attr)
+            for compare, threshold, multiplier, flag in bands:
+                if compare(value, threshold):
+                    if multiplier is None:
+                        usable = False
+                    else:
+                        base_weight *= multiplier
+                    if flag:
+                        risk_flags.append(flag)
+                    break
         
         # Final weight calculation
         final_weight = min(base_weight, 0.25) if usable else 0.0
         
-        # Update signal with safety assessment
-        signal.usable = usable
-        signal.weight = final_weight
-        signal.risk_flags = risk_flags
-        
-        return signal
+        return usable, final_weight, risk_flags
+    
+    def _session(self) -> aiohttp.ClientSession:
+        """Get or create the HTTP session (must be called inside the event loop)."""
+        if self._client is None or self._client.closed:
+            self._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._pool_limits),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"X-API-Key": self.api_key}
+            )
+        return self._client
     
     async def close(self):
         """Close HTTP client."""
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+    
+    async def __aenter__(self) -> "OnChainAPIClient":
+        self._session()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
 
 
 class BotTradingDecisionEngine:
@@ -330,9 +513,9 @@ class BotTradingDecisionEngine:
         self.signal_weights = signal_weights
         self.logger = logger.bind(component="trading_decision_engine")
         
-        # Signal history for trend analysis
-        self.signal_history: List[OnChainSignalInput] = []
+        # Signal history for trend analysis (oldest entries evicted automatically)
         self.max_history = 100
+        self.signal_history: Deque[OnChainSignalInput] = deque(maxlen=self.max_history)
     
     async def make_trading_decision(self, asset: str = "BTC") -> Tuple[TradingDecision, Dict[str, Any]]:
         """
@@ -347,60 +530,79 @@ class BotTradingDecisionEngine:
             Tuple of (decision, decision_metadata)
         """
         
-        self.logger.info("Making trading decision", asset=asset)
-        
-        decision_metadata = {
-            "timestamp": datetime.now(),
-            "asset": asset,
-            "signal_sources": {},
-            "final_score": 0.0,
-            "confidence": 0.0,
-            "risk_flags": [],
-            "decision_factors": []
-        }
-        
-        try:
-            # 1. Get OnChain signal (ONE input among many)
-            onchain_signal = await self._get_onchain_input(asset)
-            decision_metadata["signal_sources"]["onchain"] = self._serialize_signal(onchain_signal)
-            
-            # 2. Get other signal sources (REQUIRED - never rely on onchain alone)
-            technical_signal = await self._get_technical_analysis_input(asset)
-            decision_metadata["signal_sources"]["technical"] = technical_signal
-            
-            sentiment_signal = await self._get_market_sentiment_input(asset)
-            decision_metadata["signal_sources"]["sentiment"] = sentiment_signal
-            
-            risk_signal = await self._get_risk_management_input(asset)
-            decision_metadata["signal_sources"]["risk"] = risk_signal
-            
-            # 3. Combine all signals with proper weighting
-            combined_score, combined_confidence = self._combine_signals(
-                onchain_signal, technical_signal, sentiment_signal, risk_signal
-            )
-            
-            decision_metadata["final_score"] = combined_score
-            decision_metadata["confidence"] = combined_confidence
-            
-            # 4. Make final decision with safety checks
-            decision = self._make_final_decision(combined_score, combined_confidence, decision_metadata)
-            
-            # 5. Update signal history
-            if onchain_signal:
-                self._update_signal_history(onchain_signal)
-            
-            self.logger.info("Trading decision made",
-                           decision=decision.value,
-                           final_score=combined_score,
-                           confidence=combined_confidence,
-                           onchain_usable=onchain_signal.usable if onchain_signal else False)
+        # Bind the asset once per decision cycle; every log event emitted
+        # while deciding (including the API client's) carries it
+        with bound_contextvars(asset=asset):
+            self.logger.debug("Making trading decision")
+            started_ns = time.monotonic_ns()
             
-            return decision, decision_metadata
+            decision_metadata = {
+                # Epoch nanoseconds; convert with datetime.fromtimestamp(ns / 1e9)
+                # only when the metadata is serialized
+                "timestamp_ns": time.time_ns(),
+                "asset": asset,
+                "signal_sources": {},
+                "final_score": 0.0,
+                "confidence": 0.0,
+                "risk_flags": [],
+                "decision_factors": []
+            }
             
-        except Exception as e:
-            self.logger.error("Trading decision failed", error=str(e))
-            decision_metadata["error"] = str(e)
-            return TradingDecision.NO_ACTION, decision_metadata
+            try:
+                # 1-2. Get OnChain signal (ONE input among many) and the other
+                # signal sources (REQUIRED - never rely on onchain alone).
+                # The sources are independent, so fetch them concurrently.
+                onchain_signal, technical_signal, sentiment_signal, risk_signal = await asyncio.gather(
+                    self._get_onchain_input(asset),
+                    self._get_technical_analysis_input(asset),
+                    self._get_market_sentiment_input(asset),
+                    self._get_risk_management_input(asset),
+                    return_exceptions=True
+                )
+                
+                if isinstance(onchain_signal, BaseException):
+                    self.logger.error("Failed to get OnChain input", error=str(onchain_signal))
+                    onchain_signal = None
+                decision_metadata["signal_sources"]["onchain"] = self._serialize_signal(onchain_signal)
+                
+                technical_signal = self._unwrap_source("technical", technical_signal)
+                decision_metadata["signal_sources"]["technical"] = technical_signal
+                
+                sentiment_signal = self._unwrap_source("sentiment", sentiment_signal)
+                decision_metadata["signal_sources"]["sentiment"] = sentiment_signal
+                
+                risk_signal = self._unwrap_source("risk", risk_signal)
+                decision_metadata["signal_sources"]["risk"] = risk_signal
+                
+                # 3. Combine all signals with proper weighting
+                combined_score, combined_confidence = self._combine_signals(
+                    onchain_signal, technical_signal, sentiment_signal, risk_signal
+                )
+                
+                decision_metadata["final_score"] = combined_score
+                decision_metadata["confidence"] = combined_confidence
+                
+                # 4. Make final decision with safety checks
+                decision = self._make_final_decision(combined_score, combined_confidence, decision_metadata)
+                
+                # 5. Update signal history
+                if onchain_signal:
+                    self._update_signal_history(onchain_signal)
+                
+                decision_metadata["decision_time_ms"] = (time.monotonic_ns() - started_ns) / 1_000_000
+                
+                self.logger.info("Trading decision made",
+                               decision=decision.value,
+                               final_score=combined_score,
+                               confidence=combined_confidence,
+                               onchain_usable=onchain_signal.usable if onchain_signal else False)
+                
+                return decision, decision_metadata
+                
+            except Exception as e:
+                self.logger.error("Trading decision failed", error=str(e))
+                decision_metadata["error"] = str(e)
+                return TradingDecision.NO_ACTION, decision_metadata
     
     async def _get_onchain_input(self, asset: str) -> Optional[OnChainSignalInput]:
         """Get OnChain signal input with safety checks."""
@@ -479,15 +681,23 @@ class BotTradingDecisionEngine:
             "weight": self.signal_weights.risk_management_weight
         }
     
+    def _unwrap_source(self, source: str, result: Any) -> Dict[str, Any]:
+        """Turn a failed signal source fetch into an unusable signal."""
+        
+        if isinstance(result, BaseException):
+            self.logger.error("Failed to get signal source", source=source, error=str(result))
+            return {"score": 0.5, "confidence": 0.0, "usable": False, "weight": 0.0,
+                    "error": str(result)}
+        return result
+    
     def _combine_signals(self, onchain_signal: Optional[OnChainSignalInput],
                         technical_signal: Dict[str, Any],
                         sentiment_signal: Dict[str, Any],
                         risk_signal: Dict[str, Any]) -> Tuple[float, float]:
         """Combine all signal sources with proper weighting."""
         
-        weighted_scores = []
-        total_weight = 0.0
-        confidence_factors = []
+        # (score, weight, confidence) of every usable source
+        components = []
         
         # OnChain signal (maximum 25% weight)
         if onchain_signal and onchain_signal.usable and onchain_signal.onchain_score is not None:
@@ -495,41 +705,29 @@ class BotTradingDecisionEngine:
             normalized_score = onchain_signal.onchain_score / 100.0
             
             # Apply bias adjustment
-            if onchain_signal.bias == "positive":
-                bias_adjustment = 0.1
-            elif onchain_signal.bias == "negative":
-                bias_adjustment = -0.1
-            else:
-                bias_adjustment = 0.0
+            bias_adjustment = _BIAS_ADJ.get(onchain_signal.bias, 0.0)
             
             adjusted_score = max(0.0, min(1.0, normalized_score + bias_adjustment))
-            
-            weighted_scores.append(adjusted_score * onchain_signal.weight)
-            total_weight += onchain_signal.weight
-            confidence_factors.append(onchain_signal.confidence * onchain_signal.weight)
-        
-        # Technical analysis signal
-        if technical_signal["usable"]:
-            weighted_scores.append(technical_signal["score"] * technical_signal["weight"])
-            total_weight += technical_signal["weight"]
-            confidence_factors.append(technical_signal["confidence"] * technical_signal["weight"])
-        
-        # Market sentiment signal
-        if sentiment_signal["usable"]:
-            weighted_scores.append(sentiment_signal["score"] * sentiment_signal["weight"])
-            total_weight += sentiment_signal["weight"]
-            confidence_factors.append(sentiment_signal["confidence"] * sentiment_signal["weight"])
-        
-        # Risk management signal
-        if risk_signal["usable"]:
-            weighted_scores.append(risk_signal["score"] * risk_signal["weight"])
-            total_weight += risk_signal["weight"]
-            confidence_factors.append(risk_signal["confidence"] * risk_signal["weight"])
+            components.append((adjusted_score, onchain_signal.weight, onchain_signal.confidence))
+        
+        # Technical analysis, market sentiment and risk management signals
+        for source in (technical_signal, sentiment_signal, risk_signal):
+            if source["usable"]:
+                components.append((source["score"], source["weight"], source["confidence"]))
+        
+        # Weighted score and confidence accumulated in one pass
+        score_sum = 0.0
+        confidence_sum = 0.0
+        total_weight = 0.0
+        for score, weight, confidence in components:
+            score_sum += score * weight
+            confidence_sum += confidence * weight
+            total_weight += weight
         
         # Calculate combined score and confidence
         if total_weight > 0:
-            combined_score = sum(weighted_scores) / total_weight
-            combined_confidence = sum(confidence_factors) / total_weight
+            combined_score = score_sum / total_weight
+            combined_confidence = confidence_sum / total_weight
         else:
             combined_score = 0.5  # Neutral
             combined_confidence = 0.0
@@ -601,11 +799,10 @@ class BotTradingDecisionEngine:
     def _update_signal_history(self, signal: OnChainSignalInput):
         """Update signal history for trend analysis."""
         
+        # Cached signals are returned as the same instance; record each once
+        if self.signal_history and signal is self.signal_history[-1]:
+            return
         self.signal_history.append(signal)
-        
-        # Keep only recent history
-        if len(self.signal_history) > self.max_history:
-            self.signal_history = self.signal_history[-self.max_history:]
     
     def get_signal_trend_analysis(self, lookback_periods: int = 10) -> Dict[str, Any]:
         """Analyze recent signal trends."""
@@ -613,26 +810,37 @@ class BotTradingDecisionEngine:
         if len(self.signal_history) < lookback_periods:
             return {"insufficient_data": True}
         
-        recent_signals = self.signal_history[-lookback_periods:]
-        
-        # Calculate trend metrics
-        usable_signals = [s for s in recent_signals if s.usable]
-        avg_confidence = sum(s.confidence for s in usable_signals) / len(usable_signals) if usable_signals else 0
-        avg_score = sum(s.onchain_score for s in usable_signals if s.onchain_score) / len([s for s in usable_signals if s.onchain_score]) if usable_signals else 0
+        recent_signals = itertools.islice(
+            self.signal_history, len(self.signal_history) - lookback_periods, None
+        )
         
-        # Count status distribution
+        # Calculate trend metrics and status distribution in a single pass
+        total_signals = 0
+        usable_count = 0
+        confidence_sum = 0.0
+        score_sum = 0.0
+        score_count = 0
         status_counts = {}
+        
         for signal in recent_signals:
+            total_signals += 1
             status_counts[signal.status.value] = status_counts.get(signal.status.value, 0) + 1
+            
+            if signal.usable:
+                usable_count += 1
+                confidence_sum += signal.confidence
+                if signal.onchain_score:
+                    score_sum += signal.onchain_score
+                    score_count += 1
         
         return {
             "lookback_periods": lookback_periods,
-            "total_signals": len(recent_signals),
-            "usable_signals": len(usable_signals),
-            "avg_confidence": avg_confidence,
-            "avg_score": avg_score,
+            "total_signals": total_signals,
+            "usable_signals": usable_count,
+            "avg_confidence": confidence_sum / usable_count if usable_count else 0,
+            "avg_score": score_sum / score_count if score_count else 0,
             "status_distribution": status_counts,
-            "reliability_score": len(usable_signals) / len(recent_signals)
+            "reliability_score": usable_count / total_signals if total_signals else 0
         }
 
 
@@ -640,8 +848,9 @@ class BotTradingDecisionEngine:
 async def main():
     """Example usage of BotTrading integration."""
     
-    # Setup logging
+    # Setup logging; events below INFO are dropped before any processing
     logging.basicConfig(level=logging.INFO)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
     
     # Initialize OnChain API client
     onchain_client = OnChainAPIClient(
@@ -671,4 +880,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # Fall back to the default asyncio event loop
+    
     asyncio.run(main())
\ No newline at end of file
@@ -9,10 +9,26 @@ __version__ = "1.0.0"
 __author__ = "Bitcoin Data Engineering Team"
 __description__ = "Raw on-chain data collector for Bitcoin using Bitcoin Core RPC"
 
-from btc_collector.core.collector import BitcoinCollector
-from btc_collector.core.rpc_client import BitcoinRPCClient
-from btc_collector.database.manager import DatabaseManager
-from btc_collector.models.config import CollectorConfig
+# Public classes are imported on first access so that lightweight entry
+# points (e.g. `btc-collector version`) don't load the RPC/DB stack
+_LAZY_IMPORTS = {
+    "BitcoinCollector": "btc_collector.core.collector",
+    "BitcoinRPCClient": "btc_collector.core.rpc_client",
+    "DatabaseManager": "btc_collector.database.manager",
+    "CollectorConfig": "btc_collector.models.config",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BitcoinCollector",
@@ -1,16 +1,87 @@
 """Command-line interface for the Bitcoin collector."""
 
 import sys
-import json
-from pathlib import Path
+from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 import click
-import structlog
+import orjson
 
-from btc_collector.models.config import CollectorConfig
-from btc_collector.core.collector import BitcoinCollector
+# Config and collector modules pull in pydantic, SQLAlchemy and requests, so
+# they are imported inside the commands that need them
 
-logger = structlog.get_logger(__name__)
+
+@lru_cache(maxsize=4)
+def _load_config(config_file: Optional[str]):
+    """Load and validate the configuration once per config file."""
+    from btc_collector.models.config import CollectorConfig
+    
+    if config_file:
+        # Load from specific file
+        return CollectorConfig(_env_file=config_file)
+    # Load from default .env file or environment
+    return CollectorConfig()
+
+
+def _get_config(ctx):
+    """Load the collector configuration on first use by a command."""
+    if 'config' not in ctx.obj:
+        try:
+            # Override log level on a copy so the cached instance stays untouched
+            config = _load_config(ctx.obj['config_file']).model_copy(
+                update={'log_level': ctx.obj['log_level']}
+            )
+            
+        except Exception as e:
+            click.echo(f"Error loading configuration: {e}", err=True)
+            sys.exit(1)
+        
+        ctx.obj['config'] = config
+    
+    return ctx.obj['config']
+
+
+def _json_default(obj):
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Fields written by export_block, in output order
+_BLOCK_EXPORT_FIELDS = (
+    'block_height', 'block_hash', 'block_time', 'tx_count', 'total_fees_btc',
+    'block_size_bytes', 'difficulty', 'nonce', 'merkle_root', 'previous_block_hash',
+)
+
+
+def _write_json_object(output, items) -> None:
+    """
+    Write (key, value) pairs as an indented JSON object, one member at a time.
+    
+    Only the current value is serialized in memory, so `items` can be a
+    generator over arbitrarily large data.
+    """
+    output.write('{')
+    separator = '\n'
+    for key, value in items:
+        output.write(separator)
+        output.write('  ')
+        output.write(orjson.dumps(key).decode())
+        output.write(': ')
+        output.write(orjson.dumps(value, default=_json_default).decode())
+        separator = ',\n'
+    output.write('\n}' if separator != '\n' else '}')
+
+
+def _block_export_items(block):
+    """Yield export_block's (field, value) pairs from a block row."""
+    for field in _BLOCK_EXPORT_FIELDS:
+        value = getattr(block, field)
+        if field == 'difficulty' and not value:
+            # A zero or missing difficulty is exported as null
+            value = None
+        yield field, value
 
 
 @click.group()
@@ -24,30 +95,18 @@ def cli(ctx, config_file: Optional[str], log_level: str):
     """Bitcoin Raw Data Collector CLI."""
     ctx.ensure_object(dict)
     
-    # Load configuration
-    try:
-        if config_file:
-            # Load from specific file
-            config = CollectorConfig(_env_file=config_file)
-        else:
-            # Load from default .env file or environment
-            config = CollectorConfig()
-        
-        # Override log level if specified
-        config.log_level = log_level
-        
-        ctx.obj['config'] = config
-        
-    except Exception as e:
-        click.echo(f"Error loading configuration: {e}", err=True)
-        sys.exit(1)
+    # Configuration is loaded lazily by the commands that need it
+    ctx.obj['config_file'] = config_file
+    ctx.obj['log_level'] = log_level
 
 
 @cli.command()
 @click.pass_context
 def init_db(ctx):
     """Initialize the database schema."""
-    config = ctx.obj['config']
+    from btc_collector.core.collector import BitcoinCollector
+    
+    config = _get_config(ctx)
     
     click.echo("Initializing database...")
     
@@ -78,7 +137,9 @@ def init_db(ctx):
 def sync(ctx, start_height: Optional[int], end_height: Optional[int],
          continuous: bool, poll_interval: int):
     """Synchronize blockchain data."""
-    config = ctx.obj['config']
+    from btc_collector.core.collector import BitcoinCollector
+    
+    config = _get_config(ctx)
     
     try:
         collector = BitcoinCollector(config)
@@ -95,9 +156,9 @@ def sync(ctx, start_height: Optional[int], end_height: Optional[int],
         else:
             # Get sync status
             status = collector.get_sync_status()
-            click.echo(f"📊 Current blockchain height: {status.get('current_blockchain_height', 0)}")
-            click.echo(f"📊 Last synced height: {status.get('last_synced_height', 0)}")
-            click.echo(f"📊 Blocks behind: {status.get('blocks_behind', 0)}")
+            click.echo(f"📊 Current blockchain height: {status.current_blockchain_height}")
+            click.echo(f"📊 Last synced height: {status.last_synced_height}")
+            click.echo(f"📊 Blocks behind: {status.blocks_behind}")
             
             # Perform sync
             click.echo("🔄 Starting synchronization...")
@@ -123,7 +184,9 @@ def sync(ctx, start_height: Optional[int], end_height: Optional[int],
 @click.pass_context
 def sync_block(ctx, height: int):
     """Synchronize a single block."""
-    config = ctx.obj['config']
+    from btc_collector.core.collector import BitcoinCollector
+    
+    config = _get_config(ctx)
     
     try:
         collector = BitcoinCollector(config)
@@ -152,7 +215,9 @@ def sync_block(ctx, height: int):
 @click.pass_context
 def status(ctx):
     """Show synchronization status."""
-    config = ctx.obj['config']
+    from btc_collector.core.collector import BitcoinCollector
+    
+    config = _get_config(ctx)
     
     try:
         collector = BitcoinCollector(config)
@@ -167,11 +232,11 @@ def status(ctx):
         
         click.echo("📊 Bitcoin Collector Status")
         click.echo("=" * 40)
-        click.echo(f"Blockchain Height: {sync_status.get('current_blockchain_height', 0):,}")
-        click.echo(f"Last Synced: {sync_status.get('last_synced_height', 0):,}")
-        click.echo(f"Blocks Behind: {sync_status.get('blocks_behind', 0):,}")
-        click.echo(f"Sync Progress: {sync_status.get('sync_progress', 0):.2f}%")
-        click.echo(f"Is Syncing: {'Yes' if sync_status.get('is_syncing', False) else 'No'}")
+        click.echo(f"Blockchain Height: {sync_status.current_blockchain_height:,}")
+        click.echo(f"Last Synced: {sync_status.last_synced_height:,}")
+        click.echo(f"Blocks Behind: {sync_status.blocks_behind:,}")
+        click.echo(f"Sync Progress: {sync_status.sync_progress:.2f}%")
+        click.echo(f"Is Syncing: {'Yes' if sync_status.is_syncing else 'No'}")
         
         # Configuration
         click.echo("\n⚙️  Configuration")
@@ -191,7 +256,9 @@ def status(ctx):
 @click.pass_context
 def test_connection(ctx):
     """Test connections to Bitcoin Core and database."""
-    config = ctx.obj['config']
+    from btc_collector.core.collector import BitcoinCollector
+    
+    config = _get_config(ctx)
     
     try:
         collector = BitcoinCollector(config)
@@ -222,7 +289,9 @@ def test_connection(ctx):
 @click.pass_context
 def export_block(ctx, height: int, output):
     """Export block data as JSON."""
-    config = ctx.obj['config']
+    from btc_collector.core.collector import BitcoinCollector
+    
+    config = _get_config(ctx)
     
     try:
         collector = BitcoinCollector(config)
@@ -238,21 +307,9 @@ def export_block(ctx, height: int, output):
             click.echo(f"❌ Block {height} not found in database", err=True)
             sys.exit(1)
         
-        # Convert to JSON-serializable format
-        block_data = {
-            'block_height': block.block_height,
-            'block_hash': block.block_hash,
-            'block_time': block.block_time.isoformat(),
-            'tx_count': block.tx_count,
-            'total_fees_btc': float(block.total_fees_btc),
-            'block_size_bytes': block.block_size_bytes,
-            'difficulty': float(block.difficulty) if block.difficulty else None,
-            'nonce': block.nonce,
-            'merkle_root': block.merkle_root,
-            'previous_block_hash': block.previous_block_hash
-        }
-        
-        json.dump(block_data, output, indent=2)
+        # Stream fields straight from the row; Decimal and datetime values
+        # are handled by the serializer
+        _write_json_object(output, _block_export_items(block))
         
         if output != sys.stdout:
             click.echo(f"✅ Block {height} exported successfully")
@@ -1,19 +1,27 @@
 """Block processing and UTXO management."""
 
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 import structlog
+from sqlalchemy.orm import Session
 
 from btc_collector.models.blockchain import (
     BlockData, TransactionData, UTXOData, TransactionInputData, AddressData
 )
-from btc_collector.core.transaction_parser import TransactionParser
+from btc_collector.core.transaction_parser import TransactionParser, parse_transaction_chunk
 from btc_collector.database.manager import DatabaseManager
+from btc_collector.utils.bitcoin import btc_to_satoshi
 from btc_collector.utils.time import format_block_time
 
 logger = structlog.get_logger(__name__)
 
+# (value_sats, address, script_type) of a UTXO consumed by a block
+SpentUTXO = Tuple[int, Optional[str], Optional[str]]
+
 
 class BlockProcessor:
     """Processes blocks and manages UTXO state."""
@@ -22,6 +30,15 @@ class BlockProcessor:
         self.db_manager = db_manager
         self.tx_parser = TransactionParser()
         self.logger = logger.bind(component="block_processor")
+        
+        # Worker processes for parsing large blocks, started by start_parse_pool()
+        # (or on first use)
+        self._parse_workers = db_manager.config.parse_workers
+        self._parse_parallel_min_txs = db_manager.config.parse_parallel_min_txs
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Per-block progress is logged for every Nth block only
+        self._log_every = max(1, db_manager.config.log_every_n_blocks)
     
     def process_block(self, block_data: Dict[str, Any]) -> bool:
         """
@@ -36,42 +53,56 @@ class BlockProcessor:
         """
         block_height = block_data['height']
         block_hash = block_data['hash']
+        block_time = format_block_time(block_data['time'])
+        log_progress = block_height % self._log_every == 0
         
-        self.logger.info("Processing block", 
-                        height=block_height, 
-                        hash=block_hash,
-                        tx_count=len(block_data.get('tx', [])))
+        if log_progress:
+            self.logger.info("Processing block", 
+                            height=block_height, 
+                            hash=block_hash,
+                            tx_count=len(block_data.get('tx', [])))
         
         try:
             # 1. Parse block metadata
-            block_obj = self._parse_block_metadata(block_data)
+            block_obj = self._parse_block_metadata(block_data, block_time)
             
             # 2. Parse all transactions in the block
-            transactions, utxos, inputs = self.tx_parser.parse_block_transactions(block_data)
-            
-            # 3. Process UTXO spending (mark previous UTXOs as spent)
-            self._process_utxo_spending(inputs, block_height, format_block_time(block_data['time']))
-            
-            # 4. Calculate transaction fees (now that we have input values)
-            self._calculate_transaction_fees(transactions, inputs)
-            
-            # 5. Update block total fees
-            total_fees = sum(tx.fee_btc for tx in transactions)
-            block_obj.total_fees_btc = total_fees
-            
-            # 6. Process address statistics
-            if self.db_manager.config.enable_address_tracking:
-                self._process_address_statistics(utxos, inputs, block_height, block_obj.block_time)
+            transactions, utxos, coinbase_inputs, spending_inputs = \
+                self._parse_transactions(block_data, block_time)
             
-            # 7. Save everything to database (atomic transaction)
-            success = self._save_block_data(block_obj, transactions, utxos, inputs)
+            # Steps 3-7 write in one database transaction, so a failure
+            # leaves no partially applied block behind
+            with self.db_manager.transaction() as session:
+                # 3. Process UTXO spending (mark previous UTXOs as spent)
+                spent_utxos = self._process_utxo_spending(spending_inputs, utxos, block_height,
+                                                          block_time, session)
+                
+                # 4. Calculate transaction fees (now that we have input values)
+                self._calculate_transaction_fees(transactions, spending_inputs, spent_utxos)
+                
+                # 5. Update block total fees
+                total_fees = sum(tx.fee_sats for tx in transactions)
+                block_obj.total_fees_sats = total_fees
+                
+                # 6. Process address statistics
+                if self.db_manager.config.enable_address_tracking:
+                    self._process_address_statistics(utxos, spent_utxos, block_height,
+                                                     block_time, session)
+                
+                # 7. Save everything to database
+                success = self._save_block_data(block_obj, transactions, utxos,
+                                                coinbase_inputs + spending_inputs, session)
+                if not success:
+                    # Discard the spends and address updates made for this block
+                    session.rollback()
             
             if success:
-                self.logger.info("Block processed successfully",
-                               height=block_height,
-                               tx_count=len(transactions),
-                               utxo_count=len(utxos),
-                               total_fees=float(total_fees))
+                if log_progress:
+                    self.logger.info("Block processed successfully",
+                                   height=block_height,
+                                   tx_count=len(transactions),
+                                   utxo_count=len(utxos),
+                                   total_fees_sats=total_fees)
                 return True
             else:
                 self.logger.error("Failed to save block data", height=block_height)
@@ -83,14 +114,50 @@ class BlockProcessor:
                             error=str(e))
             return False
     
-    def _parse_block_metadata(self, block_data: Dict[str, Any]) -> BlockData:
+    def _parse_transactions(self, block_data: Dict[str, Any], block_time: datetime) -> Tuple[
+        List[TransactionData], List[UTXOData],
+        List[TransactionInputData], List[TransactionInputData]
+    ]:
+        """Parse a block's transactions, splitting large blocks across worker processes."""
+        txs = block_data.get('tx', [])
+        workers = self._parse_workers
+        
+        if workers <= 1 or len(txs) < self._parse_parallel_min_txs:
+            return self.tx_parser.parse_block_transactions(block_data, block_time)
+        
+        self.start_parse_pool()
+        
+        # Transactions parse independently; results are concatenated in block order
+        chunk_size = -(-len(txs) // workers)
+        futures = [
+            self._parse_pool.submit(parse_transaction_chunk, txs[start:start + chunk_size],
+                                    block_data['height'], block_time, start)
+            for start in range(0, len(txs), chunk_size)
+        ]
+        
+        transactions, utxos, coinbase_inputs, spending_inputs = [], [], [], []
+        for future in futures:
+            chunk_txs, chunk_utxos, chunk_coinbase, chunk_spending = future.result()
+            transactions.extend(chunk_txs)
+            utxos.extend(chunk_utxos)
+            coinbase_inputs.extend(chunk_coinbase)
+            spending_inputs.extend(chunk_spending)
+        
+        self.logger.debug("Parsed block transactions in parallel",
+                         block_height=block_data['height'],
+                         tx_count=len(transactions),
+                         chunks=len(futures))
+        
+        return transactions, utxos, coinbase_inputs, spending_inputs
+    
+    def _parse_block_metadata(self, block_data: Dict[str, Any], block_time: datetime) -> BlockData:
         """Parse block metadata into BlockData object."""
         return BlockData(
             block_height=block_data['height'],
             block_hash=block_data['hash'],
-            block_time=format_block_time(block_data['time']),
+            block_time=block_time,
             tx_count=len(block_data.get('tx', [])),
-            total_fees_btc=Decimal('0'),  # Will be calculated later
+            total_fees_sats=0,  # Will be calculated later
             block_size_bytes=block_data.get('size'),
             difficulty=Decimal(str(block_data.get('difficulty', 0))),
             nonce=block_data.get('nonce'),
@@ -98,162 +165,186 @@ class BlockProcessor:
             previous_block_hash=block_data.get('previousblockhash')
         )
     
-    def _process_utxo_spending(self, inputs: List[TransactionInputData], 
-                              block_height: int, block_time: datetime):
-        """Mark UTXOs as spent based on transaction inputs."""
+    def _process_utxo_spending(self, inputs: List[TransactionInputData],
+                              created_utxos: List[UTXOData],
+                              block_height: int, block_time: datetime,
+                              session: Optional[Session] = None
+                              ) -> Dict[Tuple[str, int], SpentUTXO]:
+        """
+        Mark UTXOs as spent based on non-coinbase transaction inputs.
+        
+        Outputs created earlier in the same block (`created_utxos`) are not
+        in the database yet, so they are marked spent in memory and saved
+        that way. Every other spend is one bulk UPDATE ... RETURNING, which
+        marks the rows and returns their values in the same round trip.
+        
+        Returns:
+            (value_sats, address, script_type) of each spent UTXO, keyed by
+            (tx_hash, vout_index)
+        """
+        spent_utxos = {}
+        spends = []
+        block_utxos = {(utxo.tx_hash, utxo.vout_index): utxo for utxo in created_utxos}
+        
         for input_data in inputs:
-            # Skip coinbase inputs
-            if not input_data.previous_tx_hash:
-                continue
+            outpoint = (input_data.previous_tx_hash, input_data.previous_vout_index)
+            utxo = block_utxos.pop(outpoint, None)
             
-            # Mark the referenced UTXO as spent
-            success = self.db_manager.mark_utxo_spent(
-                tx_hash=input_data.previous_tx_hash,
-                vout_index=input_data.previous_vout_index,
-                spent_tx_hash=input_data.tx_hash,
-                spent_block_height=block_height,
-                spent_at=block_time
-            )
+            if utxo is not None:
+                # Created earlier in this block and not saved yet: spend in memory
+                utxo.is_spent = True
+                utxo.spent_tx_hash = input_data.tx_hash
+                utxo.spent_block_height = block_height
+                utxo.spent_at = block_time
+                spent_utxos[outpoint] = (utxo.value_sats, utxo.address, utxo.script_type)
+            else:
+                spends.append((outpoint[0], outpoint[1], input_data.tx_hash))
+        
+        if spends:
+            # Mark the remaining UTXOs as spent and get their values in one query
+            db_spent = self.db_manager.mark_utxos_spent_bulk(spends, block_height, block_time,
+                                                             session=session)
             
-            if not success:
-                self.logger.warning("Failed to mark UTXO as spent",
-                                  prev_tx=input_data.previous_tx_hash,
-                                  prev_vout=input_data.previous_vout_index,
-                                  spending_tx=input_data.tx_hash)
+            if len(db_spent) != len(spends):
+                self.logger.warning("Failed to mark some UTXOs as spent",
+                                  block_height=block_height,
+                                  expected=len(spends),
+                                  marked=len(db_spent))
+            
+            spent_utxos.update(db_spent)
+        
+        return spent_utxos
     
     def _calculate_transaction_fees(self, transactions: List[TransactionData], 
-                                   inputs: List[TransactionInputData]):
-        """Calculate transaction fees by looking up input values."""
-        # Group inputs by transaction
-        tx_inputs = {}
+                                   inputs: List[TransactionInputData],
+                                   spent_utxos: Dict[Tuple[str, int], SpentUTXO]):
+        """Calculate transaction fees from the values of the spent UTXOs."""
+        # Sum input values per spending transaction in one pass
+        # (inputs are non-coinbase only)
+        tx_input_sats = defaultdict(int)
         for input_data in inputs:
-            if input_data.tx_hash not in tx_inputs:
-                tx_inputs[input_data.tx_hash] = []
-            tx_inputs[input_data.tx_hash].append(input_data)
+            # Look up the value of the previous output
+            spent_utxo = spent_utxos.get(
+                (input_data.previous_tx_hash, input_data.previous_vout_index)
+            )
+            
+            if spent_utxo is not None:
+                tx_input_sats[input_data.tx_hash] += spent_utxo[0]
+            else:
+                self.logger.warning("UTXO value not found",
+                                  tx_hash=input_data.previous_tx_hash,
+                                  vout=input_data.previous_vout_index)
         
         # Calculate fees for each transaction
         for tx in transactions:
             if tx.is_coinbase:
-                tx.fee_btc = Decimal('0')
+                tx.fee_sats = 0
                 continue
             
-            # Get input values
-            input_values = []
-            tx_input_list = tx_inputs.get(tx.tx_hash, [])
-            
-            for input_data in tx_input_list:
-                if input_data.previous_tx_hash:
-                    # Look up the value of the previous output
-                    utxo_value = self.db_manager.get_utxo_value(
-                        input_data.previous_tx_hash,
-                        input_data.previous_vout_index
-                    )
-                    
-                    if utxo_value is not None:
-                        input_values.append(utxo_value)
-                    else:
-                        self.logger.warning("UTXO value not found",
-                                          tx_hash=input_data.previous_tx_hash,
-                                          vout=input_data.previous_vout_index)
+            input_sats = tx_input_sats.get(tx.tx_hash)
             
             # Calculate fee
-            if input_values:
-                total_input_value = sum(input_values)
-                tx.total_input_btc = total_input_value
-                tx.fee_btc = total_input_value - tx.total_output_btc
+            if input_sats is not None:
+                tx.total_input_sats = input_sats
+                tx.fee_sats = input_sats - tx.total_output_sats
             else:
                 self.logger.warning("No input values found for transaction", 
                                   tx_hash=tx.tx_hash)
     
     def _process_address_statistics(self, utxos: List[UTXOData], 
-                                   inputs: List[TransactionInputData],
-                                   block_height: int, block_time: datetime):
-        """Update address statistics based on UTXOs and inputs."""
-        # Track addresses affected in this block
-        address_updates = {}
+                                   spent_utxos: Dict[Tuple[str, int], SpentUTXO],
+                                   block_height: int, block_time: datetime,
+                                   session: Optional[Session] = None):
+        """Update address statistics based on new and spent UTXOs."""
+        # Phase 1: aggregate per-address deltas for this block in memory as
+        # [received_sats, sent_sats, tx_count, utxo_count, script_type]
+        deltas: Dict[str, list] = {}
         
         # Process new UTXOs (received funds)
         for utxo in utxos:
             if not utxo.address:
                 continue
             
-            if utxo.address not in address_updates:
-                # Get existing address stats or create new
-                existing_stats = self.db_manager.get_address_stats(utxo.address)
-                
-                if existing_stats:
-                    address_updates[utxo.address] = AddressData(
-                        address=utxo.address,
-                        script_type=utxo.script_type,
-                        first_seen_block=existing_stats['first_seen_block'],
-                        last_seen_block=block_height,
-                        first_seen_at=existing_stats.get('first_seen_at', block_time),
-                        last_seen_at=block_time,
-                        total_received_btc=existing_stats['total_received_btc'],
-                        total_sent_btc=existing_stats['total_sent_btc'],
-                        current_balance_btc=existing_stats['current_balance_btc'],
-                        tx_count=existing_stats['tx_count'],
-                        utxo_count=0  # Will be recalculated
-                    )
-                else:
-                    # New address
-                    address_updates[utxo.address] = AddressData(
-                        address=utxo.address,
-                        script_type=utxo.script_type,
-                        first_seen_block=block_height,
-                        last_seen_block=block_height,
-                        first_seen_at=block_time,
-                        last_seen_at=block_time,
-                        total_received_btc=Decimal('0'),
-                        total_sent_btc=Decimal('0'),
-                        current_balance_btc=Decimal('0'),
-                        tx_count=0,
-                        utxo_count=0
-                    )
-            
-            # Update received amount
-            addr_data = address_updates[utxo.address]
-            addr_data.total_received_btc += utxo.value_btc
-            addr_data.current_balance_btc += utxo.value_btc
-            addr_data.tx_count += 1
-            addr_data.utxo_count += 1
+            delta = deltas.setdefault(utxo.address, [0, 0, 0, 0, utxo.script_type])
+            delta[0] += utxo.value_sats
+            delta[2] += 1
+            delta[3] += 1
         
         # Process spent UTXOs (sent funds)
-        for input_data in inputs:
-            if not input_data.previous_tx_hash:  # Skip coinbase
+        for value_sats, address, script_type in spent_utxos.values():
+            if not address:
                 continue
             
-            # Get the UTXO being spent to find the address
-            utxo_value = self.db_manager.get_utxo_value(
-                input_data.previous_tx_hash,
-                input_data.previous_vout_index
-            )
+            delta = deltas.setdefault(address, [0, 0, 0, 0, script_type])
+            delta[1] += value_sats
+            delta[2] += 1
+            delta[3] -= 1
+        
+        if not deltas:
+            return
+        
+        # Phase 2: merge deltas into existing stats loaded in one query
+        stats_by_address = self.db_manager.get_address_stats_bulk(list(deltas))
+        address_updates = []
+        
+        for address, (received, sent, tx_count, utxo_count, script_type) in deltas.items():
+            existing_stats = stats_by_address.get(address)
             
-            # Note: In a full implementation, we'd need to get the address
-            # from the UTXO being spent. This is simplified for now.
+            if existing_stats:
+                total_received = btc_to_satoshi(existing_stats['total_received_btc']) + received
+                total_sent = btc_to_satoshi(existing_stats['total_sent_btc']) + sent
+                address_updates.append(AddressData(
+                    address=address,
+                    script_type=script_type,
+                    first_seen_block=existing_stats['first_seen_block'],
+                    last_seen_block=block_height,
+                    first_seen_at=existing_stats.get('first_seen_at', block_time),
+                    last_seen_at=block_time,
+                    total_received_sats=total_received,
+                    total_sent_sats=total_sent,
+                    current_balance_sats=(btc_to_satoshi(existing_stats['current_balance_btc'])
+                                          + received - sent),
+                    tx_count=existing_stats['tx_count'] + tx_count,
+                    utxo_count=existing_stats.get('utxo_count', 0) + utxo_count
+                ))
+            else:
+                # New address
+                address_updates.append(AddressData(
+                    address=address,
+                    script_type=script_type,
+                    first_seen_block=block_height,
+                    last_seen_block=block_height,
+                    first_seen_at=block_time,
+                    last_seen_at=block_time,
+                    total_received_sats=received,
+                    total_sent_sats=sent,
+                    current_balance_sats=received - sent,
+                    tx_count=tx_count,
+                    utxo_count=utxo_count
+                ))
         
         # Save address updates
-        for address_data in address_updates.values():
-            self.db_manager.save_or_update_address(address_data)
+        self.db_manager.save_or_update_addresses_bulk(address_updates, session=session)
     
     def _save_block_data(self, block: BlockData, transactions: List[TransactionData],
-                        utxos: List[UTXOData], inputs: List[TransactionInputData]) -> bool:
-        """Save all block data in a single database transaction."""
+                        utxos: List[UTXOData], inputs: List[TransactionInputData],
+                        session: Session) -> bool:
+        """Save all block data within the caller's database transaction."""
         try:
             # Save block
-            if not self.db_manager.save_block(block):
+            if not self.db_manager.save_block(block, session=session):
                 return False
             
             # Save transactions
-            if not self.db_manager.save_transactions(transactions):
+            if not self.db_manager.save_transactions(transactions, session=session):
                 return False
             
             # Save UTXOs
-            if not self.db_manager.save_utxos(utxos):
+            if not self.db_manager.save_utxos(utxos, session=session):
                 return False
             
             # Save transaction inputs
-            if not self.db_manager.save_transaction_inputs(inputs):
+            if not self.db_manager.save_transaction_inputs(inputs, session=session):
                 return False
             
             return True
@@ -268,9 +359,38 @@ class BlockProcessor:
         """Get processing statistics."""
         sync_state = self.db_manager.get_sync_state()
         
+        if not sync_state:
+            return {
+                'last_processed_block': 0,
+                'is_syncing': False,
+                'sync_started_at': None,
+                'sync_completed_at': None
+            }
+        
         return {
-            'last_processed_block': sync_state.get('last_synced_block_height', 0) if sync_state else 0,
-            'is_syncing': sync_state.get('is_syncing', False) if sync_state else False,
-            'sync_started_at': sync_state.get('sync_started_at') if sync_state else None,
-            'sync_completed_at': sync_state.get('sync_completed_at') if sync_state else None
-        }
\ No newline at end of file
+            'last_processed_block': sync_state['last_synced_block_height'],
+            'is_syncing': bool(sync_state['is_syncing']),
+            'sync_started_at': sync_state['sync_started_at'],
+            'sync_completed_at': sync_state['sync_completed_at']
+        }
+    
+    def start_parse_pool(self):
+        """
+        Start the parse worker pool if parallel parsing is enabled.
+        
+        Workers are spawned rather than forked: by the time blocks are being
+        processed the collector runs fetch, checkpoint and logging threads,
+        and a forked child could inherit locks those threads hold. Call this
+        before starting such threads so the pool is ready up front.
+        """
+        if self._parse_pool is None and self._parse_workers > 1:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self._parse_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+    
+    def close(self):
+        """Shut down the parse worker pool, if started."""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
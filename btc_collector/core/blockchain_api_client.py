@@ -8,12 +8,28 @@ API Documentation: https://www.blockchain.com/explorer/api
 """
 
 import time
+import random
+import asyncio
+import importlib.util
+import aiohttp
+import httpx
+import orjson
 import requests
-from typing import Dict, Any, Optional, List
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError
+from typing import Dict, Any, Optional, List, Iterable, Awaitable, Callable, Hashable, Mapping, Tuple, Union, Iterator, AsyncIterator
 from decimal import Decimal
 from datetime import datetime
+from types import MappingProxyType
 import structlog
 
+from btc_collector.utils.aio import close_stale_session
+from btc_collector.utils.bitcoin import REORG_SAFE_DEPTH
+from btc_collector.utils.rate_limiter import TokenBucket
+from btc_collector.utils.cache import TTLCache
+from btc_collector.utils.circuit_breaker import CircuitBreaker
+
 logger = structlog.get_logger(__name__)
 
 
@@ -22,6 +38,289 @@ class BlockchainAPIError(Exception):
     pass
 
 
+# Connection pool sizing for the keep-alive sessions below. The API server
+# issues several provider calls concurrently from worker threads.
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# HTTP/2 needs the optional `h2` package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Transport errors raised by either session type
+REQUEST_ERRORS = (requests.RequestException, httpx.HTTPError)
+
+# Compressed encodings all three HTTP stacks can decode; brotli support
+# needs the optional `brotli`/`brotlicffi` package
+BROTLI_AVAILABLE = any(importlib.util.find_spec(m) is not None
+                       for m in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+# Statuses retried by the sync sessions (urllib3 Retry / _RetryTransport)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class _JitteredRetry(Retry):
+    """urllib3 Retry with the capped, +/-50% jittered backoff used by the async paths."""
+    
+    def get_backoff_time(self) -> float:
+        return min(BACKOFF_CAP, super().get_backoff_time()) * random.uniform(0.5, 1.5)
+
+
+class _RetryTransport(httpx.HTTPTransport):
+    """
+    httpx transport applying the same policy as _JitteredRetry: GETs are
+    retried on transport errors and RETRY_STATUSES, honouring Retry-After,
+    and the last response is handed back once the retries are spent.
+    """
+    
+    def __init__(self, retries: int, **kwargs):
+        super().__init__(**kwargs)
+        self._retries = retries
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        retries = self._retries if request.method == 'GET' else 0
+        attempt = 0
+        while True:
+            try:
+                response = super().handle_request(request)
+            except httpx.TransportError:
+                if attempt >= retries:
+                    raise
+                time.sleep(_backoff_delay(attempt))
+            else:
+                if attempt >= retries or response.status_code not in RETRY_STATUSES:
+                    return response
+                response.close()
+                time.sleep(_retry_after_delay(response.headers) if 'Retry-After' in response.headers
+                           else _backoff_delay(attempt))
+            attempt += 1
+
+
+def create_session(headers: Optional[Dict[str, str]] = None,
+                   http2: bool = False,
+                   retries: int = 0) -> Union[requests.Session, httpx.Client]:
+    """
+    Create a keep-alive session with a pooled HTTP adapter.
+    
+    With `http2=True` (and `h2` installed) returns an httpx client that
+    multiplexes concurrent requests over one connection per host; otherwise
+    falls back to a requests session. Both expose the same get() API.
+    
+    Both session types retry GETs up to `retries` times on transport errors
+    and RETRY_STATUSES (honouring Retry-After), and hand back the last
+    response once the retries are spent.
+    """
+    if http2:
+        if HTTP2_AVAILABLE:
+            return httpx.Client(
+                headers=headers,
+                transport=_RetryTransport(
+                    retries,
+                    http2=True,
+                    limits=httpx.Limits(max_connections=POOL_MAXSIZE,
+                                        max_keepalive_connections=POOL_CONNECTIONS)
+                )
+            )
+        logger.warning("HTTP/2 requested but h2 is not installed, using HTTP/1.1")
+    
+    session = requests.Session()
+    max_retries = _JitteredRetry(
+        total=retries,
+        backoff_factor=BACKOFF_BASE,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET'}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    ) if retries > 0 else 0
+    adapter = HTTPAdapter(max_retries=max_retries,
+                          pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def prepare_requests(session: Union[requests.Session, httpx.Client],
+                     urls: Dict[str, str],
+                     params: Optional[Dict[str, str]] = None) -> Dict[str, requests.PreparedRequest]:
+    """
+    Pre-build GET requests for argument-free endpoints.
+    
+    Sending a PreparedRequest skips requests' per-call URL parsing and
+    header/cookie merging, so session headers and cookies are fixed when
+    the requests are prepared; these endpoints are stateless. Send them
+    with send_prepared(). Only requests sessions support this; other
+    session types get an empty mapping and use get() as usual.
+    """
+    if not isinstance(session, requests.Session):
+        return {}
+    return {endpoint: session.prepare_request(requests.Request('GET', url, params=params))
+            for endpoint, url in urls.items()}
+
+
+def send_prepared(session: requests.Session, prepped: requests.PreparedRequest,
+                  timeout: float, stream: bool = False) -> requests.Response:
+    """
+    Send a request built by prepare_requests().
+    
+    Session.send() skips the environment merge done by Session.request(),
+    so proxies, CA bundle and verify/cert settings (session attributes and
+    HTTP(S)_PROXY / REQUESTS_CA_BUNDLE) are merged here on each call.
+    """
+    settings = session.merge_environment_settings(prepped.url, {}, stream, None, None)
+    return session.send(prepped, timeout=timeout, **settings)
+
+
+# Async fan-out sizing: total open connections, DNS cache TTL and idle
+# keep-alive (seconds), and default number of in-flight requests per client.
+ASYNC_POOL_LIMIT = 64
+ASYNC_DNS_TTL = 300
+ASYNC_KEEPALIVE_TIMEOUT = 75
+DEFAULT_CONCURRENCY = 8
+
+# Response cache for immutable endpoints (blocks by hash, confirmed
+# transactions, and height lookups once REORG_SAFE_DEPTH below the tip)
+RESPONSE_CACHE_SIZE = 10_000
+RESPONSE_CACHE_TTL = 3600
+
+# Retry backoff: base * 2**attempt seconds, capped, with +/-50% jitter so
+# workers sharing a provider do not retry in lockstep
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+# Consecutive 5xx/429/transport failures before requests fast-fail, and
+# how long (seconds) they do so before a trial request is let through
+BREAKER_FAIL_MAX = 5
+BREAKER_RESET_TIMEOUT = 60.0
+
+# Seconds a polled chain height is reused before /latestblock is hit again
+HEIGHT_CACHE_TTL = 30
+
+# Blockchain.info /multiaddr accepts at most this many addresses per call
+MULTIADDR_MAX_ADDRESSES = 100
+
+# Shared read-only default for nested lookups in the normalization loops,
+# so a missing key does not allocate a fresh dict per input
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def create_async_session(headers: Optional[Dict[str, str]] = None,
+                         timeout: float = 30) -> aiohttp.ClientSession:
+    """Create a keep-alive aiohttp session for concurrent fetches."""
+    connector = aiohttp.TCPConnector(
+        limit=ASYNC_POOL_LIMIT,
+        ttl_dns_cache=ASYNC_DNS_TTL,
+        keepalive_timeout=ASYNC_KEEPALIVE_TIMEOUT
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        headers=dict(headers) if headers else None
+    )
+
+
+async def gather_results(coros: Iterable[Awaitable[Any]]) -> List[Any]:
+    """
+    Run coroutines concurrently, keeping results in input order.
+
+    Failed calls are returned as exception instances rather than aborting the
+    whole batch, so one bad hash does not discard the other N-1 results.
+    """
+    return await asyncio.gather(*coros, return_exceptions=True)
+
+
+def _cache_key(endpoint: str, params: Optional[Dict] = None) -> Hashable:
+    """Cache key for an endpoint and its query parameters."""
+    return (endpoint, tuple(sorted(params.items())) if params else ())
+
+
+# Block hashes / txids as hex strings or raw bytes (in display byte order)
+HashLike = Union[str, bytes, bytearray, memoryview]
+
+
+def _hex(value: HashLike) -> str:
+    """Return a hash as the hex string used in URL paths."""
+    return value if isinstance(value, str) else value.hex()
+
+
+def _is_json_object(result: Any) -> bool:
+    """Cache any decoded JSON object (not plain-text fallbacks)."""
+    return isinstance(result, dict) and "raw" not in result
+
+
+def _is_confirmed_tx(result: Any) -> bool:
+    """Blockchain.info transactions are immutable once they have a block height."""
+    return _is_json_object(result) and result.get("block_height") is not None
+
+
+def _is_confirmed_mempool_tx(result: Any) -> bool:
+    """Mempool.space transactions are immutable once confirmed."""
+    return isinstance(result, dict) and bool(result.get("status", {}).get("confirmed"))
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    """Yield consecutive slices of `items` of at most `size` elements."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff for retry `attempt` (0-based)."""
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def _retry_after_delay(headers: Mapping[str, str]) -> float:
+    """Honor Retry-After on a 429, spreading waiters over the following half."""
+    return int(headers.get('Retry-After', 30)) * random.uniform(1.0, 1.5)
+
+
+def _read_stream(response: requests.Response) -> bytes:
+    """
+    Read a streamed body in one call.
+    
+    urllib3 errors raised mid-body are mapped to the requests exceptions
+    requests itself raises from iter_content(), so they stay transport errors.
+    """
+    try:
+        return response.raw.read(decode_content=True)
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e)
+    except DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e)
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e)
+    except SSLError as e:
+        raise requests.exceptions.SSLError(e)
+
+
+def _is_provider_fault(error: BaseException) -> bool:
+    """True for transport errors and 5xx responses, False for client errors like 404."""
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None) or getattr(error, "status", None)
+    return status is None or status >= 500
+
+
+def _block_summaries(response: Any) -> List[Dict[str, Any]]:
+    """Extract block summaries from a /blocks/{ts} response (list or {"blocks": [...]})."""
+    if isinstance(response, dict):
+        return response.get("blocks", [])
+    return response if isinstance(response, list) else []
+
+
+def _placeholder_block(height: int, block_hash: str, error: str) -> Dict[str, Any]:
+    """Minimal block structure returned when a block cannot be fetched."""
+    return {
+        "height": height,
+        "hash": block_hash,
+        "time": 0,
+        "n_tx": 0,
+        "tx": [],
+        "size": 0,
+        "error": error
+    }
+
+
 class BlockchainInfoClient:
     """
     Blockchain.info API client for fetching Bitcoin blockchain data.
@@ -38,32 +337,73 @@ class BlockchainInfoClient:
     
     BASE_URL = "https://blockchain.info"
     
+    # Endpoints without path arguments; their full URLs are built once
+    CONSTANT_ENDPOINTS = ("/latestblock", "/unconfirmed-transactions", "/balance",
+                          "/multiaddr", "/unspent", "/stats")
+    
+    __slots__ = (
+        "api_key", "rate_limit_delay", "max_retries", "timeout",
+        "_headers", "session", "_urls", "_key_params", "_prepped",
+        "_bucket", "_cache", "_breaker", "_height_cache", "_tip_height",
+        "_concurrency", "_async_session", "_async_loop", "_request_slots",
+    )
+    
     def __init__(self, 
                  api_key: Optional[str] = None,
                  rate_limit_delay: float = 1.0,
                  max_retries: int = 3,
-                 timeout: int = 30):
+                 timeout: int = 30,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 burst: int = 1,
+                 cache_size: int = RESPONSE_CACHE_SIZE,
+                 http2: bool = False):
         """
         Initialize Blockchain.info API client.
         
         Args:
             api_key: Optional API key for higher rate limits
-            rate_limit_delay: Delay between requests in seconds
+            rate_limit_delay: Average delay between requests in seconds
+            burst: Requests allowed back-to-back before rate_limit_delay applies
             max_retries: Maximum retry attempts
             timeout: Request timeout in seconds
+            concurrency: Maximum in-flight requests for the async (aget_*) methods
+            cache_size: Maximum cached responses for immutable endpoints (0 disables)
+            http2: Use an HTTP/2 session for sync requests when h2 is installed
         """
         self.api_key = api_key
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
         self.timeout = timeout
         
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._headers = {
             'User-Agent': 'OnChain-Collector/1.0.0',
-            'Accept': 'application/json'
-        })
+            'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING
+        }
+        self.session = create_session(self._headers, http2=http2, retries=max_retries - 1)
+        
+        self._urls = {e: self.BASE_URL + e for e in self.CONSTANT_ENDPOINTS}
+        self._key_params = {'api_code': api_key} if api_key else None
+        self._prepped = prepare_requests(self.session, self._urls, self._key_params)
+        
+        self._bucket = TokenBucket.from_interval(rate_limit_delay, burst)
+        self._cache = TTLCache(maxsize=cache_size, ttl=RESPONSE_CACHE_TTL)
+        self._breaker = CircuitBreaker("blockchain_info",
+                                       fail_max=BREAKER_FAIL_MAX,
+                                       reset_timeout=BREAKER_RESET_TIMEOUT)
         
-        self._last_request_time = 0
+        # (height, monotonic time fetched) of the last /latestblock response
+        self._height_cache: Tuple[int, float] = (0, 0.0)
+        
+        # Highest height seen; height lookups are cached only well below it
+        self._tip_height = 0
+        
+        # Async session and semaphore are created lazily inside the running
+        # event loop (and recreated if a later call runs on a different loop)
+        self._concurrency = concurrency
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request_slots: Optional[asyncio.Semaphore] = None
         
         logger.info("Blockchain.info API client initialized",
                    has_api_key=bool(api_key),
@@ -71,44 +411,152 @@ class BlockchainInfoClient:
     
     def _rate_limit(self):
         """Apply rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+        self._bucket.acquire()
     
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make API request with retry logic."""
-        url = f"{self.BASE_URL}{endpoint}"
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None,
+                      stream: bool = False) -> Dict[str, Any]:
+        """
+        Make API request with retry logic.
         
-        if params is None:
-            params = {}
+        Transport errors and RETRY_STATUSES responses are retried inside the
+        session (see create_session), so a single call is made here and a
+        429 still seen afterwards means the retries are spent.
         
-        # Add API key if available
+        With `stream=True` (multi-MB payloads such as /rawblock) the body is
+        read off the socket in one call and handed to orjson as bytes, rather
+        than being assembled by requests from 10 KB chunks.
+        """
+        url = self._urls.get(endpoint) or self.BASE_URL + endpoint
+        prepped = None if params else self._prepped.get(endpoint)
+        
+        # Add API key if available (without mutating the caller's params)
         if self.api_key:
-            params['api_code'] = self.api_key
+            params = {**params, 'api_code': self.api_key} if params else self._key_params
+        
+        # httpx sessions always buffer the body; only requests streams here
+        stream = stream and isinstance(self.session, requests.Session)
+        get_kwargs = {'stream': True} if stream else {}
+        
+        if not self._breaker.allow():
+            raise BlockchainAPIError(f"Circuit open, skipping request to {endpoint}")
+        
+        try:
+            self._rate_limit()
+            
+            if prepped is not None:
+                response = send_prepared(self.session, prepped, self.timeout, stream=stream)
+            else:
+                response = self.session.get(url, params=params, timeout=self.timeout, **get_kwargs)
+            
+            # Handle rate limiting
+            if response.status_code == 429:
+                response.close()
+                self._breaker.record_failure()
+                raise BlockchainAPIError(f"Rate limited on {endpoint} after {self.max_retries} attempts")
+            
+            try:
+                response.raise_for_status()
+                body = _read_stream(response) if stream else response.content
+            finally:
+                response.close()
+            
+        except REQUEST_ERRORS as e:
+            if _is_provider_fault(e):
+                self._breaker.record_failure(e)
+            
+            logger.warning("API request failed",
+                         endpoint=endpoint,
+                         error=str(e))
+            raise BlockchainAPIError(f"Request failed after {self.max_retries} attempts: {e}")
+        
+        self._breaker.record_success()
+        
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # Some endpoints return plain text
+            return {"raw": body.decode(errors="replace")}
+    
+    def _cached_request(self, endpoint: str, params: Optional[Dict] = None,
+                        keep: Callable[[Any], bool] = _is_json_object,
+                        stream: bool = False) -> Any:
+        """_make_request for immutable endpoints; results passing `keep` are cached."""
+        key = _cache_key(endpoint, params)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._make_request(endpoint, params, stream=stream)
+        if keep(result):
+            self._cache.set(key, result)
+        return result
+    
+    # ==================== Async Requests ====================
+    
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session used by the aget_* methods."""
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            if self._async_session is not None:
+                await close_stale_session(self._async_session, self._async_loop)
+            self._async_session = create_async_session(self._headers, self.timeout)
+            self._request_slots = asyncio.Semaphore(self._concurrency)
+            self._async_loop = loop
+        return self._async_session
+    
+    async def aclose(self):
+        """Close the async session."""
+        if self._async_session and not self._async_session.closed:
+            await self._async_session.close()
+    
+    async def _arate_limit(self):
+        """Async counterpart of _rate_limit; shares the same token bucket."""
+        await self._bucket.aacquire()
+    
+    async def _amake_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make async API request with retry logic, bounded by the concurrency cap."""
+        url = self._urls.get(endpoint) or self.BASE_URL + endpoint
+        
+        if self.api_key:
+            params = {**params, 'api_code': self.api_key} if params else self._key_params
+        
+        session = await self._get_async_session()
         
         for attempt in range(self.max_retries):
+            if not self._breaker.allow():
+                raise BlockchainAPIError(f"Circuit open, skipping request to {endpoint}")
+            
             try:
-                self._rate_limit()
+                async with self._request_slots:
+                    await self._arate_limit()
+                    
+                    async with session.get(url, params=params) as response:
+                        if response.status == 429:
+                            wait_time = _retry_after_delay(response.headers)
+                            body = None
+                        else:
+                            response.raise_for_status()
+                            body = await response.read()
                 
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                
-                # Handle rate limiting
-                if response.status_code == 429:
-                    wait_time = int(response.headers.get('Retry-After', 30))
-                    logger.warning("Rate limited, waiting", wait_time=wait_time)
-                    time.sleep(wait_time)
+                # Sleep outside the semaphore so other requests keep flowing
+                if body is None:
+                    self._breaker.record_failure()
+                    logger.warning("Rate limited, waiting", wait_time=round(wait_time, 1))
+                    await asyncio.sleep(wait_time)
                     continue
                 
-                response.raise_for_status()
+                self._breaker.record_success()
                 
-                return response.json()
+                try:
+                    return orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    # Some endpoints return plain text
+                    return {"raw": body.decode(errors="replace")}
                 
-            except requests.exceptions.JSONDecodeError:
-                # Some endpoints return plain text
-                return {"raw": response.text}
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if _is_provider_fault(e):
+                    self._breaker.record_failure(e)
                 
-            except requests.RequestException as e:
                 logger.warning("API request failed",
                              endpoint=endpoint,
                              attempt=attempt + 1,
@@ -117,10 +565,23 @@ class BlockchainInfoClient:
                 if attempt == self.max_retries - 1:
                     raise BlockchainAPIError(f"Request failed after {self.max_retries} attempts: {e}")
                 
-                time.sleep(2 ** attempt)  # Exponential backoff
+                await asyncio.sleep(_backoff_delay(attempt))
         
         raise BlockchainAPIError("Unexpected error in API request")
     
+    async def _acached_request(self, endpoint: str, params: Optional[Dict] = None,
+                               keep: Callable[[Any], bool] = _is_json_object) -> Any:
+        """Async counterpart of _cached_request; shares the same cache."""
+        key = _cache_key(endpoint, params)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = await self._amake_request(endpoint, params)
+        if keep(result):
+            self._cache.set(key, result)
+        return result
+    
     # ==================== Block Methods ====================
     
     def get_latest_block(self) -> Dict[str, Any]:
@@ -136,66 +597,60 @@ class BlockchainInfoClient:
                 "txIndexes": [...]
             }
         """
-        return self._make_request("/latestblock")
+        latest = self._make_request("/latestblock")
+        self._height_cache = (latest.get("height", 0), time.monotonic())
+        self._tip_height = max(self._tip_height, self._height_cache[0])
+        return latest
     
     def get_block_height(self) -> int:
-        """Get current blockchain height."""
-        latest = self.get_latest_block()
-        return latest.get("height", 0)
+        """
+        Get current blockchain height.
+        
+        /latestblock carries the full txIndexes list, so polls within
+        HEIGHT_CACHE_TTL seconds of the last fetch reuse its height.
+        """
+        height, fetched_at = self._height_cache
+        if height and time.monotonic() - fetched_at < HEIGHT_CACHE_TTL:
+            return height
+        
+        return self.get_latest_block().get("height", 0)
+    
+    def _keep_height_lookup(self, height: int, response: Any) -> bool:
+        """keep() for /block-height: cache found blocks only once buried below the tip."""
+        if not (_is_json_object(response) and response.get("blocks")):
+            return False
+        self._tip_height = max(self._tip_height, height)
+        return height <= self._tip_height - REORG_SAFE_DEPTH
     
-    def get_block_by_hash(self, block_hash: str) -> Dict[str, Any]:
+    def get_block_by_hash(self, block_hash: HashLike) -> Dict[str, Any]:
         """
-        Get full block data by hash.
+        Get full block data by hash (hex string or raw bytes).
         
         Returns block with all transactions.
         """
-        return self._make_request(f"/rawblock/{block_hash}")
+        return self._cached_request(f"/rawblock/{_hex(block_hash)}", stream=True)
     
     def get_block_by_height(self, height: int) -> Dict[str, Any]:
         """
         Get block data by height.
         
-        Note: This requires getting hash first, then block data.
+        The block-height endpoint serves every height including the tip, so no
+        /latestblock lookup is needed first.
         """
-        # Try getting block directly via rawblock endpoint with height
         try:
-            # First try: get latest block and work backwards if needed
-            latest = self.get_latest_block()
-            latest_height = latest.get("height", 0)
-            
-            if height == latest_height:
-                # Get the latest block by hash
-                return self.get_block_by_hash(latest.get("hash"))
+            response = self._cached_request(f"/block-height/{height}", {"format": "json"},
+                                            keep=lambda r: self._keep_height_lookup(height, r))
             
-            # For other heights, try block-height endpoint
-            response = self._make_request(f"/block-height/{height}", {"format": "json"})
-            
-            if isinstance(response, dict) and "blocks" in response and len(response["blocks"]) > 0:
+            if isinstance(response, dict) and response.get("blocks"):
                 return response["blocks"][0]
             
             # If block-height fails, return a minimal block structure
             # This happens when API has rate limits or issues
-            return {
-                "height": height,
-                "hash": f"unknown_at_{height}",
-                "time": 0,
-                "n_tx": 0,
-                "tx": [],
-                "size": 0,
-                "error": "Could not fetch full block data"
-            }
+            return _placeholder_block(height, f"unknown_at_{height}", "Could not fetch full block data")
             
         except Exception as e:
             # Return minimal structure instead of raising
-            return {
-                "height": height,
-                "hash": f"error_at_{height}",
-                "time": 0,
-                "n_tx": 0,
-                "tx": [],
-                "size": 0,
-                "error": str(e)
-            }
+            return _placeholder_block(height, f"error_at_{height}", str(e))
     
     def get_blocks_for_day(self, timestamp_ms: int) -> List[Dict[str, Any]]:
         """
@@ -206,11 +661,69 @@ class BlockchainInfoClient:
         """
         return self._make_request(f"/blocks/{timestamp_ms}", {"format": "json"})
     
+    def iter_blocks_for_day(self, timestamp_ms: int) -> Iterator[Tuple[str, int]]:
+        """Yield (hash, height) for each block of the day, without keeping the payload."""
+        for summary in _block_summaries(self.get_blocks_for_day(timestamp_ms)):
+            yield summary["hash"], summary.get("height")
+    
+    async def aiter_blocks_for_day(self, timestamp_ms: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch every full block of a day, yielding each one as soon as it arrives.
+        
+        All /rawblock fetches are scheduled as soon as the summary list is
+        decoded (bounded by the concurrency cap and rate limit), so the first
+        block is available after one round-trip rather than after the whole
+        day has been fetched. Blocks are yielded in completion order; blocks
+        that fail to fetch are logged and skipped.
+        """
+        response = await self._amake_request(f"/blocks/{timestamp_ms}", {"format": "json"})
+        tasks = [asyncio.ensure_future(self.aget_block_by_hash(summary["hash"]))
+                 for summary in _block_summaries(response)]
+        
+        try:
+            for next_block in asyncio.as_completed(tasks):
+                try:
+                    yield await next_block
+                except BlockchainAPIError as e:
+                    logger.warning("Failed to fetch block for day", timestamp_ms=timestamp_ms, error=str(e))
+        finally:
+            # Consumer stopped early: drop the fetches still queued
+            for task in tasks:
+                task.cancel()
+    
+    async def aget_latest_block(self) -> Dict[str, Any]:
+        """Async variant of get_latest_block."""
+        latest = await self._amake_request("/latestblock")
+        self._tip_height = max(self._tip_height, latest.get("height", 0))
+        return latest
+    
+    async def aget_block_by_hash(self, block_hash: HashLike) -> Dict[str, Any]:
+        """Async variant of get_block_by_hash."""
+        return await self._acached_request(f"/rawblock/{_hex(block_hash)}")
+    
+    async def aget_block_by_height(self, height: int) -> Dict[str, Any]:
+        """Async variant of get_block_by_height."""
+        try:
+            response = await self._acached_request(f"/block-height/{height}", {"format": "json"},
+                                                   keep=lambda r: self._keep_height_lookup(height, r))
+            
+            if isinstance(response, dict) and response.get("blocks"):
+                return response["blocks"][0]
+            
+            return _placeholder_block(height, f"unknown_at_{height}", "Could not fetch full block data")
+            
+        except Exception as e:
+            return _placeholder_block(height, f"error_at_{height}", str(e))
+    
+    async def aget_blocks_by_height(self, heights: Iterable[int]) -> List[Dict[str, Any]]:
+        """Fetch several blocks concurrently, in the order of `heights`."""
+        return await gather_results(self.aget_block_by_height(h) for h in heights)
+    
     # ==================== Transaction Methods ====================
     
-    def get_transaction(self, tx_hash: str) -> Dict[str, Any]:
+    def get_transaction(self, tx_hash: HashLike) -> Dict[str, Any]:
         """
-        Get transaction by hash.
+        Get transaction by hash (hex string or raw bytes).
         
         Returns:
             {
@@ -225,12 +738,24 @@ class BlockchainInfoClient:
                 "out": [...]
             }
         """
-        return self._make_request(f"/rawtx/{tx_hash}")
+        return self._cached_request(f"/rawtx/{_hex(tx_hash)}", keep=_is_confirmed_tx)
     
     def get_unconfirmed_transactions(self) -> List[Dict[str, Any]]:
         """Get latest unconfirmed transactions (mempool)."""
         return self._make_request("/unconfirmed-transactions", {"format": "json"})
     
+    async def aget_transaction(self, tx_hash: HashLike) -> Dict[str, Any]:
+        """Async variant of get_transaction."""
+        return await self._acached_request(f"/rawtx/{_hex(tx_hash)}", keep=_is_confirmed_tx)
+    
+    async def aget_transactions(self, tx_hashes: Iterable[HashLike]) -> List[Any]:
+        """
+        Fetch several transactions concurrently.
+        
+        Returns results in input order; failed lookups are exception instances.
+        """
+        return await gather_results(self.aget_transaction(h) for h in tx_hashes)
+    
     # ==================== Address Methods ====================
     
     def get_address(self, address: str, 
@@ -271,7 +796,7 @@ class BlockchainInfoClient:
                 "total_received": 1000000000
             }
         """
-        return self._make_request(f"/balance", {"active": address})
+        return self._make_request("/balance", {"active": address})
     
     def get_multi_address(self, addresses: List[str]) -> Dict[str, Any]:
         """
@@ -280,13 +805,31 @@ class BlockchainInfoClient:
         Args:
             addresses: List of Bitcoin addresses (max 100)
         """
-        if len(addresses) > 100:
-            raise BlockchainAPIError("Maximum 100 addresses per request")
+        if len(addresses) > MULTIADDR_MAX_ADDRESSES:
+            raise BlockchainAPIError(f"Maximum {MULTIADDR_MAX_ADDRESSES} addresses per request")
         
         return self._make_request("/multiaddr", {
             "active": "|".join(addresses)
         })
     
+    def get_balances(self, addresses: Iterable[str]) -> Dict[str, int]:
+        """
+        Get final balances (satoshis) for any number of addresses.
+        
+        Batches through /multiaddr, 100 addresses per request, instead of one
+        request per address.
+        
+        Returns:
+            {address: final_balance}
+        """
+        balances = {}
+        for chunk in _chunks(list(addresses), MULTIADDR_MAX_ADDRESSES):
+            response = self.get_multi_address(chunk)
+            for entry in response.get("addresses", []):
+                balances[entry["address"]] = entry.get("final_balance", 0)
+        
+        return balances
+    
     def get_address_unspent(self, address: str) -> List[Dict[str, Any]]:
         """
         Get unspent outputs (UTXOs) for an address.
@@ -301,7 +844,20 @@ class BlockchainInfoClient:
                 }
             ]
         """
-        return self._make_request(f"/unspent", {"active": address})
+        return self._make_request("/unspent", {"active": address})
+    
+    async def aget_address(self, address: str,
+                           limit: int = 50,
+                           offset: int = 0) -> Dict[str, Any]:
+        """Async variant of get_address."""
+        return await self._amake_request(f"/rawaddr/{address}", {
+            "limit": limit,
+            "offset": offset
+        })
+    
+    async def aget_address_unspent(self, address: str) -> List[Dict[str, Any]]:
+        """Async variant of get_address_unspent."""
+        return await self._amake_request("/unspent", {"active": address})
     
     # ==================== Charts & Stats Methods ====================
     
@@ -360,6 +916,8 @@ class BlockchainInfoClient:
         
         Makes it compatible with existing btc_collector processing.
         """
+        raw_txs = raw_block.get("tx", [])
+        
         return {
             "hash": raw_block.get("hash"),
             "height": raw_block.get("height"),
@@ -371,49 +929,58 @@ class BlockchainInfoClient:
             "nonce": raw_block.get("nonce"),
             "size": raw_block.get("size"),
             "weight": raw_block.get("weight", raw_block.get("size", 0) * 4),
-            "tx": [self.convert_to_normalized_tx(tx) for tx in raw_block.get("tx", [])],
-            "nTx": raw_block.get("n_tx", len(raw_block.get("tx", [])))
+            "tx": list(map(self.convert_to_normalized_tx, raw_txs)),
+            "nTx": raw_block.get("n_tx", len(raw_txs))
         }
     
     def convert_to_normalized_tx(self, raw_tx: Dict[str, Any]) -> Dict[str, Any]:
         """
         Convert Blockchain.info transaction format to normalized format.
         """
-        # Convert inputs
-        vin = []
-        for inp in raw_tx.get("inputs", []):
-            prev_out = inp.get("prev_out", {})
-            vin.append({
+        # Convert inputs. Comprehensions run for every tx in a block; the
+        # single-element `for x in [expr]` is compiled to a plain assignment.
+        vin = [
+            {
                 "txid": prev_out.get("tx_index"),
                 "vout": prev_out.get("n"),
                 "scriptSig": {"hex": inp.get("script", "")},
                 "sequence": inp.get("sequence", 0xffffffff),
-                "value": prev_out.get("value", 0) / 100000000  # satoshi to BTC
-            })
+                "value_sat": prev_out.get("value", 0)
+            }
+            for inp in raw_tx.get("inputs", ())
+            for prev_out in [inp.get("prev_out", _EMPTY)]
+        ]
         
         # Convert outputs
-        vout = []
-        for out in raw_tx.get("out", []):
-            vout.append({
-                "value": out.get("value", 0) / 100000000,  # satoshi to BTC
+        vout = [
+            {
+                "value_sat": out.get("value", 0),
                 "n": out.get("n"),
                 "scriptPubKey": {
                     "hex": out.get("script", ""),
-                    "addresses": [out.get("addr")] if out.get("addr") else []
+                    "addresses": [addr] if addr else []
                 }
-            })
+            }
+            for out in raw_tx.get("out", ())
+            for addr in [out.get("addr")]
+        ]
+        
+        tx_hash = raw_tx.get("hash")
+        size = raw_tx.get("size")
+        weight = raw_tx.get("weight")
+        fee = raw_tx.get("fee")
         
         return {
-            "txid": raw_tx.get("hash"),
-            "hash": raw_tx.get("hash"),
+            "txid": tx_hash,
+            "hash": tx_hash,
             "version": raw_tx.get("ver"),
-            "size": raw_tx.get("size"),
-            "vsize": raw_tx.get("size"),  # Approximation
-            "weight": raw_tx.get("weight", raw_tx.get("size", 0) * 4),
+            "size": size,
+            "vsize": size,  # Approximation
+            "weight": weight if weight is not None else (size or 0) * 4,
             "locktime": raw_tx.get("lock_time", 0),
             "vin": vin,
             "vout": vout,
-            "fee": raw_tx.get("fee", 0) / 100000000 if raw_tx.get("fee") else 0
+            "fee_sat": fee or 0
         }
 
 
@@ -436,65 +1003,232 @@ class MempoolSpaceClient:
     
     BASE_URL = "https://mempool.space/api"
     
-    def __init__(self, base_url: str = None, timeout: int = 30, rate_limit_delay: float = 0.1):
+    # Endpoints without path arguments; their full URLs are built once
+    CONSTANT_ENDPOINTS = ("/blocks/tip/height", "/blocks", "/mempool", "/mempool/txids",
+                          "/mempool/recent", "/v1/fees/recommended",
+                          "/v1/fees/mempool-blocks", "/v1/difficulty-adjustment")
+    
+    __slots__ = (
+        "base_url", "_urls", "_prepped", "timeout", "rate_limit_delay", "max_retries",
+        "_headers", "session", "_bucket", "_cache", "_tip_height",
+        "_concurrency", "_async_session", "_async_loop", "_request_slots",
+    )
+    
+    def __init__(self, base_url: str = None, timeout: int = 30, rate_limit_delay: float = 0.1,
+                 concurrency: int = DEFAULT_CONCURRENCY, burst: int = 10,
+                 cache_size: int = RESPONSE_CACHE_SIZE, http2: bool = False,
+                 max_retries: int = 3):
         self.base_url = base_url or self.BASE_URL
+        self._urls = {e: self.base_url + e for e in self.CONSTANT_ENDPOINTS}
         self.timeout = timeout
         self.rate_limit_delay = rate_limit_delay
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'OnChain-Collector/1.0.0'
-        })
-        self._last_request_time = 0
+        self.max_retries = max_retries
+        self._headers = {
+            'User-Agent': 'OnChain-Collector/1.0.0',
+            'Accept-Encoding': ACCEPT_ENCODING
+        }
+        self.session = create_session(self._headers, http2=http2, retries=max_retries - 1)
+        self._prepped = prepare_requests(self.session, self._urls)
+        self._bucket = TokenBucket.from_interval(rate_limit_delay, burst)
+        self._cache = TTLCache(maxsize=cache_size, ttl=RESPONSE_CACHE_TTL)
+        
+        # Highest height seen; height lookups are cached only well below it
+        self._tip_height = 0
+        
+        # Async session and semaphore are created lazily inside the running
+        # event loop (and recreated if a later call runs on a different loop)
+        self._concurrency = concurrency
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request_slots: Optional[asyncio.Semaphore] = None
         
         logger.info("Mempool.space API client initialized",
                    base_url=self.base_url,
-                   rate_limit_delay=rate_limit_delay)
+                   rate_limit_delay=rate_limit_delay,
+                   burst=burst)
     
     def _rate_limit(self):
         """Apply rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self._last_request_time = time.time()
+        self._bucket.acquire()
     
     def _get(self, endpoint: str) -> Any:
         """Make GET request with rate limiting."""
         self._rate_limit()
-        response = self.session.get(f"{self.base_url}{endpoint}", timeout=self.timeout)
+        prepped = self._prepped.get(endpoint)
+        if prepped is not None:
+            response = send_prepared(self.session, prepped, self.timeout)
+        else:
+            response = self.session.get(self._urls.get(endpoint) or self.base_url + endpoint,
+                                        timeout=self.timeout)
         response.raise_for_status()
         
         # Handle plain text responses
         content_type = response.headers.get('content-type', '')
         if 'application/json' in content_type:
-            return response.json()
+            return orjson.loads(response.content)
         return response.text
     
+    def _cached_get(self, endpoint: str, keep: Callable[[Any], bool] = bool) -> Any:
+        """_get for immutable endpoints; results passing `keep` are cached."""
+        key = _cache_key(endpoint)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._get(endpoint)
+        if keep(result):
+            self._cache.set(key, result)
+        return result
+    
+    # ==================== Async Requests ====================
+    
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session used by the aget_* methods."""
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            if self._async_session is not None:
+                await close_stale_session(self._async_session, self._async_loop)
+            self._async_session = create_async_session(self._headers, self.timeout)
+            self._request_slots = asyncio.Semaphore(self._concurrency)
+            self._async_loop = loop
+        return self._async_session
+    
+    async def aclose(self):
+        """Close the async session."""
+        if self._async_session and not self._async_session.closed:
+            await self._async_session.close()
+    
+    async def _arate_limit(self):
+        """Async counterpart of _rate_limit; shares the same token bucket."""
+        await self._bucket.aacquire()
+    
+    async def _aget(self, endpoint: str) -> Any:
+        """Make async GET request with rate limiting, bounded by the concurrency cap."""
+        session = await self._get_async_session()
+        
+        async with self._request_slots:
+            await self._arate_limit()
+            url = self._urls.get(endpoint) or self.base_url + endpoint
+            async with session.get(url) as response:
+                response.raise_for_status()
+                
+                # Handle plain text responses
+                if 'application/json' in response.content_type:
+                    return orjson.loads(await response.read())
+                return await response.text()
+    
+    def _run_batch(self, batch: Awaitable[List[Any]], kind: str) -> List[Any]:
+        """Run an async batch to completion on a private event loop."""
+        async def run():
+            try:
+                return await batch
+            finally:
+                await self.aclose()
+        
+        results = asyncio.run(run())
+        
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.warning("Batch fetch failed", kind=kind, index=index, error=str(result))
+                results[index] = None
+        
+        return results
+    
+    async def _acached_get(self, endpoint: str, keep: Callable[[Any], bool] = bool) -> Any:
+        """Async counterpart of _cached_get; shares the same cache."""
+        key = _cache_key(endpoint)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = await self._aget(endpoint)
+        if keep(result):
+            self._cache.set(key, result)
+        return result
+    
     # ==================== Block Methods ====================
     
     def get_block_height(self) -> int:
         """Get current block height."""
-        return int(self._get("/blocks/tip/height"))
+        height = int(self._get("/blocks/tip/height"))
+        self._tip_height = max(self._tip_height, height)
+        return height
+    
+    def _keep_height_lookup(self, height: int, block_hash: Any) -> bool:
+        """keep() for /block-height: cache hashes only once buried below the tip."""
+        if not block_hash:
+            return False
+        self._tip_height = max(self._tip_height, height)
+        return height <= self._tip_height - REORG_SAFE_DEPTH
     
     def get_block_hash(self, height: int) -> str:
         """Get block hash at specific height."""
-        return self._get(f"/block-height/{height}")
+        return self._cached_get(f"/block-height/{height}",
+                                keep=lambda h: self._keep_height_lookup(height, h))
     
-    def get_block(self, block_hash: str) -> Dict[str, Any]:
-        """Get block by hash."""
-        return self._get(f"/block/{block_hash}")
+    def get_block(self, block_hash: HashLike) -> Dict[str, Any]:
+        """Get block by hash (hex string or raw bytes)."""
+        return self._cached_get(f"/block/{_hex(block_hash)}")
     
     def get_block_by_height(self, height: int) -> Dict[str, Any]:
         """Get block by height (convenience method)."""
         block_hash = self.get_block_hash(height)
         return self.get_block(block_hash)
     
-    def get_block_txids(self, block_hash: str) -> List[str]:
+    async def aget_block_hash(self, height: int) -> str:
+        """Async variant of get_block_hash."""
+        return await self._acached_get(f"/block-height/{height}",
+                                       keep=lambda h: self._keep_height_lookup(height, h))
+    
+    async def aget_block(self, block_hash: HashLike) -> Dict[str, Any]:
+        """Async variant of get_block."""
+        return await self._acached_get(f"/block/{_hex(block_hash)}")
+    
+    async def aget_block_by_height(self, height: int) -> Dict[str, Any]:
+        """Async variant of get_block_by_height."""
+        block_hash = await self.aget_block_hash(height)
+        return await self.aget_block(block_hash)
+    
+    async def aget_blocks_by_height(self, heights: Iterable[int]) -> List[Any]:
+        """
+        Fetch several blocks concurrently.
+        
+        Returns results in input order; failed lookups are exception instances.
+        """
+        return await gather_results(self.aget_block_by_height(h) for h in heights)
+    
+    async def aget_blocks(self, block_hashes: Iterable[HashLike]) -> List[Any]:
+        """
+        Fetch several blocks by hash concurrently.
+        
+        Returns results in input order; failed lookups are exception instances.
+        """
+        return await gather_results(self.aget_block(h) for h in block_hashes)
+    
+    def get_blocks_batch(self, block_hashes: Iterable[HashLike]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch several blocks by hash concurrently from synchronous code.
+        
+        Mempool.space has no batch endpoint, so the requests are issued
+        concurrently over the keep-alive pool instead (bounded by the
+        concurrency cap and rate limit). Must not be called from a running
+        event loop; use aget_blocks there.
+        
+        Returns results in input order, with None for blocks that failed.
+        """
+        return self._run_batch(self.aget_blocks(block_hashes), "block")
+    
+    def get_block_txids(self, block_hash: HashLike) -> List[str]:
         """Get all transaction IDs in a block."""
-        return self._get(f"/block/{block_hash}/txids")
+        return self._get(f"/block/{_hex(block_hash)}/txids")
     
-    def get_block_txs(self, block_hash: str, start_index: int = 0) -> List[Dict[str, Any]]:
+    def get_block_txs(self, block_hash: HashLike, start_index: int = 0) -> List[Dict[str, Any]]:
         """Get block transactions (25 at a time)."""
-        return self._get(f"/block/{block_hash}/txs/{start_index}")
+        return self._get(f"/block/{_hex(block_hash)}/txs/{start_index}")
+    
+    async def aget_block_txs(self, block_hash: HashLike, start_index: int = 0) -> List[Dict[str, Any]]:
+        """Async variant of get_block_txs."""
+        return await self._aget(f"/block/{_hex(block_hash)}/txs/{start_index}")
     
     def get_blocks(self, start_height: int = None) -> List[Dict[str, Any]]:
         """Get latest 10 blocks (or from specific height)."""
@@ -504,17 +1238,38 @@ class MempoolSpaceClient:
     
     # ==================== Transaction Methods ====================
     
-    def get_transaction(self, txid: str) -> Dict[str, Any]:
-        """Get transaction by ID."""
-        return self._get(f"/tx/{txid}")
+    def get_transaction(self, txid: HashLike) -> Dict[str, Any]:
+        """Get transaction by ID (hex string or raw bytes)."""
+        return self._cached_get(f"/tx/{_hex(txid)}", keep=_is_confirmed_mempool_tx)
     
-    def get_transaction_hex(self, txid: str) -> str:
+    def get_transaction_hex(self, txid: HashLike) -> str:
         """Get raw transaction hex."""
-        return self._get(f"/tx/{txid}/hex")
+        return self._get(f"/tx/{_hex(txid)}/hex")
     
-    def get_transaction_status(self, txid: str) -> Dict[str, Any]:
+    def get_transaction_status(self, txid: HashLike) -> Dict[str, Any]:
         """Get transaction confirmation status."""
-        return self._get(f"/tx/{txid}/status")
+        return self._get(f"/tx/{_hex(txid)}/status")
+    
+    async def aget_transaction(self, txid: HashLike) -> Dict[str, Any]:
+        """Async variant of get_transaction."""
+        return await self._acached_get(f"/tx/{_hex(txid)}", keep=_is_confirmed_mempool_tx)
+    
+    async def aget_transactions(self, txids: Iterable[HashLike]) -> List[Any]:
+        """
+        Fetch several transactions concurrently.
+        
+        Returns results in input order; failed lookups are exception instances.
+        """
+        return await gather_results(self.aget_transaction(t) for t in txids)
+    
+    def get_txs_batch(self, txids: Iterable[HashLike]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch several transactions concurrently from synchronous code.
+        
+        See get_blocks_batch. Returns results in input order, with None for
+        transactions that failed.
+        """
+        return self._run_batch(self.aget_transactions(txids), "transaction")
     
     # ==================== Address Methods ====================
     
@@ -557,6 +1312,38 @@ class MempoolSpaceClient:
         """
         return self._get(f"/address/{address}/utxo")
     
+    async def aget_address(self, address: str) -> Dict[str, Any]:
+        """Async variant of get_address."""
+        return await self._aget(f"/address/{address}")
+    
+    async def aget_address_utxos(self, address: str) -> List[Dict[str, Any]]:
+        """Async variant of get_address_utxos."""
+        return await self._aget(f"/address/{address}/utxo")
+    
+    async def aget_balances(self, addresses: Iterable[str]) -> Dict[str, int]:
+        """
+        Get confirmed balances (satoshis) for many addresses concurrently.
+        
+        Mempool.space has no multi-address endpoint, so this fans out
+        /address/{a} lookups under the client's concurrency cap and rate
+        limit. Addresses that fail to fetch are omitted.
+        
+        Returns:
+            {address: funded_txo_sum - spent_txo_sum}
+        """
+        addresses = list(addresses)
+        results = await gather_results(self.aget_address(a) for a in addresses)
+        
+        balances = {}
+        for address, info in zip(addresses, results):
+            if isinstance(info, BaseException):
+                logger.warning("Failed to get address balance", address=address, error=str(info))
+                continue
+            stats = info.get("chain_stats", {})
+            balances[address] = stats.get("funded_txo_sum", 0) - stats.get("spent_txo_sum", 0)
+        
+        return balances
+    
     # ==================== Mempool Methods ====================
     
     def get_mempool_info(self) -> Dict[str, Any]:
@@ -647,41 +1434,47 @@ class MempoolSpaceClient:
     def convert_to_normalized_tx(self, raw_tx: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Mempool.space transaction format to normalized format."""
         # Convert inputs
-        vin = []
-        for inp in raw_tx.get("vin", []):
-            vin.append({
+        vin = [
+            {
                 "txid": inp.get("txid"),
                 "vout": inp.get("vout"),
                 "scriptSig": {"hex": inp.get("scriptsig", "")},
                 "sequence": inp.get("sequence", 0xffffffff),
                 "witness": inp.get("witness", []),
                 "prevout": inp.get("prevout", {})
-            })
+            }
+            for inp in raw_tx.get("vin", ())
+        ]
         
         # Convert outputs
-        vout = []
-        for idx, out in enumerate(raw_tx.get("vout", [])):
-            vout.append({
-                "value": out.get("value", 0) / 100000000,
+        vout = [
+            {
+                "value_sat": out.get("value", 0),
                 "n": idx,
                 "scriptPubKey": {
                     "hex": out.get("scriptpubkey", ""),
                     "type": out.get("scriptpubkey_type", ""),
                     "address": out.get("scriptpubkey_address")
                 }
-            })
+            }
+            for idx, out in enumerate(raw_tx.get("vout", ()))
+        ]
+        
+        txid = raw_tx.get("txid")
+        weight = raw_tx.get("weight")
+        fee = raw_tx.get("fee")
         
         return {
-            "txid": raw_tx.get("txid"),
-            "hash": raw_tx.get("txid"),
+            "txid": txid,
+            "hash": txid,
             "version": raw_tx.get("version"),
             "size": raw_tx.get("size"),
-            "vsize": raw_tx.get("weight", 0) // 4 if raw_tx.get("weight") else raw_tx.get("size"),
-            "weight": raw_tx.get("weight"),
+            "vsize": weight // 4 if weight else raw_tx.get("size"),
+            "weight": weight,
             "locktime": raw_tx.get("locktime", 0),
             "vin": vin,
             "vout": vout,
-            "fee": raw_tx.get("fee", 0) / 100000000 if raw_tx.get("fee") else 0,
+            "fee_sat": fee or 0,
             "status": raw_tx.get("status", {})
         }
 
@@ -696,10 +1489,12 @@ class BlockCypherClient:
     
     BASE_URL = "https://api.blockcypher.com/v1/btc/main"
     
+    __slots__ = ("api_token", "timeout", "session")
+    
     def __init__(self, api_token: Optional[str] = None, timeout: int = 30):
         self.api_token = api_token
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = create_session({'Accept-Encoding': ACCEPT_ENCODING})
     
     def _get_params(self) -> Dict:
         """Get default params with token if available."""
@@ -708,7 +1503,7 @@ class BlockCypherClient:
     def get_blockchain_info(self) -> Dict[str, Any]:
         """Get blockchain information."""
         response = self.session.get(self.BASE_URL, params=self._get_params(), timeout=self.timeout)
-        return response.json()
+        return orjson.loads(response.content)
     
     def get_block(self, block_hash_or_height: str) -> Dict[str, Any]:
         """Get block by hash or height."""
@@ -717,7 +1512,7 @@ class BlockCypherClient:
             params=self._get_params(),
             timeout=self.timeout
         )
-        return response.json()
+        return orjson.loads(response.content)
     
     def get_address(self, address: str) -> Dict[str, Any]:
         """Get address information."""
@@ -726,4 +1521,4 @@ class BlockCypherClient:
             params=self._get_params(),
             timeout=self.timeout
         )
-        return response.json()
+        return orjson.loads(response.content)
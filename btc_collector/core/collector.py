@@ -1,11 +1,15 @@
 """Main Bitcoin data collector orchestrator."""
 
 import time
-from typing import Optional, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 import structlog
 
 from btc_collector.models.config import CollectorConfig
+from btc_collector.models.blockchain import SyncStatus
 from btc_collector.core.rpc_client import BitcoinRPCClient, BitcoinRPCError
 from btc_collector.core.block_processor import BlockProcessor
 from btc_collector.database.manager import DatabaseManager
@@ -13,6 +17,104 @@ from btc_collector.utils.logging import setup_logging
 
 logger = structlog.get_logger(__name__)
 
+# Seconds a computed SyncStatus is reused; our own sync-state writes
+# invalidate it immediately
+SYNC_STATUS_TTL = 1.0
+
+# Blocks kept in flight per fetch worker, so a worker can start its next
+# fetch as soon as one finishes instead of waiting for the consumer
+FETCH_WINDOW_PER_WORKER = 2
+
+
+class AdaptiveBatchSize:
+    """
+    Batch size controller for block sync.
+    
+    Aims at a target database write time per block. The batch doubles while
+    throughput (bytes/s, so large blocks don't read as a slowdown) rises
+    above its EWMA and writes stay under the target. It halves when a
+    batch's write time per block exceeds the target or process memory
+    crosses the limit, and holds otherwise.
+    """
+    
+    ALPHA = 0.3            # EWMA weight of the latest batch
+    GROWTH_MARGIN = 1.05   # Throughput must beat its EWMA by this factor to grow
+    
+    def __init__(self, initial: int, minimum: int, maximum: int, max_memory_mb: int,
+                 target_write_ms: float):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.max_memory_mb = max_memory_mb
+        self.target_write_ms = target_write_ms
+        self.size = max(minimum, min(initial, maximum))
+        
+        self.bytes_per_second: Optional[float] = None
+        self.bytes_per_block: Optional[float] = None
+        self.write_ms_per_block: Optional[float] = None
+        self.logger = logger.bind(component="adaptive_batch_size")
+    
+    def observe(self, blocks: int, total_bytes: int, elapsed: float,
+                write_seconds: float) -> int:
+        """
+        Record a completed batch and return the size for the next one.
+        
+        Args:
+            blocks: Blocks processed in the batch
+            total_bytes: Their total size in bytes
+            elapsed: Wall time of the batch in seconds
+            write_seconds: Time spent applying the blocks to the database
+        """
+        if blocks <= 0 or elapsed <= 0:
+            return self.size
+        
+        rate = total_bytes / elapsed
+        block_bytes = total_bytes / blocks
+        write_ms = write_seconds * 1000 / blocks
+        rss_mb = self._rss_mb()
+        previous = self.size
+        
+        if rss_mb is not None and rss_mb > self.max_memory_mb:
+            self.size = max(self.minimum, self.size // 2)
+            reason = "memory"
+        elif write_ms > self.target_write_ms:
+            self.size = max(self.minimum, self.size // 2)
+            reason = "db_latency"
+        elif self.bytes_per_second is None or rate > self.bytes_per_second * self.GROWTH_MARGIN:
+            self.size = min(self.maximum, self.size * 2)
+            reason = "throughput_rising"
+        else:
+            reason = None
+        
+        if self.bytes_per_second is None:
+            self.bytes_per_second = rate
+            self.bytes_per_block = block_bytes
+            self.write_ms_per_block = write_ms
+        else:
+            self.bytes_per_second += self.ALPHA * (rate - self.bytes_per_second)
+            self.bytes_per_block += self.ALPHA * (block_bytes - self.bytes_per_block)
+            self.write_ms_per_block += self.ALPHA * (write_ms - self.write_ms_per_block)
+        
+        if self.size != previous:
+            self.logger.info("Adjusted sync batch size",
+                           previous=previous,
+                           batch_size=self.size,
+                           reason=reason,
+                           bytes_per_second=int(self.bytes_per_second),
+                           bytes_per_block=int(self.bytes_per_block),
+                           write_ms_per_block=round(write_ms, 1),
+                           rss_mb=rss_mb)
+        
+        return self.size
+    
+    @staticmethod
+    def _rss_mb() -> Optional[float]:
+        """Resident memory of this process in MB, if psutil is available."""
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+
 
 class BitcoinCollector:
     """Main Bitcoin blockchain data collector."""
@@ -29,6 +131,9 @@ class BitcoinCollector:
         self.db_manager = DatabaseManager(config)
         self.block_processor = BlockProcessor(self.db_manager)
         
+        # (monotonic time computed, status) of the last get_sync_status call
+        self._status_cache: Tuple[float, Optional[SyncStatus]] = (0.0, None)
+        
         self.logger.info("Bitcoin collector initialized")
     
     def initialize(self) -> bool:
@@ -55,8 +160,12 @@ class BitcoinCollector:
         self.logger.info("Bitcoin collector initialized successfully")
         return True
     
-    def get_sync_status(self) -> Dict[str, Any]:
-        """Get current synchronization status."""
+    def get_sync_status(self) -> SyncStatus:
+        """Get current synchronization status (all zero if it cannot be determined)."""
+        computed_at, status = self._status_cache
+        if status is not None and time.monotonic() - computed_at < SYNC_STATUS_TTL:
+            return status
+        
         # Get blockchain info from Bitcoin Core
         try:
             blockchain_info = self.rpc_client.get_blockchain_info()
@@ -64,19 +173,26 @@ class BitcoinCollector:
             
             # Get sync state from database
             sync_state = self.db_manager.get_sync_state()
-            last_synced = sync_state.get('last_synced_block_height', 0) if sync_state else 0
+            if sync_state:
+                last_synced = sync_state['last_synced_block_height']
+                is_syncing = bool(sync_state['is_syncing'])
+            else:
+                last_synced = 0
+                is_syncing = False
             
-            return {
-                'current_blockchain_height': current_height,
-                'last_synced_height': last_synced,
-                'blocks_behind': current_height - last_synced,
-                'is_syncing': sync_state.get('is_syncing', False) if sync_state else False,
-                'sync_progress': (last_synced / current_height * 100) if current_height > 0 else 0
-            }
+            status = SyncStatus(
+                current_blockchain_height=current_height,
+                last_synced_height=last_synced,
+                blocks_behind=current_height - last_synced,
+                sync_progress=(last_synced / current_height * 100) if current_height > 0 else 0.0,
+                is_syncing=is_syncing
+            )
+            self._status_cache = (time.monotonic(), status)
+            return status
             
         except Exception as e:
             self.logger.error("Failed to get sync status", error=str(e))
-            return {}
+            return SyncStatus()
     
     def sync_blocks(self, start_height: Optional[int] = None, 
                    end_height: Optional[int] = None) -> bool:
@@ -110,43 +226,85 @@ class BitcoinCollector:
             
             # Mark sync as started
             self.db_manager.set_sync_started()
+            self._status_cache = (0.0, None)
             
-            # Process blocks in batches
-            batch_size = self.config.sync_batch_size
+            # Process blocks in batches sized from recent throughput
+            batch_sizer = AdaptiveBatchSize(
+                initial=self.config.sync_batch_size,
+                minimum=self.config.sync_min_batch_size,
+                maximum=self.config.sync_max_batch_size,
+                max_memory_mb=self.config.sync_max_memory_mb,
+                target_write_ms=self.config.sync_target_write_ms
+            )
+            batch_size = batch_sizer.size
             current_height = start_height
+            last_hash = None
+            batches_done = 0
+            checkpoint_interval = max(1, self.config.sync_checkpoint_interval)
             
-            while current_height <= end_height:
-                batch_end = min(current_height + batch_size - 1, end_height)
-                
-                self.logger.info("Processing block batch",
-                               start=current_height,
-                               end=batch_end,
-                               progress=f"{((current_height - start_height) / (end_height - start_height + 1) * 100):.1f}%")
-                
-                # Process batch
-                success = self._process_block_batch(current_height, batch_end)
-                
-                if not success:
-                    self.logger.error("Failed to process block batch",
-                                    start=current_height, end=batch_end)
-                    return False
-                
-                # Update sync state
-                self.db_manager.update_sync_state(
-                    block_height=batch_end,
-                    block_hash=self.rpc_client.get_block_hash(batch_end),
-                    is_syncing=True
-                )
-                
-                current_height = batch_end + 1
+            # Blocks are fetched ahead on worker threads while the current one
+            # is processed, and each sync-state checkpoint runs on its own
+            # thread while the next batch is fetched. A resume after a crash
+            # re-checks at most checkpoint_interval batches, whose stored
+            # blocks are skipped by the per-batch existence query.
+            commit = None
+            self.block_processor.start_parse_pool()
+            with ThreadPoolExecutor(max_workers=self.config.sync_concurrent_blocks,
+                                    thread_name_prefix="block-fetch") as fetcher, \
+                 ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync-state") as committer:
+                while current_height <= end_height:
+                    batch_end = min(current_height + batch_size - 1, end_height)
+                    
+                    self.logger.info("Processing block batch",
+                                   start=current_height,
+                                   end=batch_end,
+                                   progress=f"{((current_height - start_height) / (end_height - start_height + 1) * 100):.1f}%")
+                    
+                    # Process batch
+                    batch_started = time.monotonic()
+                    result = self._process_block_batch(current_height, batch_end, fetcher)
+                    
+                    if result is None:
+                        self.logger.error("Failed to process block batch",
+                                        start=current_height, end=batch_end)
+                        return False
+                    
+                    processed_blocks, processed_bytes, write_seconds, last_hash = result
+                    batches_done += 1
+                    
+                    # Checkpoint sync state every few batches, once the previous
+                    # checkpoint has landed
+                    if batches_done % checkpoint_interval == 0:
+                        if commit is not None:
+                            commit.result()
+                        commit = committer.submit(
+                            self._update_sync_state,
+                            block_height=batch_end,
+                            block_hash=last_hash,
+                            is_syncing=True
+                        )
+                    
+                    # Only blocks actually fetched and applied say anything
+                    # about throughput; an all-stored batch is not a sample
+                    if processed_blocks > 0:
+                        batch_size = batch_sizer.observe(processed_blocks,
+                                                         processed_bytes,
+                                                         time.monotonic() - batch_started,
+                                                         write_seconds)
+                    current_height = batch_end + 1
+                    
+                    # Optional pause for nodes that need headroom; the bounded
+                    # fetch window already paces the RPC load
+                    if self.config.sync_throttle_ms > 0:
+                        time.sleep(self.config.sync_throttle_ms / 1000)
                 
-                # Small delay to prevent overwhelming the system
-                time.sleep(0.1)
+                if commit is not None:
+                    commit.result()
             
             # Mark sync as completed
-            self.db_manager.update_sync_state(
+            self._update_sync_state(
                 block_height=end_height,
-                block_hash=self.rpc_client.get_block_hash(end_height),
+                block_hash=last_hash,
                 is_syncing=False
             )
             
@@ -163,7 +321,7 @@ class BitcoinCollector:
             try:
                 sync_state = self.db_manager.get_sync_state()
                 if sync_state:
-                    self.db_manager.update_sync_state(
+                    self._update_sync_state(
                         block_height=sync_state.get('last_synced_block_height', 0),
                         block_hash=sync_state.get('last_synced_block_hash', ''),
                         is_syncing=False
@@ -172,37 +330,93 @@ class BitcoinCollector:
                 pass
             return False
     
-    def _process_block_batch(self, start_height: int, end_height: int) -> bool:
-        """Process a batch of blocks."""
-        for height in range(start_height, end_height + 1):
-            try:
-                # Skip if block already exists
-                if self.db_manager.block_exists(height):
-                    self.logger.debug("Block already exists, skipping", height=height)
-                    continue
-                
-                # Get block data from Bitcoin Core
-                block_hash = self.rpc_client.get_block_hash(height)
-                block_data = self.rpc_client.get_block(block_hash, verbosity=2)
-                
-                # Process the block
-                success = self.block_processor.process_block(block_data)
+    def _process_block_batch(self, start_height: int, end_height: int,
+                             fetcher: ThreadPoolExecutor) -> Optional[Tuple[int, int, float, str]]:
+        """
+        Process a batch of blocks, prefetching upcoming blocks on `fetcher`.
+        
+        Fetches complete in any order, but blocks are applied strictly by
+        height. The number of fetched-but-unapplied blocks is bounded by the
+        fetch window, which keeps memory flat when processing is the slower
+        stage. Heights already stored are dropped up front, and hashes for
+        the rest are resolved in a single JSON-RPC batch call.
+        
+        Returns:
+            (number of blocks processed, their total size in bytes, seconds
+            spent applying them to the database, hash of the block at
+            end_height), or None on failure
+        """
+        existing = self.db_manager.blocks_exist_in_range(start_height, end_height)
+        missing = [h for h in range(start_height, end_height + 1) if h not in existing]
+        if existing:
+            self.logger.debug("Skipping blocks already stored",
+                            start=start_height, end=end_height, skipped=len(existing))
+        
+        # The end height's hash is needed for the sync state even if it is stored
+        hash_heights = missing if missing and missing[-1] == end_height else missing + [end_height]
+        try:
+            block_hashes = self.rpc_client.get_block_hashes(hash_heights)
+        except BitcoinRPCError as e:
+            self.logger.error("RPC error while resolving block hashes",
+                            start=start_height, end=end_height, error=str(e))
+            return None
+        
+        heights = zip(missing, block_hashes)
+        pending = deque()
+        processed_bytes = 0
+        write_seconds = 0.0
+        window = self.config.sync_concurrent_blocks * FETCH_WINDOW_PER_WORKER
+        
+        def fill_window():
+            while len(pending) < window:
+                item = next(heights, None)
+                if item is None:
+                    return
+                height, block_hash = item
+                pending.append((height, fetcher.submit(self.rpc_client.get_block, block_hash, verbosity=2)))
+        
+        fill_window()
+        try:
+            while pending:
+                height, future = pending.popleft()
+                fill_window()
                 
-                if not success:
-                    self.logger.error("Failed to process block", height=height)
-                    return False
+                try:
+                    # Get block data from Bitcoin Core
+                    block_data = future.result()
+                    
+                    # Process the block
+                    write_started = time.monotonic()
+                    success = self.block_processor.process_block(block_data)
+                    write_seconds += time.monotonic() - write_started
+                    
+                    if not success:
+                        self.logger.error("Failed to process block", height=height)
+                        return None
+                    
+                    processed_bytes += block_data.get('size', 0)
+                    
+                except BitcoinRPCError as e:
+                    self.logger.error("RPC error while processing block",
+                                    height=height, error=str(e))
+                    return None
                 
-            except BitcoinRPCError as e:
-                self.logger.error("RPC error while processing block",
-                                height=height, error=str(e))
-                return False
-            
-            except Exception as e:
-                self.logger.error("Unexpected error while processing block",
-                                height=height, error=str(e))
-                return False
+                except Exception as e:
+                    self.logger.error("Unexpected error while processing block",
+                                    height=height, error=str(e))
+                    return None
+        finally:
+            for _, future in pending:
+                future.cancel()
         
-        return True
+        return len(missing), processed_bytes, write_seconds, block_hashes[-1]
+    
+    def _update_sync_state(self, block_height: int, block_hash: str, is_syncing: bool):
+        """Record sync progress and drop the cached sync status."""
+        self.db_manager.update_sync_state(block_height=block_height,
+                                          block_hash=block_hash,
+                                          is_syncing=is_syncing)
+        self._status_cache = (0.0, None)
     
     def sync_single_block(self, height: int) -> bool:
         """Synchronize a single block."""
@@ -218,7 +432,7 @@ class BitcoinCollector:
             
             if success:
                 # Update sync state
-                self.db_manager.update_sync_state(
+                self._update_sync_state(
                     block_height=height,
                     block_hash=block_hash,
                     is_syncing=False
@@ -245,8 +459,7 @@ class BitcoinCollector:
         try:
             while True:
                 # Get current status
-                status = self.get_sync_status()
-                blocks_behind = status.get('blocks_behind', 0)
+                blocks_behind = self.get_sync_status().blocks_behind
                 
                 if blocks_behind > 0:
                     self.logger.info("New blocks detected, syncing...",
@@ -274,7 +487,7 @@ class BitcoinCollector:
         processing_stats = self.block_processor.get_processing_stats()
         
         return {
-            'sync_status': sync_status,
+            'sync_status': asdict(sync_status),
             'processing_stats': processing_stats,
             'config': {
                 'batch_size': self.config.sync_batch_size,
@@ -289,6 +502,7 @@ class BitcoinCollector:
         
         try:
             self.rpc_client.close()
+            self.block_processor.close()
             self.db_manager.close()
             self.logger.info("Bitcoin collector shutdown complete")
         except Exception as e:
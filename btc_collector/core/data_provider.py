@@ -5,14 +5,20 @@ Abstract away the data source (RPC vs Public APIs).
 Switch between sources via configuration without changing application code.
 """
 
-from typing import Dict, Any, List, Optional, Protocol
+import asyncio
+from typing import Dict, Any, List, Optional, Protocol, Type
 from abc import ABC, abstractmethod
 import structlog
 
 from btc_collector.models.data_source_config import DataSourceConfig
+from btc_collector.utils.bitcoin import REORG_SAFE_DEPTH
+from btc_collector.utils.cache import TTLCache
 
 logger = structlog.get_logger(__name__)
 
+# Seconds a cached block stays in memory
+BLOCK_CACHE_TTL = 3600
+
 
 class BlockchainDataProvider(Protocol):
     """Protocol for blockchain data providers."""
@@ -34,157 +40,231 @@ class BlockchainDataProvider(Protocol):
         ...
 
 
-class UnifiedDataProvider:
+class UnifiedDataProvider(ABC):
     """
     Unified interface for blockchain data.
     
-    Automatically selects the appropriate data source based on configuration.
-    Provides consistent data format regardless of source.
+    Base class for the per-source providers below; create_data_provider
+    picks the subclass matching the configured data source. Provides
+    consistent data format regardless of source.
     """
     
     def __init__(self, config: Optional[DataSourceConfig] = None):
         self.config = config or DataSourceConfig()
         self.provider = self._create_provider()
         
+        # Recently fetched blocks, keyed by hash and (once buried) by height
+        self._block_cache = TTLCache(maxsize=self.config.block_cache_size, ttl=BLOCK_CACHE_TTL)
+        self._tip_height = 0
+        
         source_info = self.config.get_source_info()
         logger.info("Unified data provider initialized", **source_info)
     
+    @abstractmethod
     def _create_provider(self):
-        """Create the appropriate data provider based on config."""
-        source = self.config.data_source
-        
-        if source == "blockchain_info":
-            from btc_collector.core.blockchain_api_client import BlockchainInfoClient
-            return BlockchainInfoClient(
-                api_key=self.config.blockchain_info_api_key,
-                rate_limit_delay=self.config.blockchain_info_rate_limit,
-                max_retries=self.config.max_retries,
-                timeout=self.config.request_timeout
-            )
-            
-        elif source == "mempool_space":
-            from btc_collector.core.blockchain_api_client import MempoolSpaceClient
-            return MempoolSpaceClient(
-                base_url=self.config.mempool_space_url,
-                timeout=self.config.request_timeout
-            )
-            
-        elif source == "blockcypher":
-            from btc_collector.core.blockchain_api_client import BlockCypherClient
-            return BlockCypherClient(
-                api_token=self.config.blockcypher_api_token,
-                timeout=self.config.request_timeout
-            )
-            
-        elif source == "rpc":
-            from btc_collector.core.rpc_client import BitcoinRPCClient
-            from btc_collector.models.config import CollectorConfig
-            
-            rpc_config = CollectorConfig(
-                bitcoin_rpc_host=self.config.bitcoin_rpc_host,
-                bitcoin_rpc_port=self.config.bitcoin_rpc_port,
-                bitcoin_rpc_user=self.config.bitcoin_rpc_user,
-                bitcoin_rpc_password=self.config.bitcoin_rpc_password,
-                bitcoin_rpc_timeout=self.config.bitcoin_rpc_timeout,
-                db_user=self.config.db_user,
-                db_password=self.config.db_password
-            )
-            return BitcoinRPCClient(rpc_config)
-        
-        raise ValueError(f"Unknown data source: {source}")
+        """Create the client for this provider's data source."""
     
+    @abstractmethod
     def get_block_height(self) -> int:
         """Get current blockchain height."""
-        source = self.config.data_source
-        
-        if source == "blockchain_info":
-            return self.provider.get_block_height()
-        elif source == "mempool_space":
-            return self.provider.get_block_height()
-        elif source == "blockcypher":
-            info = self.provider.get_blockchain_info()
-            return info.get("height", 0)
-        elif source == "rpc":
-            return self.provider.get_block_count()
-        
-        return 0
+    
+    @abstractmethod
+    def _fetch_block(self, height_or_hash) -> Dict[str, Any]:
+        """Fetch and normalize a block from the data source (uncached)."""
+    
+    async def _afetch_block(self, height_or_hash) -> Dict[str, Any]:
+        """Async variant of _fetch_block; runs it in a thread unless overridden."""
+        return await asyncio.to_thread(self._fetch_block, height_or_hash)
     
     def get_block(self, height_or_hash) -> Dict[str, Any]:
         """
         Get block by height or hash.
         
-        Returns normalized block format regardless of source.
+        Returns normalized block format regardless of source. Recently
+        fetched blocks are served from memory.
         """
-        source = self.config.data_source
-        
-        if source == "blockchain_info":
-            if isinstance(height_or_hash, int):
-                raw_block = self.provider.get_block_by_height(height_or_hash)
-            else:
-                raw_block = self.provider.get_block_by_hash(height_or_hash)
-            return self.provider.convert_to_normalized_block(raw_block)
-            
-        elif source == "mempool_space":
-            if isinstance(height_or_hash, int):
-                # Get block by height using the new method
-                raw_block = self.provider.get_block_by_height(height_or_hash)
-            else:
-                raw_block = self.provider.get_block(height_or_hash)
-            return self.provider.convert_to_normalized_block(raw_block)
-            
-        elif source == "blockcypher":
-            raw_block = self.provider.get_block(str(height_or_hash))
-            return self._normalize_blockcypher_block(raw_block)
-            
-        elif source == "rpc":
-            if isinstance(height_or_hash, int):
-                block_hash = self.provider.get_block_hash(height_or_hash)
-            else:
-                block_hash = height_or_hash
-            return self.provider.get_block(block_hash, verbosity=2)
+        block = self._block_cache.get(height_or_hash)
+        if block is None:
+            block = self._fetch_block(height_or_hash)
+            self._cache_block(block)
+        return block
+    
+    def _cache_block(self, block: Dict[str, Any]):
+        """
+        Cache a fetched block under its hash, and under its height once it
+        is REORG_SAFE_DEPTH below the highest height seen.
+        """
+        # Placeholders for blocks that failed to fetch carry no timestamp
+        if not block.get("time"):
+            return
         
-        raise ValueError(f"Unknown data source: {source}")
+        height = block.get("height")
+        if height is not None:
+            self._tip_height = max(self._tip_height, height)
+            if height <= self._tip_height - REORG_SAFE_DEPTH:
+                self._block_cache.set(height, block)
+        if block.get("hash"):
+            self._block_cache.set(block["hash"], block)
     
-    def get_latest_blocks(self, count: int = 10) -> List[Dict[str, Any]]:
-        """Get the latest N blocks."""
-        current_height = self.get_block_height()
-        blocks = []
+    def get_blocks_batch(self, heights: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get several blocks by height in as few round-trips as possible.
         
-        for height in range(current_height, max(0, current_height - count), -1):
+        REST sources issue one request per block; RPC overrides this with a
+        single JSON-RPC batch. Blocks that fail to fetch are skipped.
+        """
+        blocks = []
+        for height in heights:
             try:
-                block = self.get_block(height)
-                blocks.append(block)
+                blocks.append(self.get_block(height))
             except Exception as e:
                 logger.warning("Failed to get block", height=height, error=str(e))
         
         return blocks
     
+    async def aget_block(self, height_or_hash) -> Dict[str, Any]:
+        """Async variant of get_block."""
+        block = self._block_cache.get(height_or_hash)
+        if block is None:
+            block = await self._afetch_block(height_or_hash)
+            self._cache_block(block)
+        return block
+    
+    async def aget_latest_blocks(self, count: int = 10) -> List[Dict[str, Any]]:
+        """
+        Fetch the latest N blocks concurrently, newest first.
+        
+        Entry point for callers already running in an event loop. The async
+        session stays open for later calls; close it with aclose().
+        """
+        current_height = await asyncio.to_thread(self.get_block_height)
+        self._tip_height = max(self._tip_height, current_height)
+        heights = range(current_height, max(0, current_height - count), -1)
+        
+        results = await asyncio.gather(*(self.aget_block(h) for h in heights),
+                                       return_exceptions=True)
+        
+        blocks = []
+        for height, result in zip(heights, results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to get block", height=height, error=str(result))
+            else:
+                blocks.append(result)
+        
+        return blocks
+    
+    async def aclose(self):
+        """Close the provider's async session, if it has one."""
+        aclose = getattr(self.provider, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    
+    def get_latest_blocks(self, count: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the latest N blocks.
+        
+        Runs aget_latest_blocks on a private event loop. Code already running
+        in an event loop (e.g. FastAPI handlers) should await
+        aget_latest_blocks instead, or call this via asyncio.to_thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("get_latest_blocks() cannot run inside an event loop; "
+                               "await aget_latest_blocks() instead")
+        
+        async def run():
+            try:
+                return await self.aget_latest_blocks(count)
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
     def get_blockchain_stats(self) -> Dict[str, Any]:
         """Get blockchain statistics."""
-        source = self.config.data_source
-        
-        if source == "blockchain_info":
-            return self.provider.get_stats()
-        elif source == "blockcypher":
-            return self.provider.get_blockchain_info()
+        # Build stats from available data
+        return {
+            "height": self.get_block_height(),
+            "source": self.config.data_source
+        }
+    
+    def get_address_info(self, address: str) -> Dict[str, Any]:
+        """Get address information."""
+        raise NotImplementedError(f"Address lookup not supported for {self.config.data_source}")
+
+
+class BlockchainInfoProvider(UnifiedDataProvider):
+    """Data provider backed by the Blockchain.info API."""
+    
+    def _create_provider(self):
+        from btc_collector.core.blockchain_api_client import BlockchainInfoClient
+        return BlockchainInfoClient(
+            api_key=self.config.blockchain_info_api_key,
+            rate_limit_delay=self.config.blockchain_info_rate_limit,
+            max_retries=self.config.max_retries,
+            timeout=self.config.request_timeout,
+            http2=self.config.http2_enabled
+        )
+    
+    def get_block_height(self) -> int:
+        """Get current blockchain height."""
+        return self.provider.get_block_height()
+    
+    def _fetch_block(self, height_or_hash) -> Dict[str, Any]:
+        if isinstance(height_or_hash, int):
+            raw_block = self.provider.get_block_by_height(height_or_hash)
         else:
-            # Build stats from available data
-            height = self.get_block_height()
-            return {
-                "height": height,
-                "source": source
-            }
+            raw_block = self.provider.get_block_by_hash(height_or_hash)
+        return self.provider.convert_to_normalized_block(raw_block)
+    
+    async def _afetch_block(self, height_or_hash) -> Dict[str, Any]:
+        if isinstance(height_or_hash, int):
+            raw_block = await self.provider.aget_block_by_height(height_or_hash)
+        else:
+            raw_block = await self.provider.aget_block_by_hash(height_or_hash)
+        return self.provider.convert_to_normalized_block(raw_block)
+    
+    def get_blockchain_stats(self) -> Dict[str, Any]:
+        """Get blockchain statistics."""
+        return self.provider.get_stats()
     
     def get_address_info(self, address: str) -> Dict[str, Any]:
         """Get address information."""
-        source = self.config.data_source
-        
-        if source == "blockchain_info":
-            return self.provider.get_address(address)
-        elif source == "blockcypher":
-            return self.provider.get_address(address)
+        return self.provider.get_address(address)
+
+
+class MempoolSpaceProvider(UnifiedDataProvider):
+    """Data provider backed by the Mempool.space API."""
+    
+    def _create_provider(self):
+        from btc_collector.core.blockchain_api_client import MempoolSpaceClient
+        return MempoolSpaceClient(
+            base_url=self.config.mempool_space_url,
+            timeout=self.config.request_timeout,
+            max_retries=self.config.max_retries,
+            http2=self.config.http2_enabled
+        )
+    
+    def get_block_height(self) -> int:
+        """Get current blockchain height."""
+        return self.provider.get_block_height()
+    
+    def _fetch_block(self, height_or_hash) -> Dict[str, Any]:
+        if isinstance(height_or_hash, int):
+            raw_block = self.provider.get_block_by_height(height_or_hash)
         else:
-            raise NotImplementedError(f"Address lookup not supported for {source}")
+            raw_block = self.provider.get_block(height_or_hash)
+        return self.provider.convert_to_normalized_block(raw_block)
+    
+    async def _afetch_block(self, height_or_hash) -> Dict[str, Any]:
+        if isinstance(height_or_hash, int):
+            raw_block = await self.provider.aget_block_by_height(height_or_hash)
+        else:
+            raw_block = await self.provider.aget_block(height_or_hash)
+        return self.provider.convert_to_normalized_block(raw_block)
     
     def _normalize_mempool_block(self, raw_block: Dict) -> Dict[str, Any]:
         """Normalize Mempool.space block format."""
@@ -202,6 +282,33 @@ class UnifiedDataProvider:
             "nTx": raw_block.get("tx_count"),
             "tx": []  # Need separate call to get transactions
         }
+
+
+class BlockCypherProvider(UnifiedDataProvider):
+    """Data provider backed by the BlockCypher API."""
+    
+    def _create_provider(self):
+        from btc_collector.core.blockchain_api_client import BlockCypherClient
+        return BlockCypherClient(
+            api_token=self.config.blockcypher_api_token,
+            timeout=self.config.request_timeout
+        )
+    
+    def get_block_height(self) -> int:
+        """Get current blockchain height."""
+        return self.provider.get_blockchain_info().get("height", 0)
+    
+    def _fetch_block(self, height_or_hash) -> Dict[str, Any]:
+        raw_block = self.provider.get_block(str(height_or_hash))
+        return self._normalize_blockcypher_block(raw_block)
+    
+    def get_blockchain_stats(self) -> Dict[str, Any]:
+        """Get blockchain statistics."""
+        return self.provider.get_blockchain_info()
+    
+    def get_address_info(self, address: str) -> Dict[str, Any]:
+        """Get address information."""
+        return self.provider.get_address(address)
     
     def _normalize_blockcypher_block(self, raw_block: Dict) -> Dict[str, Any]:
         """Normalize BlockCypher block format."""
@@ -220,6 +327,79 @@ class UnifiedDataProvider:
         }
 
 
+class RpcProvider(UnifiedDataProvider):
+    """Data provider backed by a Bitcoin Core node over JSON-RPC."""
+    
+    def _create_provider(self):
+        from btc_collector.core.rpc_client import BitcoinRPCClient
+        from btc_collector.models.config import CollectorConfig
+        
+        rpc_config = CollectorConfig(
+            bitcoin_rpc_host=self.config.bitcoin_rpc_host,
+            bitcoin_rpc_port=self.config.bitcoin_rpc_port,
+            bitcoin_rpc_user=self.config.bitcoin_rpc_user,
+            bitcoin_rpc_password=self.config.bitcoin_rpc_password,
+            bitcoin_rpc_timeout=self.config.bitcoin_rpc_timeout,
+            db_user=self.config.db_user,
+            db_password=self.config.db_password
+        )
+        return BitcoinRPCClient(rpc_config)
+    
+    def get_block_height(self) -> int:
+        """Get current blockchain height."""
+        return self.provider.get_block_count()
+    
+    def _fetch_block(self, height_or_hash) -> Dict[str, Any]:
+        if isinstance(height_or_hash, int):
+            block_hash = self.provider.get_block_hash(height_or_hash)
+        else:
+            block_hash = height_or_hash
+        return self.provider.get_block(block_hash, verbosity=2)
+    
+    async def _afetch_block(self, height_or_hash) -> Dict[str, Any]:
+        if isinstance(height_or_hash, int):
+            block_hash = await self.provider.aget_block_hash(height_or_hash)
+        else:
+            block_hash = height_or_hash
+        return await self.provider.aget_block(block_hash, verbosity=2)
+    
+    def get_blocks_batch(self, heights: List[int]) -> List[Dict[str, Any]]:
+        """Get several blocks by height with a single JSON-RPC batch."""
+        return self.provider.get_blocks_batch(heights, verbosity=2)
+
+
+PROVIDER_CLASSES: Dict[str, Type[UnifiedDataProvider]] = {
+    "blockchain_info": BlockchainInfoProvider,
+    "mempool_space": MempoolSpaceProvider,
+    "blockcypher": BlockCypherProvider,
+    "rpc": RpcProvider,
+}
+
+
 def create_data_provider(config: Optional[DataSourceConfig] = None) -> UnifiedDataProvider:
-    """Factory function to create data provider."""
-    return UnifiedDataProvider(config)
+    """Factory function to create the data provider for the configured source."""
+    config = config or DataSourceConfig()
+    
+    provider_class = PROVIDER_CLASSES.get(config.data_source)
+    if provider_class is None:
+        raise ValueError(f"Unknown data source: {config.data_source}")
+    return provider_class(config)
+
+
+_providers: Dict[str, UnifiedDataProvider] = {}
+
+
+def get_data_provider(config: Optional[DataSourceConfig] = None) -> UnifiedDataProvider:
+    """
+    Get or create a shared data provider for the given configuration.
+    
+    Providers are idempotent for a given config, so repeated callers
+    reuse the same clients and HTTP sessions instead of rebuilding them.
+    """
+    config = config or DataSourceConfig()
+    key = config.model_dump_json()
+    
+    provider = _providers.get(key)
+    if provider is None:
+        provider = _providers[key] = create_data_provider(config)
+    return provider
@@ -1,29 +1,51 @@
 """Bitcoin Core RPC client for blockchain data access."""
 
-import json
 import time
-from typing import Dict, Any, Optional, List
+import asyncio
+from typing import Dict, Any, Optional, List, Tuple
 from decimal import Decimal
+import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import structlog
 
 from btc_collector.models.config import CollectorConfig
 from btc_collector.models.blockchain import RawBlockResponse, RawTransactionResponse
+from btc_collector.utils.aio import close_stale_session
 
 logger = structlog.get_logger(__name__)
 
+# Seconds a polled chain-tip answer (getblockchaininfo/getblockcount) is reused
+CHAIN_TIP_CACHE_TTL = 5.0
+
 
 class BitcoinRPCError(Exception):
     """Bitcoin RPC specific error."""
     pass
 
 
+def _rpc_error_text(reply: Any) -> str:
+    """Describe the `error` member of a JSON-RPC reply, whatever its shape."""
+    error = reply.get('error') if isinstance(reply, dict) else reply
+    if isinstance(error, dict):
+        return f"RPC Error {error.get('code', -1)}: {error.get('message', 'Unknown RPC error')}"
+    return str(error)
+
+
 class BitcoinRPCClient:
     """Bitcoin Core JSON-RPC client with retry logic and error handling."""
     
     def __init__(self, config: CollectorConfig):
         self.config = config
         self.session = requests.Session()
+        
+        # Block fetch workers share this session; size the keep-alive pool so
+        # each worker (plus the calling thread) keeps its own connection open
+        # instead of the surplus being closed and reopened per call
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.sync_concurrent_blocks + 1)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'Content-Type': 'application/json',
             'User-Agent': 'btc-collector/1.0.0'
@@ -33,6 +55,14 @@ class BitcoinRPCClient:
         self.rpc_url = f"http://{config.bitcoin_rpc_host}:{config.bitcoin_rpc_port}"
         self.auth = (config.bitcoin_rpc_user, config.bitcoin_rpc_password)
         
+        # method -> (monotonic time fetched, result) for chain-tip queries
+        self._tip_cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # Async session is created lazily inside the running event loop
+        # (and recreated if a later call runs on a different loop)
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         logger.info("Bitcoin RPC client initialized", 
                    host=config.bitcoin_rpc_host, 
                    port=config.bitcoin_rpc_port)
@@ -53,13 +83,13 @@ class BitcoinRPCClient:
             try:
                 response = self.session.post(
                     self.rpc_url,
-                    json=payload,
+                    data=orjson.dumps(payload),
                     auth=self.auth,
                     timeout=self.config.bitcoin_rpc_timeout
                 )
                 response.raise_for_status()
                 
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if 'error' in data and data['error'] is not None:
                     error_msg = data['error'].get('message', 'Unknown RPC error')
@@ -68,7 +98,7 @@ class BitcoinRPCClient:
                 
                 return data.get('result')
                 
-            except (requests.RequestException, json.JSONDecodeError) as e:
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
                 logger.warning("RPC request failed", 
                              method=method, 
                              attempt=attempt + 1,
@@ -81,22 +111,169 @@ class BitcoinRPCClient:
         
         raise BitcoinRPCError("Unexpected error in RPC request")
     
+    def _make_batch_request(self, calls: List[tuple]) -> List[Optional[Any]]:
+        """
+        Make a JSON-RPC batch request (one HTTP round-trip for many calls).
+        
+        Args:
+            calls: List of (method, params) tuples
+            
+        Returns:
+            Results in the same order as calls; None for calls that errored.
+        """
+        if not calls:
+            return []
+        
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        
+        for attempt in range(self.config.sync_retry_attempts):
+            try:
+                response = self.session.post(
+                    self.rpc_url,
+                    data=orjson.dumps(payload),
+                    auth=self.auth,
+                    timeout=self.config.bitcoin_rpc_timeout
+                )
+                response.raise_for_status()
+                
+                replies = orjson.loads(response.content)
+                if not isinstance(replies, list):
+                    # The whole batch was rejected (e.g. a parse error)
+                    raise BitcoinRPCError(f"RPC batch request rejected: {_rpc_error_text(replies)}")
+                
+                results: List[Optional[Any]] = [None] * len(calls)
+                for item in replies:
+                    call_id = item.get('id') if isinstance(item, dict) else None
+                    if not isinstance(call_id, int) or not 0 <= call_id < len(calls):
+                        logger.warning("RPC batch reply without a matching call",
+                                     id=call_id,
+                                     error=_rpc_error_text(item))
+                        continue
+                    
+                    if item.get('error') is not None:
+                        logger.warning("RPC batch call failed",
+                                     method=calls[call_id][0],
+                                     error=_rpc_error_text(item))
+                        continue
+                    results[call_id] = item.get('result')
+                
+                return results
+                
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
+                logger.warning("RPC batch request failed", 
+                             calls=len(calls), 
+                             attempt=attempt + 1,
+                             error=str(e))
+                
+                if attempt == self.config.sync_retry_attempts - 1:
+                    raise BitcoinRPCError(f"RPC batch request failed after {self.config.sync_retry_attempts} attempts: {e}")
+                
+                time.sleep(self.config.sync_retry_delay)
+        
+        raise BitcoinRPCError("Unexpected error in RPC batch request")
+    
+    # ==================== Async Requests ====================
+    
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session used by the aget_* methods."""
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            if self._async_session is not None:
+                await close_stale_session(self._async_session, self._async_loop)
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.config.sync_concurrent_blocks),
+                timeout=aiohttp.ClientTimeout(total=self.config.bitcoin_rpc_timeout),
+                headers=dict(self.session.headers),
+                auth=aiohttp.BasicAuth(*self.auth)
+            )
+            self._async_loop = loop
+        return self._async_session
+    
+    async def aclose(self):
+        """Close the async session."""
+        if self._async_session and not self._async_session.closed:
+            await self._async_session.close()
+    
+    async def _amake_request(self, method: str, params: List[Any] = None) -> Any:
+        """Async counterpart of _make_request, bounded by the connector's pool limit."""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": int(time.time() * 1000),
+            "method": method,
+            "params": params or []
+        }
+        
+        session = await self._get_async_session()
+        
+        for attempt in range(self.config.sync_retry_attempts):
+            try:
+                async with session.post(self.rpc_url, data=orjson.dumps(payload)) as response:
+                    response.raise_for_status()
+                    data = orjson.loads(await response.read())
+                
+                if 'error' in data and data['error'] is not None:
+                    error_msg = data['error'].get('message', 'Unknown RPC error')
+                    error_code = data['error'].get('code', -1)
+                    raise BitcoinRPCError(f"RPC Error {error_code}: {error_msg}")
+                
+                return data.get('result')
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+                logger.warning("RPC request failed", 
+                             method=method, 
+                             attempt=attempt + 1,
+                             error=str(e))
+                
+                if attempt == self.config.sync_retry_attempts - 1:
+                    raise BitcoinRPCError(f"RPC request failed after {self.config.sync_retry_attempts} attempts: {e}")
+                
+                await asyncio.sleep(self.config.sync_retry_delay)
+        
+        raise BitcoinRPCError("Unexpected error in RPC request")
+    
+    def _cached_tip_request(self, method: str) -> Any:
+        """_make_request for chain-tip queries, reused for CHAIN_TIP_CACHE_TTL seconds."""
+        fetched_at, result = self._tip_cache.get(method, (0.0, None))
+        if result is not None and time.monotonic() - fetched_at < CHAIN_TIP_CACHE_TTL:
+            return result
+        
+        result = self._make_request(method)
+        self._tip_cache[method] = (time.monotonic(), result)
+        return result
+    
     def get_blockchain_info(self) -> Dict[str, Any]:
-        """Get blockchain information."""
-        return self._make_request("getblockchaininfo")
+        """Get blockchain information (cached for a few seconds)."""
+        return self._cached_tip_request("getblockchaininfo")
     
     def get_best_block_hash(self) -> str:
         """Get the hash of the best (tip) block."""
         return self._make_request("getbestblockhash")
     
     def get_block_count(self) -> int:
-        """Get the current block height."""
-        return self._make_request("getblockcount")
+        """Get the current block height (cached for a few seconds)."""
+        return self._cached_tip_request("getblockcount")
     
     def get_block_hash(self, height: int) -> str:
         """Get block hash by height."""
         return self._make_request("getblockhash", [height])
     
+    def get_block_hashes(self, heights: List[int]) -> List[str]:
+        """
+        Get block hashes for several heights in one batched round-trip.
+        
+        Raises BitcoinRPCError if any height cannot be resolved.
+        """
+        hashes = self._make_batch_request([("getblockhash", [h]) for h in heights])
+        
+        missing = [h for h, block_hash in zip(heights, hashes) if not block_hash]
+        if missing:
+            raise BitcoinRPCError(f"Could not resolve block hash for heights {missing[:10]}")
+        
+        return hashes
+    
     def get_block(self, block_hash: str, verbosity: int = 2) -> Dict[str, Any]:
         """
         Get block data by hash.
@@ -107,6 +284,14 @@ class BitcoinRPCClient:
         """
         return self._make_request("getblock", [block_hash, verbosity])
     
+    async def aget_block_hash(self, height: int) -> str:
+        """Async variant of get_block_hash."""
+        return await self._amake_request("getblockhash", [height])
+    
+    async def aget_block(self, block_hash: str, verbosity: int = 2) -> Dict[str, Any]:
+        """Async variant of get_block."""
+        return await self._amake_request("getblock", [block_hash, verbosity])
+    
     def get_raw_transaction(self, tx_hash: str, verbose: bool = True, 
                            block_hash: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -160,6 +345,18 @@ class BitcoinRPCClient:
             logger.error("RPC connection failed", error=str(e))
             return False
     
+    def get_blocks_batch(self, heights: List[int], verbosity: int = 2) -> List[Dict[str, Any]]:
+        """
+        Get multiple blocks by height using two batched round-trips.
+        
+        Blocks that fail to resolve are omitted from the result.
+        """
+        hashes = self._make_batch_request([("getblockhash", [h]) for h in heights])
+        hashes = [block_hash for block_hash in hashes if block_hash]
+        
+        blocks = self._make_batch_request([("getblock", [h, verbosity]) for h in hashes])
+        return [block for block in blocks if block]
+    
     def get_block_range(self, start_height: int, end_height: int) -> List[Dict[str, Any]]:
         """Get multiple blocks in range (for batch processing)."""
         blocks = []
@@ -1,6 +1,5 @@
 """Transaction parsing and data extraction."""
 
-from decimal import Decimal
 from datetime import datetime
 from typing import Dict, Any, List, Tuple, Optional
 import structlog
@@ -9,7 +8,7 @@ from btc_collector.models.blockchain import (
     TransactionData, UTXOData, TransactionInputData
 )
 from btc_collector.utils.bitcoin import (
-    parse_vout, parse_vin, calculate_fee, satoshi_to_btc
+    parse_vout, parse_vin
 )
 from btc_collector.utils.time import format_block_time
 
@@ -36,7 +35,7 @@ class TransactionParser:
         
         # Parse inputs
         inputs_data = []
-        total_input_value = Decimal('0')
+        total_input_sats = 0
         is_coinbase = False
         
         for input_index, vin in enumerate(tx_data.get('vin', [])):
@@ -62,10 +61,11 @@ class TransactionParser:
         
         # Parse outputs
         outputs_data = []
-        total_output_value = Decimal('0')
+        total_output_sats = 0
         
         for vout_index, vout in enumerate(tx_data.get('vout', [])):
             output_info = parse_vout(vout)
+            value_sats = output_info['value_sats']
             
             utxo_data = UTXOData(
                 tx_hash=tx_hash,
@@ -73,13 +73,13 @@ class TransactionParser:
                 address=output_info['address'],
                 script_type=output_info['script_type'],
                 script_hex=output_info['script_hex'],
-                value_btc=output_info['value_btc']
+                value_sats=value_sats
             )
             outputs_data.append(utxo_data)
-            total_output_value += output_info['value_btc']
+            total_output_sats += value_sats
         
         # Calculate fee (for coinbase transactions, fee is 0)
-        fee_btc = Decimal('0')
+        fee_sats = 0
         if not is_coinbase:
             # Fee calculation will be completed when input values are resolved
             pass
@@ -92,9 +92,9 @@ class TransactionParser:
             tx_index=tx_index,
             input_count=len(inputs_data),
             output_count=len(outputs_data),
-            total_input_btc=total_input_value,
-            total_output_btc=total_output_value,
-            fee_btc=fee_btc,
+            total_input_sats=total_input_sats,
+            total_output_sats=total_output_sats,
+            fee_sats=fee_sats,
             is_coinbase=is_coinbase,
             tx_size_bytes=tx_data.get('size'),
             tx_weight=tx_data.get('weight'),
@@ -110,31 +110,67 @@ class TransactionParser:
         return transaction_data, outputs_data, inputs_data
     
     def calculate_transaction_fee(self, tx_data: TransactionData, 
-                                 input_values: List[Decimal]) -> Decimal:
-        """Calculate transaction fee given input values."""
+                                 input_values: List[int]) -> int:
+        """Calculate transaction fee in satoshis given input values in satoshis."""
         if tx_data.is_coinbase:
-            return Decimal('0')
+            return 0
         
-        total_input_value = sum(input_values)
-        return calculate_fee(total_input_value, tx_data.total_output_btc)
+        return sum(input_values) - tx_data.total_output_sats
     
-    def parse_block_transactions(self, block_data: Dict[str, Any]) -> Tuple[
-        List[TransactionData], List[UTXOData], List[TransactionInputData]
+    def parse_block_transactions(self, block_data: Dict[str, Any],
+                                 block_time: Optional[datetime] = None) -> Tuple[
+        List[TransactionData], List[UTXOData],
+        List[TransactionInputData], List[TransactionInputData]
     ]:
         """
         Parse all transactions in a block.
         
+        Inputs are split by kind so that callers spending UTXOs only iterate
+        inputs that reference a previous output.
+        
+        Args:
+            block_data: Raw block from getblock (verbosity 2)
+            block_time: Block time if already converted by the caller
+        
         Returns:
-            Tuple of (transactions_list, utxos_list, inputs_list)
+            Tuple of (transactions_list, utxos_list, coinbase_inputs_list,
+            spending_inputs_list)
         """
         block_height = block_data['height']
-        block_time = format_block_time(block_data['time'])
+        if block_time is None:
+            block_time = format_block_time(block_data['time'])
+        
+        all_transactions, all_utxos, coinbase_inputs, spending_inputs = self.parse_chunk(
+            block_data.get('tx', []), block_height, block_time
+        )
+        
+        self.logger.debug("Parsed block transactions",
+                         block_height=block_height,
+                         tx_count=len(all_transactions),
+                         utxo_count=len(all_utxos))
+        
+        return all_transactions, all_utxos, coinbase_inputs, spending_inputs
+    
+    def parse_chunk(self, txs: List[Dict[str, Any]], block_height: int,
+                    block_time: datetime, start_index: int = 0) -> Tuple[
+        List[TransactionData], List[UTXOData],
+        List[TransactionInputData], List[TransactionInputData]
+    ]:
+        """
+        Parse a contiguous slice of a block's transactions.
         
+        Args:
+            txs: Raw transactions, starting at position `start_index` in the block
+        
+        Returns:
+            Same tuple as parse_block_transactions, for this slice only
+        """
         all_transactions = []
         all_utxos = []
-        all_inputs = []
+        coinbase_inputs = []
+        spending_inputs = []
         
-        for tx_index, tx_data in enumerate(block_data.get('tx', [])):
+        for tx_index, tx_data in enumerate(txs, start_index):
             try:
                 tx_data_obj, utxos, inputs = self.parse_transaction(
                     tx_data, block_height, block_time, tx_index
@@ -142,7 +178,10 @@ class TransactionParser:
                 
                 all_transactions.append(tx_data_obj)
                 all_utxos.extend(utxos)
-                all_inputs.extend(inputs)
+                if tx_data_obj.is_coinbase:
+                    coinbase_inputs.extend(inputs)
+                else:
+                    spending_inputs.extend(inputs)
                 
             except Exception as e:
                 self.logger.error("Failed to parse transaction",
@@ -151,12 +190,7 @@ class TransactionParser:
                                 error=str(e))
                 raise
         
-        self.logger.info("Parsed block transactions",
-                        block_height=block_height,
-                        tx_count=len(all_transactions),
-                        utxo_count=len(all_utxos))
-        
-        return all_transactions, all_utxos, all_inputs
+        return all_transactions, all_utxos, coinbase_inputs, spending_inputs
     
     def extract_addresses_from_utxos(self, utxos: List[UTXOData]) -> List[str]:
         """Extract unique addresses from UTXO list."""
@@ -178,4 +212,20 @@ class TransactionParser:
                     address_utxos[utxo.address] = []
                 address_utxos[utxo.address].append(utxo)
         
-        return address_utxos
\ No newline at end of file
+        return address_utxos
+
+
+# Parser reused by each worker process of a parse pool
+_worker_parser: Optional[TransactionParser] = None
+
+
+def parse_transaction_chunk(txs: List[Dict[str, Any]], block_height: int,
+                            block_time: datetime, start_index: int) -> Tuple[
+    List[TransactionData], List[UTXOData],
+    List[TransactionInputData], List[TransactionInputData]
+]:
+    """Parse a slice of a block's transactions (entry point for worker processes)."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = TransactionParser()
+    return _worker_parser.parse_chunk(txs, block_height, block_time, start_index)
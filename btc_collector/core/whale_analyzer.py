@@ -12,6 +12,7 @@ Features:
 """
 
 import time
+import weakref
 from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
@@ -640,3 +641,17 @@ class QuickWhaleDetector:
             List of whale transaction dicts ready for database persistence
         """
         return self._whale_transactions
+
+
+# Detectors stay registered only while something else uses them
+_quick_detectors: "weakref.WeakValueDictionary[int, QuickWhaleDetector]" = weakref.WeakValueDictionary()
+
+
+def get_quick_whale_detector(mempool_client) -> QuickWhaleDetector:
+    """Get or create the quick whale detector bound to a client."""
+    # A live detector holds its client, so the client's id cannot be reused
+    # while the entry exists
+    detector = _quick_detectors.get(id(mempool_client))
+    if detector is None:
+        detector = _quick_detectors[id(mempool_client)] = QuickWhaleDetector(mempool_client)
+    return detector
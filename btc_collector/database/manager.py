@@ -1,9 +1,17 @@
 """Database management and operations."""
 
-from typing import List, Optional, Dict, Any
+import csv
+import io
+import uuid
+from contextlib import contextmanager
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Set
 from decimal import Decimal
-from datetime import datetime
-from sqlalchemy import create_engine, text
+from datetime import datetime, timezone
+import orjson
+from sqlalchemy import (
+    create_engine, text, tuple_, update, values, column, func, String, Integer
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 import structlog
@@ -15,6 +23,7 @@ from btc_collector.models.blockchain import (
 from btc_collector.database.models import (
     Base, Block, Transaction, UTXO, TransactionInput, Address, SyncState
 )
+from btc_collector.utils.bitcoin import satoshi_to_btc, btc_to_satoshi
 
 logger = structlog.get_logger(__name__)
 
@@ -22,6 +31,14 @@ logger = structlog.get_logger(__name__)
 class DatabaseManager:
     """Manages database connections and operations."""
     
+    # Max rows per bulk statement (keeps bind parameters well under
+    # PostgreSQL's 65535 limit)
+    BULK_CHUNK_SIZE = 10000
+    
+    # Row count from which append-only tables are loaded with COPY instead
+    # of INSERT
+    COPY_THRESHOLD = 1000
+    
     def __init__(self, config: CollectorConfig):
         self.config = config
         self.logger = logger.bind(component="database_manager")
@@ -61,6 +78,55 @@ class DatabaseManager:
         """Get a database session."""
         return self.SessionLocal()
     
+    @contextmanager
+    def transaction(self) -> Iterator[Session]:
+        """
+        Run several operations in one database transaction.
+        
+        Pass the yielded session to the save/update methods. The transaction
+        is committed when the block exits normally and rolled back if it raises.
+        """
+        with self.get_session() as session:
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+    
+    @contextmanager
+    def _session_scope(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """Use the caller's transaction session, or a new session committed on exit."""
+        if session is not None:
+            yield session
+            # Surface errors at the failing operation rather than at commit
+            session.flush()
+            return
+        
+        with self.get_session() as session:
+            yield session
+            session.commit()
+    
+    def _copy_rows(self, session: Session, table: str, columns: List[str], rows) -> None:
+        """Stream rows into `table` with COPY ... FROM STDIN in CSV format."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(['\\N' if value is None else value for value in row])
+        buffer.seek(0)
+        
+        # Pending ORM rows (e.g. the parent transactions) must exist first
+        session.flush()
+        
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer
+            )
+        finally:
+            cursor.close()
+    
     def test_connection(self) -> bool:
         """Test database connection."""
         try:
@@ -120,16 +186,16 @@ class DatabaseManager:
             session.commit()
     
     # Block Operations
-    def save_block(self, block_data: BlockData) -> bool:
+    def save_block(self, block_data: BlockData, session: Optional[Session] = None) -> bool:
         """Save block data to database."""
         try:
-            with self.get_session() as session:
+            with self._session_scope(session) as session:
                 block = Block(
                     block_height=block_data.block_height,
                     block_hash=block_data.block_hash,
                     block_time=block_data.block_time,
                     tx_count=block_data.tx_count,
-                    total_fees_btc=block_data.total_fees_btc,
+                    total_fees_btc=satoshi_to_btc(block_data.total_fees_sats),
                     block_size_bytes=block_data.block_size_bytes,
                     difficulty=block_data.difficulty,
                     nonce=block_data.nonce,
@@ -138,7 +204,6 @@ class DatabaseManager:
                 )
                 
                 session.add(block)
-                session.commit()
                 
                 self.logger.debug("Block saved", 
                                 height=block_data.block_height,
@@ -161,11 +226,20 @@ class DatabaseManager:
         with self.get_session() as session:
             return session.query(Block).filter_by(block_height=height).first() is not None
     
+    def blocks_exist_in_range(self, start_height: int, end_height: int) -> Set[int]:
+        """Return the heights in [start_height, end_height] that are already stored."""
+        with self.get_session() as session:
+            rows = session.query(Block.block_height).filter(
+                Block.block_height.between(start_height, end_height)
+            )
+            return {height for (height,) in rows}
+    
     # Transaction Operations
-    def save_transactions(self, transactions: List[TransactionData]) -> bool:
+    def save_transactions(self, transactions: List[TransactionData],
+                          session: Optional[Session] = None) -> bool:
         """Save multiple transactions to database."""
         try:
-            with self.get_session() as session:
+            with self._session_scope(session) as session:
                 tx_objects = []
                 
                 for tx_data in transactions:
@@ -176,9 +250,9 @@ class DatabaseManager:
                         tx_index=tx_data.tx_index,
                         input_count=tx_data.input_count,
                         output_count=tx_data.output_count,
-                        total_input_btc=tx_data.total_input_btc,
-                        total_output_btc=tx_data.total_output_btc,
-                        fee_btc=tx_data.fee_btc,
+                        total_input_btc=satoshi_to_btc(tx_data.total_input_sats),
+                        total_output_btc=satoshi_to_btc(tx_data.total_output_sats),
+                        fee_btc=satoshi_to_btc(tx_data.fee_sats),
                         is_coinbase=tx_data.is_coinbase,
                         tx_size_bytes=tx_data.tx_size_bytes,
                         tx_weight=tx_data.tx_weight,
@@ -187,7 +261,6 @@ class DatabaseManager:
                     tx_objects.append(tx_obj)
                 
                 session.add_all(tx_objects)
-                session.commit()
                 
                 self.logger.debug("Transactions saved", count=len(transactions))
                 return True
@@ -199,10 +272,24 @@ class DatabaseManager:
             return False
     
     # UTXO Operations
-    def save_utxos(self, utxos: List[UTXOData]) -> bool:
+    def save_utxos(self, utxos: List[UTXOData], session: Optional[Session] = None) -> bool:
         """Save UTXOs to database."""
         try:
-            with self.get_session() as session:
+            with self._session_scope(session) as session:
+                if len(utxos) >= self.COPY_THRESHOLD:
+                    created_at = datetime.now(timezone.utc)
+                    self._copy_rows(
+                        session, UTXO.__tablename__,
+                        ['utxo_id', 'tx_hash', 'vout_index', 'address', 'script_type',
+                         'script_hex', 'value_btc', 'is_spent', 'spent_tx_hash',
+                         'spent_block_height', 'spent_at', 'created_at'],
+                        ((uuid.uuid4(), u.tx_hash, u.vout_index, u.address, u.script_type,
+                          u.script_hex, satoshi_to_btc(u.value_sats), u.is_spent, u.spent_tx_hash,
+                          u.spent_block_height, u.spent_at, created_at) for u in utxos)
+                    )
+                    self.logger.debug("UTXOs copied", count=len(utxos))
+                    return True
+                
                 utxo_objects = []
                 
                 for utxo_data in utxos:
@@ -212,7 +299,7 @@ class DatabaseManager:
                         address=utxo_data.address,
                         script_type=utxo_data.script_type,
                         script_hex=utxo_data.script_hex,
-                        value_btc=utxo_data.value_btc,
+                        value_btc=satoshi_to_btc(utxo_data.value_sats),
                         is_spent=utxo_data.is_spent,
                         spent_tx_hash=utxo_data.spent_tx_hash,
                         spent_block_height=utxo_data.spent_block_height,
@@ -221,7 +308,6 @@ class DatabaseManager:
                     utxo_objects.append(utxo_obj)
                 
                 session.add_all(utxo_objects)
-                session.commit()
                 
                 self.logger.debug("UTXOs saved", count=len(utxos))
                 return True
@@ -260,6 +346,71 @@ class DatabaseManager:
                             error=str(e))
             return False
     
+    def mark_utxos_spent_bulk(self, spends: List[Tuple[str, int, str]],
+                              spent_block_height: int, spent_at: datetime,
+                              session: Optional[Session] = None
+                              ) -> Dict[Tuple[str, int], Tuple[int, Optional[str], Optional[str]]]:
+        """
+        Mark many UTXOs as spent with one UPDATE ... FROM (VALUES ...) per chunk.
+        
+        The update returns the spent outputs, so callers get their values and
+        owners without a second lookup.
+        
+        Args:
+            spends: (tx_hash, vout_index, spent_tx_hash) for each spent output
+            spent_block_height: Height of the spending block
+            spent_at: Time of the spending block
+            
+        Returns:
+            (value_sats, address, script_type) of each UTXO marked as spent,
+            keyed by (tx_hash, vout_index)
+            
+        Raises:
+            Database errors when `session` is given, since the caller's
+            transaction is aborted and must not carry on
+        """
+        spent_utxos = {}
+        if not spends:
+            return spent_utxos
+        
+        utxos = UTXO.__table__
+        in_transaction = session is not None
+        
+        try:
+            with self._session_scope(session) as session:
+                for start in range(0, len(spends), self.BULK_CHUNK_SIZE):
+                    spent = values(
+                        column('tx_hash', String),
+                        column('vout_index', Integer),
+                        column('spent_tx_hash', String),
+                        name='spent'
+                    ).data(spends[start:start + self.BULK_CHUNK_SIZE])
+                    
+                    result = session.execute(
+                        update(utxos)
+                        .where(utxos.c.tx_hash == spent.c.tx_hash,
+                               utxos.c.vout_index == spent.c.vout_index)
+                        .values(is_spent=True,
+                                spent_tx_hash=spent.c.spent_tx_hash,
+                                spent_block_height=spent_block_height,
+                                spent_at=spent_at)
+                        .returning(utxos.c.tx_hash, utxos.c.vout_index, utxos.c.value_btc,
+                                   utxos.c.address, utxos.c.script_type)
+                    )
+                    
+                    for tx_hash, vout_index, value_btc, address, script_type in result:
+                        spent_utxos[(tx_hash, vout_index)] = (btc_to_satoshi(value_btc), address, script_type)
+                
+                return spent_utxos
+                
+        except Exception as e:
+            if in_transaction:
+                raise
+            self.logger.error("Failed to mark UTXOs as spent",
+                            count=len(spends),
+                            error=str(e))
+            return {}
+    
     def get_utxo_value(self, tx_hash: str, vout_index: int) -> Optional[Decimal]:
         """Get UTXO value."""
         with self.get_session() as session:
@@ -270,11 +421,47 @@ class DatabaseManager:
             
             return utxo.value_btc if utxo else None
     
+    def get_utxo_values_bulk(self, outpoints: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Decimal]:
+        """Get values of many UTXOs, keyed by (tx_hash, vout_index)."""
+        values = {}
+        if not outpoints:
+            return values
+        
+        with self.get_session() as session:
+            for start in range(0, len(outpoints), self.BULK_CHUNK_SIZE):
+                chunk = outpoints[start:start + self.BULK_CHUNK_SIZE]
+                rows = session.query(
+                    UTXO.tx_hash, UTXO.vout_index, UTXO.value_btc
+                ).filter(
+                    tuple_(UTXO.tx_hash, UTXO.vout_index).in_(chunk)
+                ).all()
+                
+                for tx_hash, vout_index, value_btc in rows:
+                    values[(tx_hash, vout_index)] = value_btc
+        
+        return values
+    
     # Transaction Input Operations
-    def save_transaction_inputs(self, inputs: List[TransactionInputData]) -> bool:
+    def save_transaction_inputs(self, inputs: List[TransactionInputData],
+                                session: Optional[Session] = None) -> bool:
         """Save transaction inputs to database."""
         try:
-            with self.get_session() as session:
+            with self._session_scope(session) as session:
+                if len(inputs) >= self.COPY_THRESHOLD:
+                    created_at = datetime.now(timezone.utc)
+                    self._copy_rows(
+                        session, TransactionInput.__tablename__,
+                        ['input_id', 'tx_hash', 'input_index', 'previous_tx_hash',
+                         'previous_vout_index', 'script_sig_hex', 'witness_data',
+                         'sequence_number', 'created_at'],
+                        ((uuid.uuid4(), i.tx_hash, i.input_index, i.previous_tx_hash,
+                          i.previous_vout_index, i.script_sig_hex,
+                          orjson.dumps(i.witness_data).decode() if i.witness_data is not None else None,
+                          i.sequence_number, created_at) for i in inputs)
+                    )
+                    self.logger.debug("Transaction inputs copied", count=len(inputs))
+                    return True
+                
                 input_objects = []
                 
                 for input_data in inputs:
@@ -290,7 +477,6 @@ class DatabaseManager:
                     input_objects.append(input_obj)
                 
                 session.add_all(input_objects)
-                session.commit()
                 
                 self.logger.debug("Transaction inputs saved", count=len(inputs))
                 return True
@@ -314,9 +500,9 @@ class DatabaseManager:
                     # Update existing address
                     address.last_seen_block = address_data.last_seen_block
                     address.last_seen_at = address_data.last_seen_at
-                    address.total_received_btc = address_data.total_received_btc
-                    address.total_sent_btc = address_data.total_sent_btc
-                    address.current_balance_btc = address_data.current_balance_btc
+                    address.total_received_btc = satoshi_to_btc(address_data.total_received_sats)
+                    address.total_sent_btc = satoshi_to_btc(address_data.total_sent_sats)
+                    address.current_balance_btc = satoshi_to_btc(address_data.current_balance_sats)
                     address.tx_count = address_data.tx_count
                     address.utxo_count = address_data.utxo_count
                 else:
@@ -328,9 +514,9 @@ class DatabaseManager:
                         last_seen_block=address_data.last_seen_block,
                         first_seen_at=address_data.first_seen_at,
                         last_seen_at=address_data.last_seen_at,
-                        total_received_btc=address_data.total_received_btc,
-                        total_sent_btc=address_data.total_sent_btc,
-                        current_balance_btc=address_data.current_balance_btc,
+                        total_received_btc=satoshi_to_btc(address_data.total_received_sats),
+                        total_sent_btc=satoshi_to_btc(address_data.total_sent_sats),
+                        current_balance_btc=satoshi_to_btc(address_data.current_balance_sats),
                         tx_count=address_data.tx_count,
                         utxo_count=address_data.utxo_count
                     )
@@ -345,6 +531,59 @@ class DatabaseManager:
                             error=str(e))
             return False
     
+    def save_or_update_addresses_bulk(self, addresses: List[AddressData],
+                                      session: Optional[Session] = None) -> bool:
+        """Save or update statistics for many addresses in one upsert."""
+        if not addresses:
+            return True
+        
+        rows = [
+            {
+                'address': address_data.address,
+                'script_type': address_data.script_type,
+                'first_seen_block': address_data.first_seen_block,
+                'last_seen_block': address_data.last_seen_block,
+                'first_seen_at': address_data.first_seen_at,
+                'last_seen_at': address_data.last_seen_at,
+                'total_received_btc': satoshi_to_btc(address_data.total_received_sats),
+                'total_sent_btc': satoshi_to_btc(address_data.total_sent_sats),
+                'current_balance_btc': satoshi_to_btc(address_data.current_balance_sats),
+                'tx_count': address_data.tx_count,
+                'utxo_count': address_data.utxo_count
+            }
+            for address_data in addresses
+        ]
+        
+        # Existing rows keep their script type and first-seen fields
+        stmt = pg_insert(Address)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Address.address],
+            set_={
+                'last_seen_block': stmt.excluded.last_seen_block,
+                'last_seen_at': stmt.excluded.last_seen_at,
+                'total_received_btc': stmt.excluded.total_received_btc,
+                'total_sent_btc': stmt.excluded.total_sent_btc,
+                'current_balance_btc': stmt.excluded.current_balance_btc,
+                'tx_count': stmt.excluded.tx_count,
+                'utxo_count': stmt.excluded.utxo_count,
+                'updated_at': func.now()
+            }
+        )
+        
+        try:
+            with self._session_scope(session) as session:
+                # executemany is batched into multi-row VALUES by the dialect
+                session.execute(stmt, rows)
+                
+                self.logger.debug("Addresses saved", count=len(rows))
+                return True
+                
+        except Exception as e:
+            self.logger.error("Failed to save addresses",
+                            count=len(rows),
+                            error=str(e))
+            return False
+    
     def get_address_stats(self, address: str) -> Optional[Dict[str, Any]]:
         """Get address statistics."""
         with self.get_session() as session:
@@ -357,12 +596,40 @@ class DatabaseManager:
                     'total_sent_btc': addr_obj.total_sent_btc,
                     'current_balance_btc': addr_obj.current_balance_btc,
                     'tx_count': addr_obj.tx_count,
+                    'utxo_count': addr_obj.utxo_count,
                     'first_seen_block': addr_obj.first_seen_block,
-                    'last_seen_block': addr_obj.last_seen_block
+                    'last_seen_block': addr_obj.last_seen_block,
+                    'first_seen_at': addr_obj.first_seen_at
                 }
             
             return None
     
+    def get_address_stats_bulk(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for many addresses, keyed by address."""
+        stats = {}
+        if not addresses:
+            return stats
+        
+        with self.get_session() as session:
+            for start in range(0, len(addresses), self.BULK_CHUNK_SIZE):
+                chunk = addresses[start:start + self.BULK_CHUNK_SIZE]
+                rows = session.query(Address).filter(Address.address.in_(chunk)).all()
+                
+                for addr_obj in rows:
+                    stats[addr_obj.address] = {
+                        'address': addr_obj.address,
+                        'total_received_btc': addr_obj.total_received_btc,
+                        'total_sent_btc': addr_obj.total_sent_btc,
+                        'current_balance_btc': addr_obj.current_balance_btc,
+                        'tx_count': addr_obj.tx_count,
+                        'utxo_count': addr_obj.utxo_count,
+                        'first_seen_block': addr_obj.first_seen_block,
+                        'last_seen_block': addr_obj.last_seen_block,
+                        'first_seen_at': addr_obj.first_seen_at
+                    }
+        
+        return stats
+    
     def close(self):
         """Close database connections."""
         self.engine.dispose()
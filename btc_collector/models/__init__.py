@@ -1,7 +1,9 @@
 """Data models and configuration."""
 
 from btc_collector.models.config import CollectorConfig
-from btc_collector.models.blockchain import BlockData, TransactionData, UTXOData, AddressData
+from btc_collector.models.blockchain import (
+    BlockData, TransactionData, UTXOData, AddressData, SyncStatus
+)
 
 __all__ = [
     "CollectorConfig",
@@ -9,4 +11,5 @@ __all__ = [
     "TransactionData",
     "UTXOData", 
     "AddressData",
+    "SyncStatus",
 ]
\ No newline at end of file
@@ -1,4 +1,8 @@
-"""Blockchain data models for Bitcoin."""
+"""Blockchain data models for Bitcoin.
+
+Amounts are integer satoshis; they are converted to BTC only at the
+database boundary.
+"""
 
 from datetime import datetime
 from decimal import Decimal
@@ -13,7 +17,7 @@ class BlockData:
     block_hash: str
     block_time: datetime
     tx_count: int
-    total_fees_btc: Decimal
+    total_fees_sats: int
     block_size_bytes: Optional[int] = None
     difficulty: Optional[Decimal] = None
     nonce: Optional[int] = None
@@ -30,9 +34,9 @@ class TransactionData:
     tx_index: int
     input_count: int
     output_count: int
-    total_input_btc: Decimal
-    total_output_btc: Decimal
-    fee_btc: Decimal
+    total_input_sats: int
+    total_output_sats: int
+    fee_sats: int
     is_coinbase: bool = False
     tx_size_bytes: Optional[int] = None
     tx_weight: Optional[int] = None
@@ -47,7 +51,7 @@ class UTXOData:
     address: Optional[str]
     script_type: Optional[str]
     script_hex: Optional[str]
-    value_btc: Decimal
+    value_sats: int
     is_spent: bool = False
     spent_tx_hash: Optional[str] = None
     spent_block_height: Optional[int] = None
@@ -75,9 +79,9 @@ class AddressData:
     last_seen_block: int
     first_seen_at: datetime
     last_seen_at: datetime
-    total_received_btc: Decimal
-    total_sent_btc: Decimal
-    current_balance_btc: Decimal
+    total_received_sats: int
+    total_sent_sats: int
+    current_balance_sats: int
     tx_count: int
     utxo_count: int = 0
 
@@ -105,4 +109,14 @@ class RawTransactionResponse:
     weight: int
     locktime: int
     vin: List[Dict[str, Any]]
-    vout: List[Dict[str, Any]]
\ No newline at end of file
+    vout: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class SyncStatus:
+    """Synchronization status of the collector against Bitcoin Core."""
+    current_blockchain_height: int = 0
+    last_synced_height: int = 0
+    blocks_behind: int = 0
+    sync_progress: float = 0.0
+    is_syncing: bool = False
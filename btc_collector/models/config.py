@@ -26,10 +26,16 @@ class CollectorConfig(BaseSettings):
     
     # Sync Settings
     sync_batch_size: int = Field(default=100, description="Blocks to process in batch")
+    sync_min_batch_size: int = Field(default=10, description="Lower bound for adaptive batch size")
+    sync_max_batch_size: int = Field(default=1000, description="Upper bound for adaptive batch size")
+    sync_max_memory_mb: int = Field(default=2048, description="Process RSS above which batches shrink")
+    sync_target_write_ms: float = Field(default=250.0, description="Per-block DB write time above which batches shrink")
     sync_start_height: int = Field(default=0, description="Starting block height")
     sync_concurrent_blocks: int = Field(default=5, description="Concurrent block processing")
     sync_retry_attempts: int = Field(default=3, description="Retry attempts for failed operations")
     sync_retry_delay: int = Field(default=5, description="Delay between retries in seconds")
+    sync_checkpoint_interval: int = Field(default=10, description="Batches between sync-state checkpoints")
+    sync_throttle_ms: int = Field(default=0, description="Pause between sync batches in milliseconds (0 = none)")
     
     # Logging Settings
     log_level: str = Field(default="INFO", description="Logging level")
@@ -37,11 +43,14 @@ class CollectorConfig(BaseSettings):
     log_file: Optional[str] = Field(default="logs/btc_collector.log", description="Log file path")
     log_max_size_mb: int = Field(default=100, description="Max log file size in MB")
     log_backup_count: int = Field(default=5, description="Number of log backups")
+    log_every_n_blocks: int = Field(default=100, description="Log per-block progress every N blocks")
     
     # Performance Settings
     cache_size_mb: int = Field(default=512, description="Cache size in MB")
     worker_threads: int = Field(default=4, description="Number of worker threads")
     queue_size: int = Field(default=1000, description="Processing queue size")
+    parse_workers: int = Field(default=4, description="Processes for parsing large blocks (0/1 = in-process)")
+    parse_parallel_min_txs: int = Field(default=1000, description="Min transactions in a block to parse in parallel")
     
     # Feature Flags
     enable_address_tracking: bool = Field(default=True, description="Enable address aggregation")
@@ -76,6 +76,14 @@ class DataSourceConfig(BaseSettings):
         default=30,
         description="Request timeout in seconds"
     )
+    http2_enabled: bool = Field(
+        default=False,
+        description="Use HTTP/2 for public API requests (requires httpx[http2])"
+    )
+    block_cache_size: int = Field(
+        default=256,
+        description="Recently fetched blocks kept in memory (0 disables)"
+    )
     
     # ==================== Database Settings ====================
     db_host: str = Field(default="localhost")
@@ -8,6 +8,9 @@ from btc_collector.utils.bitcoin import (
     validate_bitcoin_address,
 )
 from btc_collector.utils.time import to_utc_timestamp, format_block_time
+from btc_collector.utils.circuit_breaker import CircuitBreaker, BreakerState
+from btc_collector.utils.rate_limiter import TokenBucket
+from btc_collector.utils.cache import TTLCache
 
 __all__ = [
     "setup_logging",
@@ -17,4 +20,8 @@ __all__ = [
     "validate_bitcoin_address",
     "to_utc_timestamp",
     "format_block_time",
+    "CircuitBreaker",
+    "BreakerState",
+    "TokenBucket",
+    "TTLCache",
 ]
\ No newline at end of file
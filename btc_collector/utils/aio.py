@@ -0,0 +1,26 @@
+"""Helpers for aiohttp sessions, which are bound to the event loop that created them."""
+
+import asyncio
+
+import aiohttp
+
+
+async def close_stale_session(session: aiohttp.ClientSession,
+                              loop: asyncio.AbstractEventLoop):
+    """
+    Close a session created on an event loop other than the running one.
+
+    Its connections belong to `loop`, so the close is scheduled there: right
+    away if that loop runs in another thread, or the next time it runs if it
+    is idle. A closed loop has already dropped its transports, and closing
+    the session only marks it closed.
+    """
+    if session.closed:
+        return
+
+    if loop.is_closed():
+        await session.close()
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    else:
+        loop.create_task(session.close())
@@ -17,6 +17,10 @@ BECH32_PATTERN = re.compile(r'^(bc1|tb1)[a-z0-9]{39,59}$')
 # Satoshis per Bitcoin
 SATOSHIS_PER_BTC = Decimal('100000000')
 
+# Confirmations after which a block is treated as final; shallower blocks
+# can still be replaced by a reorg, so height -> block lookups are not cached
+REORG_SAFE_DEPTH = 6
+
 
 def satoshi_to_btc(satoshis: int) -> Decimal:
     """Convert satoshis to BTC."""
@@ -52,9 +56,7 @@ def _validate_base58_address(address: str) -> bool:
         # Verify checksum
         payload = decoded[:-4]
         checksum = decoded[-4:]
-        hash_result = hashlib.sha256(hashlib.sha256(payload).digest()).digest()
-        
-        return hash_result[:4] == checksum
+        return _double_sha256(payload)[:4] == checksum
     except Exception:
         return False
 
@@ -82,8 +84,11 @@ def get_script_type(script_hex: str, addresses: List[str] = None) -> str:
     if not script_hex:
         return "unknown"
     
-    script_bytes = bytes.fromhex(script_hex)
-    
+    return _script_type_from_bytes(bytes.fromhex(script_hex))
+
+
+def _script_type_from_bytes(script_bytes: bytes) -> str:
+    """Determine script type from decoded script bytes."""
     # P2PKH: OP_DUP OP_HASH160 <pubKeyHash> OP_EQUALVERIFY OP_CHECKSIG
     if (len(script_bytes) == 25 and 
         script_bytes[0] == 0x76 and  # OP_DUP
@@ -145,58 +150,49 @@ def decode_address(script_hex: str, script_type: str = None) -> Optional[str]:
         script_bytes = bytes.fromhex(script_hex)
         
         if not script_type:
-            script_type = get_script_type(script_hex)
+            script_type = _script_type_from_bytes(script_bytes)
         
-        if script_type == "P2PKH":
-            # Extract pubkey hash (bytes 3-22)
-            pubkey_hash = script_bytes[3:23]
-            return _hash160_to_p2pkh_address(pubkey_hash)
-        
-        elif script_type == "P2SH":
-            # Extract script hash (bytes 2-21)
-            script_hash = script_bytes[2:22]
-            return _hash160_to_p2sh_address(script_hash)
-        
-        elif script_type in ["P2WPKH", "P2WSH"]:
-            # SegWit addresses - would need bech32 encoding
-            # Simplified: return None for now
-            return None
-        
-        elif script_type == "P2TR":
-            # Taproot addresses - would need bech32m encoding
-            return None
-        
-        return None
+        return _decode_address_from_bytes(script_bytes, script_type)
         
     except Exception as e:
         logger.warning("Failed to decode address", script_hex=script_hex, error=str(e))
         return None
 
 
-def _hash160_to_p2pkh_address(pubkey_hash: bytes) -> str:
-    """Convert pubkey hash to P2PKH address."""
-    # Mainnet P2PKH version byte
-    version_byte = b'\x00'
-    payload = version_byte + pubkey_hash
+def _decode_address_from_bytes(script_bytes: bytes, script_type: str) -> Optional[str]:
+    """Extract Bitcoin address from decoded output script bytes."""
+    # memoryview slices reference the script instead of copying it
+    script_view = memoryview(script_bytes)
     
-    # Double SHA256 for checksum
-    checksum = hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+    if script_type == "P2PKH":
+        # Extract pubkey hash (bytes 3-22); mainnet P2PKH version byte
+        return _base58check_encode(b'\x00', script_view[3:23])
     
-    # Base58 encode
-    return base58.b58encode(payload + checksum).decode('ascii')
-
-
-def _hash160_to_p2sh_address(script_hash: bytes) -> str:
-    """Convert script hash to P2SH address."""
-    # Mainnet P2SH version byte
-    version_byte = b'\x05'
-    payload = version_byte + script_hash
+    elif script_type == "P2SH":
+        # Extract script hash (bytes 2-21); mainnet P2SH version byte
+        return _base58check_encode(b'\x05', script_view[2:22])
     
-    # Double SHA256 for checksum
-    checksum = hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+    elif script_type in ["P2WPKH", "P2WSH"]:
+        # SegWit addresses - would need bech32 encoding
+        # Simplified: return None for now
+        return None
+    
+    elif script_type == "P2TR":
+        # Taproot addresses - would need bech32m encoding
+        return None
     
-    # Base58 encode
-    return base58.b58encode(payload + checksum).decode('ascii')
+    return None
+
+
+def _double_sha256(data) -> bytes:
+    """SHA256(SHA256(data)) of any bytes-like object."""
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()
+
+
+def _base58check_encode(version_byte: bytes, hash160) -> str:
+    """Base58Check-encode a 20-byte hash with a mainnet version byte."""
+    payload = version_byte + hash160
+    return base58.b58encode(payload + _double_sha256(payload)[:4]).decode('ascii')
 
 
 def calculate_fee(inputs_value: Decimal, outputs_value: Decimal) -> Decimal:
@@ -205,26 +201,37 @@ def calculate_fee(inputs_value: Decimal, outputs_value: Decimal) -> Decimal:
 
 
 def parse_vout(vout_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Parse transaction output data."""
-    value_btc = Decimal(str(vout_data.get('value', 0)))
+    """
+    Parse transaction output data.
+    
+    Accepts exact integer `value_sat` (public API clients) or BTC `value`
+    (Bitcoin Core RPC).
+    """
+    value_sats = vout_data.get('value_sat')
+    if value_sats is None:
+        value_sats = btc_to_satoshi(Decimal(str(vout_data.get('value', 0))))
     script_pub_key = vout_data.get('scriptPubKey', {})
     
     script_hex = script_pub_key.get('hex', '')
-    script_type = script_pub_key.get('type', 'unknown')
     addresses = script_pub_key.get('addresses', [])
     
-    # Get primary address
-    address = addresses[0] if addresses else None
+    # Decode the script once for type detection and address derivation
+    script_bytes = bytes.fromhex(script_hex) if script_hex else b''
+    normalized_script_type = (_script_type_from_bytes(script_bytes)
+                              if script_bytes else "unknown")
     
-    # Decode address if not provided
-    if not address and script_hex:
-        address = decode_address(script_hex, script_type)
+    # Get primary address (Bitcoin Core >= 22 reports a single `address`)
+    address = script_pub_key.get('address') or (addresses[0] if addresses else None)
     
-    # Normalize script type
-    normalized_script_type = get_script_type(script_hex, addresses)
+    # Derive address only if the node did not provide one
+    if not address and script_bytes:
+        try:
+            address = _decode_address_from_bytes(script_bytes, normalized_script_type)
+        except Exception as e:
+            logger.warning("Failed to decode address", script_hex=script_hex, error=str(e))
     
     return {
-        'value_btc': value_btc,
+        'value_sats': value_sats,
         'address': address,
         'script_type': normalized_script_type,
         'script_hex': script_hex,
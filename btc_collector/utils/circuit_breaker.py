@@ -0,0 +1,71 @@
+"""Circuit breaker for calls to unreliable dependencies (database, APIs)."""
+
+import time
+from enum import Enum
+from typing import Optional
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class BreakerState(str, Enum):
+    """Circuit breaker state."""
+    CLOSED = "CLOSED"        # Calls pass through normally
+    OPEN = "OPEN"            # Calls are short-circuited
+    HALF_OPEN = "HALF_OPEN"  # Trial calls allowed after reset timeout
+
+
+class CircuitBreaker:
+    """
+    Simple CLOSED/OPEN/HALF_OPEN circuit breaker.
+
+    Trips after `fail_max` consecutive failures and short-circuits calls for
+    `reset_timeout` seconds, so an unavailable dependency costs nothing per
+    call instead of a full request + exception on every attempt.
+
+    Usage:
+        if breaker.allow():
+            try:
+                do_call()
+                breaker.record_success()
+            except SomeError as e:
+                breaker.record_failure(e)
+    """
+
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+
+        self.state = BreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Check whether a call may proceed."""
+        if self.state is BreakerState.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = BreakerState.HALF_OPEN
+        return True
+
+    def record_success(self):
+        """Record a successful call, closing the breaker."""
+        if self.state is not BreakerState.CLOSED:
+            logger.info("Circuit breaker closed", name=self.name)
+        self.state = BreakerState.CLOSED
+        self._failures = 0
+
+    def record_failure(self, error: Optional[Exception] = None):
+        """Record a failed call, opening the breaker if the limit is reached."""
+        self._failures += 1
+
+        if self.state is BreakerState.HALF_OPEN or self._failures >= self.fail_max:
+            if self.state is not BreakerState.OPEN:
+                logger.warning("Circuit breaker opened",
+                             name=self.name,
+                             failures=self._failures,
+                             reset_timeout=self.reset_timeout,
+                             error=str(error) if error else None)
+            self.state = BreakerState.OPEN
+            self._opened_at = time.monotonic()
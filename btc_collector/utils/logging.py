@@ -1,7 +1,10 @@
 """Logging configuration and utilities."""
 
 import sys
+import atexit
+import queue
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Optional
 import structlog
@@ -9,23 +12,31 @@ from structlog.stdlib import LoggerFactory
 
 from btc_collector.models.config import CollectorConfig
 
+# Background thread that renders and writes queued log records
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves rendering to the listener thread."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # structlog has already run its processors; the event dict in
+        # record.msg is rendered by the listener's ProcessorFormatter
+        return record
+
 
 def setup_logging(config: CollectorConfig) -> None:
     """Setup structured logging with the specified configuration."""
+    global _queue_listener
     
-    # Configure standard library logging
-    logging.basicConfig(
-        level=getattr(logging, config.log_level.upper()),
-        format="%(message)s",
-        stream=sys.stdout,
-    )
+    level = getattr(logging, config.log_level.upper())
     
     # Create log directory if specified
     if config.log_file:
         log_path = Path(config.log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Configure processors based on format
+    # Processors run in the calling thread; rendering happens on the listener
     processors = [
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
@@ -34,24 +45,26 @@ def setup_logging(config: CollectorConfig) -> None:
         structlog.processors.TimeStamper(fmt="ISO"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
     ]
     
     if config.log_format.lower() == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        renderer = structlog.processors.JSONRenderer()
     else:
-        processors.extend([
-            structlog.processors.add_log_level,
-            structlog.dev.ConsoleRenderer(colors=True)
-        ])
+        renderer = structlog.dev.ConsoleRenderer(colors=True)
     
-    # Configure structlog
-    structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
-        logger_factory=LoggerFactory(),
-        cache_logger_on_first_use=True,
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            renderer,
+        ],
     )
     
+    # Output handlers, driven by the listener thread
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    handlers = [stream_handler]
+    
     # Setup file logging if specified
     if config.log_file:
         file_handler = logging.handlers.RotatingFileHandler(
@@ -59,13 +72,47 @@ def setup_logging(config: CollectorConfig) -> None:
             maxBytes=config.log_max_size_mb * 1024 * 1024,
             backupCount=config.log_backup_count
         )
-        file_handler.setLevel(getattr(logging, config.log_level.upper()))
-        
-        # Add file handler to root logger
-        root_logger = logging.getLogger()
-        root_logger.addHandler(file_handler)
+        file_handler.setLevel(level)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    
+    # Replace a listener from an earlier call
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, _DeferredQueueHandler):
+            root_logger.removeHandler(handler)
+    
+    # Application threads only enqueue records
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_DeferredQueueHandler(log_queue))
+    root_logger.setLevel(level)
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(_stop_queue_listener)
+    
+    # Configure structlog
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a structured logger instance."""
-    return structlog.get_logger(name)
\ No newline at end of file
+    return structlog.get_logger(name)
@@ -0,0 +1,69 @@
+"""Token-bucket rate limiter for outbound API requests."""
+
+import time
+import asyncio
+import threading
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Monotonic-clock token bucket.
+
+    Refills `rate` tokens per second up to `capacity`, so callers may burst
+    up to `capacity` requests while the long-term rate stays at `rate`.
+    Callers only wait when the bucket is empty.
+
+    Each acquire reserves its token under a short lock and then sleeps
+    outside it, so sync threads and async tasks can share one bucket and
+    waiters are spaced 1/rate apart in arrival order.
+
+    Usage:
+        bucket = TokenBucket(rate=10, capacity=5)
+        bucket.acquire()          # blocking
+        await bucket.aacquire()   # in a coroutine
+    """
+
+    def __init__(self, rate: Optional[float], capacity: float = 1):
+        """
+        Args:
+            rate: Tokens added per second; None disables limiting
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = max(1.0, float(capacity))
+
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_interval(cls, interval: float, capacity: float = 1) -> "TokenBucket":
+        """Build a bucket from a minimum delay between requests (<= 0 disables)."""
+        return cls(1.0 / interval if interval > 0 else None, capacity)
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        if self.rate is None:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+
+            # A negative balance is a queue of reservations waiting for refill
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self):
+        """Block until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self):
+        """Wait (without blocking the event loop) until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,100 @@
+"""
+Unit tests for the AdaptiveBatchSize sync batch controller.
+
+Tests growth while throughput rises, holding at steady throughput, and
+shrinking on slow database writes or high memory.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from btc_collector.core.collector import AdaptiveBatchSize
+
+
+@pytest.fixture
+def rss():
+    """Patch the controller's RSS reading (MB); defaults to well under the limit."""
+    with patch.object(AdaptiveBatchSize, "_rss_mb", return_value=100.0) as fake:
+        yield fake
+
+
+def make_sizer(initial: int = 100) -> AdaptiveBatchSize:
+    """Controller with bounds 10..1000, a 1 GB memory limit and a 250 ms write target."""
+    return AdaptiveBatchSize(initial=initial, minimum=10, maximum=1000,
+                             max_memory_mb=1024, target_write_ms=250)
+
+
+class TestGrowth:
+    """Tests for growing the batch."""
+
+    def test_first_batch_under_target_grows(self, rss):
+        """With no history, a batch within the write target doubles."""
+        sizer = make_sizer()
+
+        assert sizer.observe(100, 100_000_000, 10.0, write_seconds=5.0) == 200
+
+    def test_rising_throughput_grows(self, rss):
+        """Throughput clearly above its EWMA doubles the batch again."""
+        sizer = make_sizer()
+        sizer.observe(100, 100_000_000, 10.0, write_seconds=5.0)
+
+        assert sizer.observe(200, 300_000_000, 10.0, write_seconds=10.0) == 400
+
+    def test_growth_capped_at_maximum(self, rss):
+        """The batch never grows past `maximum`."""
+        sizer = make_sizer(initial=800)
+
+        assert sizer.observe(800, 100_000_000, 10.0, write_seconds=5.0) == 1000
+
+
+class TestSteadyState:
+    """Tests for holding the batch size."""
+
+    def test_steady_throughput_holds(self, rss):
+        """Once throughput levels off the size stops growing."""
+        sizer = make_sizer()
+        sizer.observe(100, 100_000_000, 10.0, write_seconds=5.0)
+
+        sizes = [sizer.observe(200, 100_000_000, 10.0, write_seconds=10.0) for _ in range(5)]
+
+        assert sizes == [200] * 5
+
+    def test_empty_batch_ignored(self, rss):
+        """A batch with no blocks leaves the size and EWMAs unchanged."""
+        sizer = make_sizer()
+
+        assert sizer.observe(0, 0, 1.0, write_seconds=0.0) == 100
+        assert sizer.bytes_per_second is None
+
+
+class TestShrink:
+    """Tests for shrinking the batch."""
+
+    def test_slow_writes_shrink(self, rss):
+        """Per-block write time above the target halves the batch."""
+        sizer = make_sizer()
+        sizer.observe(100, 100_000_000, 10.0, write_seconds=5.0)
+
+        # 400 ms per block, even though throughput is rising
+        assert sizer.observe(200, 300_000_000, 10.0, write_seconds=80.0) == 100
+
+    def test_memory_over_limit_shrinks(self, rss):
+        """RSS above max_memory_mb halves the batch regardless of speed."""
+        sizer = make_sizer()
+        rss.return_value = 2048.0
+
+        assert sizer.observe(100, 100_000_000, 10.0, write_seconds=1.0) == 50
+
+    def test_unknown_memory_does_not_shrink(self, rss):
+        """Without psutil, memory never forces a shrink."""
+        sizer = make_sizer()
+        rss.return_value = None
+
+        assert sizer.observe(100, 100_000_000, 10.0, write_seconds=1.0) == 200
+
+    def test_shrink_floored_at_minimum(self, rss):
+        """The batch never shrinks below `minimum`."""
+        sizer = make_sizer(initial=15)
+
+        assert sizer.observe(15, 15_000_000, 10.0, write_seconds=15.0) == 10
@@ -0,0 +1,121 @@
+"""
+Unit tests for BlockProcessor parsing and UTXO spending.
+
+Tests that parsing a block across worker processes matches in-process
+parsing, and that outputs spent in their own block never reach the database.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from btc_collector.core.block_processor import BlockProcessor
+
+P2PKH_SCRIPT = "76a914" + "11" * 20 + "88ac"
+
+
+def make_block(height: int = 800_000, tx_count: int = 10) -> dict:
+    """Verbosity-2 style block with a coinbase and tx_count - 1 spends."""
+    txs = [{
+        "txid": f"{0:064x}",
+        "vin": [{"coinbase": "03abcdef", "sequence": 0xFFFFFFFF}],
+        "vout": [{"value_sat": 625_000_000, "scriptPubKey": {"hex": P2PKH_SCRIPT}}],
+        "size": 150,
+    }]
+    for i in range(1, tx_count):
+        txs.append({
+            "txid": f"{i:064x}",
+            "vin": [{"txid": f"{i + 1000:064x}", "vout": i % 3, "scriptSig": {"hex": ""}}],
+            "vout": [
+                {"value_sat": 10_000 * i, "scriptPubKey": {"hex": P2PKH_SCRIPT}},
+                {"value_sat": 500 + i, "scriptPubKey": {"hex": ""}},
+            ],
+            "size": 250,
+        })
+    return {"height": height, "hash": "00" * 32, "time": 1_700_000_000, "tx": txs}
+
+
+def make_processor(parse_workers: int, parse_parallel_min_txs: int) -> BlockProcessor:
+    """BlockProcessor over a mock database manager."""
+    db_manager = Mock()
+    db_manager.config = SimpleNamespace(
+        parse_workers=parse_workers,
+        parse_parallel_min_txs=parse_parallel_min_txs,
+        log_every_n_blocks=1,
+    )
+    return BlockProcessor(db_manager)
+
+
+class TestParallelParsing:
+    """Tests for BlockProcessor._parse_transactions."""
+
+    @pytest.fixture
+    def parallel(self):
+        """Processor that parses blocks of 4+ transactions in 2 processes."""
+        processor = make_processor(parse_workers=2, parse_parallel_min_txs=4)
+        yield processor
+        processor.close()
+
+    def test_parallel_matches_serial(self, parallel):
+        """Worker processes produce the same results, in block order."""
+        serial = make_processor(parse_workers=1, parse_parallel_min_txs=4)
+        block = make_block(tx_count=11)
+        block_time = datetime(2023, 11, 14, 22, 13, 20)
+
+        expected = serial._parse_transactions(block, block_time)
+        result = parallel._parse_transactions(block, block_time)
+
+        assert parallel._parse_pool is not None
+        assert result == expected
+        assert [tx.tx_index for tx in result[0]] == list(range(11))
+
+    def test_small_block_parsed_in_process(self, parallel):
+        """Blocks below parse_parallel_min_txs do not start the pool."""
+        parallel._parse_transactions(make_block(tx_count=3), datetime(2023, 11, 14))
+
+        assert parallel._parse_pool is None
+
+    def test_pool_uses_spawn(self, parallel):
+        """Workers are spawned, not forked from the threaded collector."""
+        parallel.start_parse_pool()
+
+        assert parallel._parse_pool._mp_context.get_start_method() == "spawn"
+
+    def test_single_worker_never_starts_pool(self):
+        """parse_workers <= 1 keeps parsing in-process."""
+        processor = make_processor(parse_workers=1, parse_parallel_min_txs=1)
+
+        processor.start_parse_pool()
+
+        assert processor._parse_pool is None
+
+
+class TestUtxoSpending:
+    """Tests for BlockProcessor._process_utxo_spending."""
+
+    def test_same_block_spend_resolved_in_memory(self):
+        """Outputs created in the block are spent without a DB lookup."""
+        processor = make_processor(parse_workers=1, parse_parallel_min_txs=1)
+        processor.db_manager.mark_utxos_spent_bulk.return_value = {
+            ("aa" * 32, 0): (5_000, "1Older", "p2pkh"),
+        }
+        block_time = datetime(2023, 11, 14)
+        block = make_block(tx_count=3)
+        block["tx"][2]["vin"].append({"txid": f"{1:064x}", "vout": 0})
+        block["tx"][2]["vin"].append({"txid": "aa" * 32, "vout": 0})
+        _, utxos, _, spending = processor._parse_transactions(block, block_time)
+
+        spent = processor._process_utxo_spending(spending, utxos, 800_000, block_time)
+
+        # Only the outpoints from earlier blocks go to the bulk UPDATE
+        sent = processor.db_manager.mark_utxos_spent_bulk.call_args.args[0]
+        assert (f"{1:064x}", 0) not in [(tx, vout) for tx, vout, _ in sent]
+        assert ("aa" * 32, 0, f"{2:064x}") in sent
+
+        created = next(u for u in utxos if (u.tx_hash, u.vout_index) == (f"{1:064x}", 0))
+        assert created.is_spent
+        assert created.spent_tx_hash == f"{2:064x}"
+        assert spent[(f"{1:064x}", 0)] == (10_000, created.address, created.script_type)
+        assert spent[("aa" * 32, 0)] == (5_000, "1Older", "p2pkh")
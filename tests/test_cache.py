@@ -0,0 +1,126 @@
+"""
+Unit tests for the TTLCache response cache.
+
+Tests TTL expiry, LRU eviction and the disabled (maxsize=0) cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from btc_collector.utils.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Patch the cache's monotonic clock."""
+    fake = FakeClock()
+    with patch("btc_collector.utils.cache.time.monotonic", fake):
+        yield fake
+
+
+class TestTTLExpiry:
+    """Tests for time-based expiry."""
+
+    def test_entry_served_before_ttl(self, clock):
+        """An entry is returned until its TTL elapses."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("tx", {"fee": 1})
+
+        clock.now += 59
+
+        assert cache.get("tx") == {"fee": 1}
+        assert cache.hits == 1
+
+    def test_entry_expires_after_ttl(self, clock):
+        """An expired entry is a miss and is removed."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("tx", {"fee": 1})
+
+        clock.now += 60
+
+        assert cache.get("tx", "missing") == "missing"
+        assert cache.misses == 1
+        assert len(cache) == 0
+
+    def test_set_refreshes_ttl(self, clock):
+        """Storing a key again restarts its TTL."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("tx", 1)
+        clock.now += 50
+        cache.set("tx", 2)
+
+        clock.now += 50
+
+        assert cache.get("tx") == 2
+
+    def test_none_ttl_never_expires(self, clock):
+        """With ttl=None entries stay until evicted."""
+        cache = TTLCache(maxsize=10, ttl=None)
+        cache.set("tx", 1)
+
+        clock.now += 10 ** 9
+
+        assert cache.get("tx") == 1
+
+
+class TestLRUEviction:
+    """Tests for size-bounded eviction."""
+
+    def test_evicts_oldest_when_full(self, clock):
+        """The least recently stored entry is dropped past maxsize."""
+        cache = TTLCache(maxsize=2, ttl=None)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_get_marks_entry_recently_used(self, clock):
+        """Reading an entry protects it from the next eviction."""
+        cache = TTLCache(maxsize=2, ttl=None)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_clear_drops_all_entries(self, clock):
+        """clear() empties the cache."""
+        cache = TTLCache(maxsize=5)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
+
+
+class TestDisabledCache:
+    """Tests for maxsize=0."""
+
+    def test_maxsize_zero_stores_nothing(self, clock):
+        """A cache with maxsize=0 never holds entries."""
+        cache = TTLCache(maxsize=0)
+        cache.set("a", 1)
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
+        assert cache.misses == 1
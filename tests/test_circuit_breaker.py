@@ -0,0 +1,147 @@
+"""
+Unit tests for the CircuitBreaker and the API server's DB writer.
+
+Tests state transitions and that a failing database stops receiving writes.
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from btc_collector.utils.circuit_breaker import BreakerState, CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_starts_closed(self):
+        """A new breaker lets calls through."""
+        breaker = CircuitBreaker("test", fail_max=3)
+
+        assert breaker.state is BreakerState.CLOSED
+        assert breaker.allow()
+
+    def test_opens_after_fail_max_failures(self):
+        """Consecutive failures up to fail_max open the breaker."""
+        breaker = CircuitBreaker("test", fail_max=3, reset_timeout=60)
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state is BreakerState.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        """A success between failures keeps the breaker closed."""
+        breaker = CircuitBreaker("test", fail_max=3)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert breaker.state is BreakerState.CLOSED
+
+    def test_half_open_after_reset_timeout(self):
+        """After reset_timeout one trial call is allowed."""
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=30)
+
+        with patch("btc_collector.utils.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+
+        with patch("btc_collector.utils.circuit_breaker.time.monotonic", return_value=131.0):
+            assert breaker.allow()
+        assert breaker.state is BreakerState.HALF_OPEN
+
+    def test_half_open_failure_reopens(self):
+        """A failed trial call opens the breaker again."""
+        breaker = CircuitBreaker("test", fail_max=5, reset_timeout=0)
+        breaker.state = BreakerState.HALF_OPEN
+
+        breaker.record_failure()
+
+        assert breaker.state is BreakerState.OPEN
+
+    def test_half_open_success_closes(self):
+        """A successful trial call closes the breaker."""
+        breaker = CircuitBreaker("test", fail_max=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_success()
+
+        assert breaker.state is BreakerState.CLOSED
+
+
+class TestDatabaseWriterBreaker:
+    """Tests for OnChainDataCollector's background DB writer."""
+
+    @pytest.fixture
+    def collector(self):
+        """Collector with only the DB-writer state initialized."""
+        from api_server import OnChainDataCollector
+
+        collector = object.__new__(OnChainDataCollector)
+        collector.db = Mock()
+        collector._db_queue = asyncio.Queue()
+        collector._db_writer_task = None
+        collector._db_breaker = CircuitBreaker("database", fail_max=5, reset_timeout=30)
+        return collector
+
+    def test_failed_writes_trip_breaker_and_drop_writes(self, collector):
+        """Five writes returning False open the breaker; later writes are dropped."""
+        save = Mock(return_value=False, __name__="save_metrics")
+
+        async def run():
+            collector._db_writer_task = asyncio.create_task(collector._db_writer())
+            for _ in range(5):
+                collector.enqueue_db_write(save, {})
+            await collector._db_queue.join()
+
+            collector.enqueue_db_write(save, {})
+            queued = collector._db_queue.qsize()
+
+            collector._db_writer_task.cancel()
+            return queued
+
+        queued = asyncio.run(run())
+
+        assert save.call_count == 5
+        assert collector._db_breaker.state is BreakerState.OPEN
+        assert queued == 0
+
+    def test_raised_errors_trip_breaker(self, collector):
+        """Any exception from the DB call counts as a failure, not only psycopg2's."""
+        save = Mock(side_effect=RuntimeError("QueuePool limit reached"), __name__="save_metrics")
+
+        async def run():
+            collector._db_writer_task = asyncio.create_task(collector._db_writer())
+            for _ in range(5):
+                collector.enqueue_db_write(save, {})
+            await collector._db_queue.join()
+            collector._db_writer_task.cancel()
+
+        asyncio.run(run())
+
+        assert save.call_count == 5
+        assert collector._db_breaker.state is BreakerState.OPEN
+
+    def test_successful_writes_keep_breaker_closed(self, collector):
+        """Writes returning True record successes."""
+        save = Mock(return_value=True, __name__="save_metrics")
+
+        async def run():
+            collector._db_writer_task = asyncio.create_task(collector._db_writer())
+            for _ in range(6):
+                collector.enqueue_db_write(save, {})
+            await collector._db_queue.join()
+            collector._db_writer_task.cancel()
+
+        asyncio.run(run())
+
+        assert save.call_count == 6
+        assert collector._db_breaker.state is BreakerState.CLOSED
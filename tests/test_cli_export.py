@@ -0,0 +1,84 @@
+"""
+Unit tests for the export-block CLI command.
+
+Tests that the streamed export matches the document built from a dict and
+that a zero or missing difficulty is exported as null.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import orjson
+import pytest
+from click.testing import CliRunner
+
+from btc_collector.cli.main import cli
+
+
+def make_block(**overrides) -> SimpleNamespace:
+    """Block row with the exported fields."""
+    fields = dict(
+        block_height=800_000,
+        block_hash="00" * 32,
+        block_time=datetime(2023, 7, 24, 4, 20, 11),
+        tx_count=3_721,
+        total_fees_btc=Decimal("0.12345678"),
+        block_size_bytes=1_650_000,
+        difficulty=Decimal("53911173001054.59"),
+        nonce=1_234_567_890,
+        merkle_root="ab" * 32,
+        previous_block_hash="cd" * 32,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def expected_document(block: SimpleNamespace) -> str:
+    """The export as previously built from a dict with OPT_INDENT_2."""
+    return orjson.dumps({
+        'block_height': block.block_height,
+        'block_hash': block.block_hash,
+        'block_time': block.block_time.isoformat(),
+        'tx_count': block.tx_count,
+        'total_fees_btc': float(block.total_fees_btc),
+        'block_size_bytes': block.block_size_bytes,
+        'difficulty': float(block.difficulty) if block.difficulty else None,
+        'nonce': block.nonce,
+        'merkle_root': block.merkle_root,
+        'previous_block_hash': block.previous_block_hash,
+    }, option=orjson.OPT_INDENT_2).decode()
+
+
+def run_export(block) -> str:
+    """Invoke export-block against a collector whose database returns `block`."""
+    collector = Mock()
+    collector.initialize.return_value = True
+    collector.db_manager.get_block.return_value = block
+
+    with patch("btc_collector.core.collector.BitcoinCollector", return_value=collector):
+        result = CliRunner().invoke(cli, ["export-block", "800000"], obj={"config": Mock()})
+
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+class TestExportBlock:
+    """Tests for export-block output."""
+
+    def test_output_matches_dict_document(self):
+        """Streaming member by member produces the same JSON text."""
+        block = make_block()
+
+        assert run_export(block) == expected_document(block)
+
+    @pytest.mark.parametrize("difficulty", [Decimal("0"), 0, None])
+    def test_falsy_difficulty_exported_as_null(self, difficulty):
+        """A zero or missing difficulty is null, not 0.0."""
+        block = make_block(difficulty=difficulty)
+
+        output = run_export(block)
+
+        assert orjson.loads(output)["difficulty"] is None
+        assert output == expected_document(block)
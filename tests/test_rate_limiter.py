@@ -0,0 +1,133 @@
+"""
+Unit tests for the TokenBucket rate limiter.
+
+Tests bursting, refill over time and construction from an interval.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from btc_collector.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """Manually advanced replacement for time.monotonic."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Patch the rate limiter's monotonic clock."""
+    fake = FakeClock()
+    with patch("btc_collector.utils.rate_limiter.time.monotonic", fake):
+        yield fake
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_up_to_capacity(self, clock):
+        """A full bucket serves `capacity` requests without waiting."""
+        bucket = TokenBucket(rate=2, capacity=5)
+
+        waits = [bucket._reserve() for _ in range(5)]
+
+        assert waits == [0.0] * 5
+
+    def test_waits_once_empty(self, clock):
+        """Requests beyond the burst are spaced 1/rate apart."""
+        bucket = TokenBucket(rate=2, capacity=2)
+        bucket._reserve()
+        bucket._reserve()
+
+        assert bucket._reserve() == pytest.approx(0.5)
+        assert bucket._reserve() == pytest.approx(1.0)
+
+    def test_refills_over_time(self, clock):
+        """Elapsed time adds `rate` tokens per second."""
+        bucket = TokenBucket(rate=4, capacity=4)
+        for _ in range(4):
+            bucket._reserve()
+
+        clock.now += 0.5
+
+        assert bucket._reserve() == 0.0
+        assert bucket._reserve() == 0.0
+        assert bucket._reserve() > 0
+
+    def test_refill_capped_at_capacity(self, clock):
+        """An idle bucket never holds more than `capacity` tokens."""
+        bucket = TokenBucket(rate=10, capacity=3)
+
+        clock.now += 60
+
+        waits = [bucket._reserve() for _ in range(4)]
+        assert waits[:3] == [0.0] * 3
+        assert waits[3] == pytest.approx(0.1)
+
+    def test_capacity_at_least_one(self, clock):
+        """A capacity below 1 still allows a single request."""
+        bucket = TokenBucket(rate=1, capacity=0)
+
+        assert bucket.capacity == 1.0
+        assert bucket._reserve() == 0.0
+
+    def test_none_rate_disables_limiting(self, clock):
+        """A rate of None never waits."""
+        bucket = TokenBucket(rate=None)
+
+        assert all(bucket._reserve() == 0.0 for _ in range(100))
+
+    def test_acquire_sleeps_for_wait(self, clock):
+        """acquire() sleeps only when the bucket is empty."""
+        bucket = TokenBucket(rate=2, capacity=1)
+
+        with patch("btc_collector.utils.rate_limiter.time.sleep") as sleep:
+            bucket.acquire()
+            sleep.assert_not_called()
+
+            bucket.acquire()
+            sleep.assert_called_once_with(pytest.approx(0.5))
+
+    def test_aacquire_sleeps_for_wait(self, clock):
+        """aacquire() waits on the event loop when the bucket is empty."""
+        bucket = TokenBucket(rate=2, capacity=1)
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        async def run():
+            await bucket.aacquire()
+            await bucket.aacquire()
+
+        with patch("btc_collector.utils.rate_limiter.asyncio.sleep", fake_sleep):
+            asyncio.run(run())
+
+        assert sleeps == [pytest.approx(0.5)]
+
+
+class TestFromInterval:
+    """Tests for TokenBucket.from_interval."""
+
+    def test_interval_sets_rate(self):
+        """A minimum interval becomes its reciprocal rate."""
+        bucket = TokenBucket.from_interval(0.25, capacity=3)
+
+        assert bucket.rate == pytest.approx(4.0)
+        assert bucket.capacity == 3.0
+
+    @pytest.mark.parametrize("interval", [0, -1])
+    def test_non_positive_interval_disables(self, interval):
+        """An interval <= 0 builds an unlimited bucket."""
+        bucket = TokenBucket.from_interval(interval)
+
+        assert bucket.rate is None
+        assert bucket._reserve() == 0.0